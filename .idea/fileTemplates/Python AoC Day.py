@@ -1,8 +1,5 @@
-import io
 import pathlib
-
-import pytest
-
+import sys
 
 example_input_string = """
 """
@@ -11,33 +8,36 @@ example_first_star_output = None
 example_second_star_output = None
 
 
-def first_star(input_file):
-    return input_file
+def parse(input_file):
+    return input_file.read()
 
 
-def second_star(input_file):
-    return input_file
+def solve_first_star(parsed):
+    return parsed
 
 
-def main():
-    input_path = pathlib.Path("input", pathlib.Path(__file__).name).with_suffix(".txt")
+def solve_second_star(parsed):
+    return parsed
 
-    print(f"First star answer: {first_star(input_path.open())}")
-    print(f"Second star answer: {second_star(input_path.open())}")
 
+def solve(input_file):
+    parsed = parse(input_file)
+    return solve_first_star(parsed), solve_second_star(parsed)
 
-@pytest.fixture
-def test_input():
-    return io.StringIO(example_input_string)
 
+def first_star(input_file):
+    return solve_first_star(parse(input_file))
+
+
+def second_star(input_file):
+    return solve_second_star(parse(input_file))
 
-def test_first_star(test_input):
-    assert example_first_star_output == first_star(test_input)
 
+def main(argv=()):
+    from advent_of_code import runner
 
-def test_second_star(test_input):
-    assert example_second_star_output == second_star(test_input)
+    return runner.main([pathlib.Path(__file__).stem, *argv])
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,159 @@
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+
+from advent_of_code.puzzle_input import open_input
+from advent_of_code.runner import (
+    REFERENCE_ENGINE,
+    get_engine,
+    get_parser,
+    import_day,
+    solve_stars,
+)
+
+# Set once per worker by the pool initializer, so each worker imports the
+# day module a single time however many inputs it goes on to solve
+worker_module = None
+worker_engine = REFERENCE_ENGINE
+worker_star_kwargs = ({}, {})
+
+
+@dataclass
+class InputResult:
+    path: str
+    answers: tuple = ()
+    seconds: float = 0.0
+    error: str = None
+
+
+def find_inputs(patterns):
+    # Each pattern is an input file, a directory of inputs or a glob
+    paths = []
+    for pattern in map(str, patterns):
+        if os.path.isdir(pattern):
+            paths.extend(
+                sorted(entry.path for entry in os.scandir(pattern) if entry.is_file())
+            )
+        elif glob.has_magic(pattern):
+            paths.extend(sorted(glob.glob(pattern)))
+        else:
+            paths.append(pattern)
+    return paths
+
+
+def initialize_worker(day, engine=REFERENCE_ENGINE, star_kwargs=({}, {})):
+    global worker_module, worker_engine, worker_star_kwargs
+    worker_module = import_day(day)
+    worker_engine = engine
+    worker_star_kwargs = star_kwargs
+
+
+def solve_input(path):
+    start = time.perf_counter()
+    try:
+        parse = get_parser(worker_module, worker_engine)
+        parsed = parse(open_input(path))
+        answers, _ = solve_stars(
+            worker_module, parsed, engine=worker_engine, star_kwargs=worker_star_kwargs
+        )
+        if decode_answers := getattr(worker_module, "decode_answers", None):
+            answers = decode_answers(*answers)
+    except Exception as error:
+        return InputResult(path, seconds=time.perf_counter() - start, error=repr(error))
+    return InputResult(path, answers, time.perf_counter() - start)
+
+
+def solve_input_chunk(paths):
+    return [solve_input(path) for path in paths]
+
+
+def solve_inputs(
+    day,
+    paths,
+    jobs=None,
+    chunk_size=1,
+    engine=REFERENCE_ENGINE,
+    star_kwargs=({}, {}),
+):
+    # Yields results as they complete, which isn't the order of paths
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        initialize_worker(day, engine, star_kwargs)
+        yield from map(solve_input, paths)
+        return
+
+    # Not a multiprocessing.Pool: its workers are daemonic, so a day that
+    # starts processes of its own (day_15) couldn't run in them
+    import concurrent.futures
+
+    chunks = [
+        paths[start : start + chunk_size] for start in range(0, len(paths), chunk_size)
+    ]
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=initialize_worker,
+        initargs=(day, engine, star_kwargs),
+    ) as executor:
+        futures = [executor.submit(solve_input_chunk, chunk) for chunk in chunks]
+        for future in concurrent.futures.as_completed(futures):
+            yield from future.result()
+
+
+def format_result(result):
+    if result.error is not None:
+        outcome = f"failed: {result.error}"
+    else:
+        outcome = ", ".join(map(str, result.answers))
+    return f"{result.path} ({result.seconds:.3f}s): {outcome}"
+
+
+def format_throughput(count, failed, seconds):
+    rate = count / seconds if seconds else float("inf")
+    return f"{count} inputs in {seconds:.3f}s ({rate:.1f} inputs/s), {failed} failed"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Solve many inputs for one day across a process pool."
+    )
+    parser.add_argument("day", help="day to run, e.g. day_01")
+    parser.add_argument(
+        "inputs", nargs="+", help="input files, directories of inputs or globs"
+    )
+    parser.add_argument("--jobs", type=int, default=None)
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1,
+        help="inputs handed to a worker at a time; raise it for tiny inputs",
+    )
+    parser.add_argument("--engine", default=REFERENCE_ENGINE)
+    parser.add_argument("--format", choices=("text", "ndjson"), default="text")
+    args = parser.parse_args(argv)
+    try:
+        get_engine(import_day(args.day), args.engine)
+    except (ImportError, ValueError) as error:
+        parser.error(str(error))
+
+    paths = find_inputs(args.inputs)
+    start = time.perf_counter()
+    failed = 0
+    results = solve_inputs(args.day, paths, args.jobs, args.chunk_size, args.engine)
+    for result in results:
+        failed += result.error is not None
+        if args.format == "ndjson":
+            print(json.dumps(asdict(result), default=str), flush=True)
+        else:
+            print(format_result(result), flush=True)
+
+    summary = format_throughput(len(paths), failed, time.perf_counter() - start)
+    print(summary, file=sys.stderr if args.format == "ndjson" else sys.stdout)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
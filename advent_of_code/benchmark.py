@@ -0,0 +1,238 @@
+import argparse
+import gc
+import io
+import json
+import pathlib
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+
+from advent_of_code.micro_benchmarks import DEFAULT_SIZE, SUITES
+from advent_of_code.runner import discover_days, get_input_path, import_day
+
+PHASES = ("parse", "first_star", "second_star")
+INPUT_KINDS = ("input", "example")
+BASELINE_PATH = pathlib.Path("benchmark_baseline.json")
+
+
+@dataclass
+class Timing:
+    name: str
+    samples: list[float]
+
+    @property
+    def min(self):
+        return min(self.samples)
+
+    @property
+    def median(self):
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self):
+        if len(self.samples) < 2:
+            return self.samples[0]
+        return statistics.quantiles(self.samples, n=20, method="inclusive")[18]
+
+    def summary(self):
+        return {
+            "min": self.min,
+            "median": self.median,
+            "p95": self.p95,
+            "repeat": len(self.samples),
+        }
+
+
+@dataclass
+class Regression:
+    name: str
+    baseline_median: float
+    median: float
+
+    @property
+    def ratio(self):
+        return self.median / self.baseline_median
+
+
+def get_example_input_strings(module):
+    if (example := getattr(module, "example_input_string", None)) is not None:
+        return example, example
+    if hasattr(module, "example_first_star_input_string"):
+        return (
+            module.example_first_star_input_string,
+            module.example_second_star_input_string,
+        )
+    if examples := getattr(module, "examples", None):
+        return examples[0][0], examples[0][0]
+    return None
+
+
+def get_benchmark_cases(day, input_kinds=INPUT_KINDS, input_directory="input"):
+    module = import_day(day)
+
+    inputs = []
+    if "input" in input_kinds:
+        input_path = get_input_path(day, input_directory)
+        if input_path.exists():
+            inputs.append(("input", (input_path.open, input_path.open), ({}, {})))
+    if "example" in input_kinds:
+        if examples := get_example_input_strings(module):
+            openers = tuple(
+                (lambda example=example: io.StringIO(example)) for example in examples
+            )
+            star_kwargs = getattr(module, "example_star_kwargs", ({}, {}))
+            inputs.append(("example", openers, star_kwargs))
+
+    for input_kind, (first_opener, second_opener), star_kwargs in inputs:
+        first_parsed = module.parse(first_opener())
+        second_parsed = module.parse(second_opener())
+        yield f"{day}.parse.{input_kind}", lambda: module.parse(first_opener())
+        yield f"{day}.first_star.{input_kind}", lambda: module.solve_first_star(
+            first_parsed, **star_kwargs[0]
+        )
+        yield f"{day}.second_star.{input_kind}", lambda: module.solve_second_star(
+            second_parsed, **star_kwargs[1]
+        )
+
+
+def time_case(name, function, warmup=1, repeat=5):
+    for _ in range(warmup):
+        function()
+
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return Timing(name, samples)
+
+
+def run_benchmarks(
+    days, phases=PHASES, input_kinds=INPUT_KINDS, warmup=1, repeat=5, **kwargs
+):
+    for day in days:
+        for name, function in get_benchmark_cases(day, input_kinds, **kwargs):
+            if name.split(".")[1] in phases:
+                yield time_case(name, function, warmup, repeat)
+
+
+def run_micro_benchmarks(suites, size=DEFAULT_SIZE, warmup=1, repeat=5):
+    for suite in suites:
+        for name, function in SUITES[suite](size):
+            yield time_case(name, function, warmup, repeat)
+
+
+def find_regressions(timings, baseline, tolerance=0.2, min_delta=0.001):
+    regressions = []
+    for timing in timings:
+        if (baseline_timing := baseline.get(timing.name)) is None:
+            continue
+        baseline_median = baseline_timing["median"]
+        if (
+            timing.median > baseline_median * (1 + tolerance)
+            and timing.median - baseline_median > min_delta
+        ):
+            regressions.append(Regression(timing.name, baseline_median, timing.median))
+    return regressions
+
+
+def load_baseline(path):
+    if not pathlib.Path(path).exists():
+        return {}
+    with open(path) as baseline_file:
+        return json.load(baseline_file)
+
+
+def save_baseline(path, timings):
+    # Merged into what's there, so saving some days, or the micro suite,
+    # keeps every other case's baseline
+    baseline = load_baseline(path)
+    baseline.update((timing.name, timing.summary()) for timing in timings)
+    with open(path, "w") as baseline_file:
+        json.dump(baseline, baseline_file, indent=2)
+
+
+def format_timing(timing, baseline=None):
+    line = (
+        f"{timing.name:<32} min {timing.min * 1000:10.3f}ms"
+        f"  median {timing.median * 1000:10.3f}ms"
+        f"  p95 {timing.p95 * 1000:10.3f}ms"
+    )
+    if baseline and timing.name in baseline:
+        change = timing.median / baseline[timing.name]["median"] - 1
+        line += f"  ({change:+.1%} vs baseline)"
+    return line
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Time each day's parse and stars with warmup and repeated runs."
+    )
+    parser.add_argument("days", nargs="*", help="days to benchmark (default: all)")
+    parser.add_argument("--phases", nargs="+", choices=PHASES, default=PHASES)
+    parser.add_argument("--inputs", nargs="+", choices=INPUT_KINDS, default=INPUT_KINDS)
+    parser.add_argument("--input-directory", default="input")
+    parser.add_argument(
+        "--micro",
+        nargs="+",
+        choices=SUITES,
+        help="run these library micro-benchmark suites instead of the days",
+    )
+    parser.add_argument(
+        "--micro-size",
+        type=int,
+        default=DEFAULT_SIZE,
+        help="number of elements each micro-benchmark works on",
+    )
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", type=pathlib.Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--save", action="store_true", help="write the results as the new baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="allowed median slowdown before failing, as a fraction",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline)
+    if args.micro:
+        cases = run_micro_benchmarks(
+            args.micro, args.micro_size, args.warmup, args.repeat
+        )
+    else:
+        cases = run_benchmarks(
+            args.days or discover_days(),
+            args.phases,
+            args.inputs,
+            args.warmup,
+            args.repeat,
+            input_directory=args.input_directory,
+        )
+    timings = []
+    for timing in cases:
+        print(format_timing(timing, baseline), flush=True)
+        timings.append(timing)
+
+    if args.save:
+        save_baseline(args.baseline, timings)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    regressions = find_regressions(timings, baseline, args.tolerance)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.name}: median {regression.median * 1000:.3f}ms"
+            f" is {regression.ratio:.2f}x the baseline"
+            f" {regression.baseline_median * 1000:.3f}ms"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+import gc
+import json
+import pathlib
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+
+from advent_of_code.runner import get_input_path, import_day
+
+STARS = ("first_star", "second_star")
+BASELINE_PATH = pathlib.Path("perf_budget.json")
+TOLERANCE = 1.0
+# Below these differences a change is noise, however large the ratio
+MIN_SECONDS_DELTA = 0.005
+MIN_PEAK_BYTES_DELTA = 256 * 1024
+
+
+@dataclass
+class StarMeasurement:
+    name: str
+    seconds: float
+    peak_bytes: int
+
+
+@dataclass
+class BudgetResult:
+    measurement: StarMeasurement
+    budget: dict = None
+    violations: tuple = ()
+
+    @property
+    def status(self):
+        if self.budget is None:
+            return "unbudgeted"
+        return "regressed" if self.violations else "ok"
+
+    def to_record(self):
+        return {
+            **asdict(self.measurement),
+            "budget": self.budget,
+            "status": self.status,
+            "violations": list(self.violations),
+        }
+
+
+def time_star(star, parsed, repeat=3, max_seconds=1.0):
+    # Slow stars stop after the first run that takes them past max_seconds,
+    # so the budget of day_15's second star doesn't cost minutes.
+    samples = []
+    while not samples or (len(samples) < repeat and sum(samples) < max_seconds):
+        gc.collect()
+        start = time.perf_counter()
+        star(parsed)
+        samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+def measure_peak_bytes(star, parsed):
+    # Traced separately from the timed runs, which tracing would slow down
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        star(parsed)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return peak_bytes - start_bytes
+
+
+def measure_star(day, star_name, input_directory="input", repeat=3):
+    module = import_day(day)
+    with get_input_path(day, input_directory).open() as input_file:
+        parsed = module.parse(input_file)
+    star = getattr(module, f"solve_{star_name}")
+    return StarMeasurement(
+        f"{day}.{star_name}",
+        time_star(star, parsed, repeat),
+        measure_peak_bytes(star, parsed),
+    )
+
+
+def check_budget(measurement, baseline, tolerance=TOLERANCE):
+    if (budget := baseline.get(measurement.name)) is None:
+        return BudgetResult(measurement)
+
+    violations = []
+    for field, unit, min_delta in (
+        ("seconds", "s", MIN_SECONDS_DELTA),
+        ("peak_bytes", " bytes", MIN_PEAK_BYTES_DELTA),
+    ):
+        value, allowed = getattr(measurement, field), budget[field]
+        if value > allowed * (1 + tolerance) and value - allowed > min_delta:
+            violations.append(
+                f"{field} {value:.6g}{unit} is over the budget of"
+                f" {allowed:.6g}{unit} + {tolerance:.0%}"
+            )
+    return BudgetResult(measurement, budget, tuple(violations))
+
+
+def load_baseline(path):
+    path = pathlib.Path(path)
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def save_baseline(path, measurements):
+    # Merged into what's there, so re-baselining a few stars keeps the rest
+    baseline = load_baseline(path)
+    for measurement in measurements:
+        baseline[measurement.name] = {
+            "seconds": measurement.seconds,
+            "peak_bytes": measurement.peak_bytes,
+        }
+    pathlib.Path(path).write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def write_report(path, results, tolerance=TOLERANCE):
+    report = {
+        "tolerance": tolerance,
+        "regressed": sum(result.status == "regressed" for result in results),
+        "stars": [result.to_record() for result in results],
+    }
+    pathlib.Path(path).write_text(json.dumps(report, indent=2) + "\n")
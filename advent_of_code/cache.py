@@ -0,0 +1,165 @@
+import ast
+import hashlib
+import inspect
+import os
+import pathlib
+import pickle
+import sys
+import tempfile
+
+CACHE_DIRECTORY = pathlib.Path(".aoc_cache")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+PARSED_MAX_BYTES = 512 * 1024 * 1024
+MISSING = object()
+
+
+def file_digest(path):
+    with open(path, "rb") as input_file:
+        return hashlib.file_digest(input_file, "sha256").hexdigest()
+
+
+def get_local_dependencies(module, found=None):
+    # Functions and classes imported from this package, followed through the
+    # modules that define them. Whole-module imports (like the runner used
+    # by main()) aren't solver code and are left out.
+    package = __name__.partition(".")[0]
+    found = set() if found is None else found
+    for value in vars(module).values():
+        name = None if inspect.ismodule(value) else getattr(value, "__module__", None)
+        if (
+            isinstance(name, str)
+            and name.partition(".")[0] == package
+            and name != module.__name__
+            and name not in found
+            and name in sys.modules
+        ):
+            found.add(name)
+            get_local_dependencies(sys.modules[name], found)
+    return sorted(found)
+
+
+def solver_digest(module):
+    digest = hashlib.sha256()
+    for name in [module.__name__, *get_local_dependencies(module)]:
+        source_path = pathlib.Path(inspect.getfile(sys.modules[name]))
+        digest.update(source_path.read_bytes())
+    return digest.hexdigest()
+
+
+def get_top_level_definitions(tree):
+    definitions = {}
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            definitions[node.name] = node
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                for name in ast.walk(target):
+                    if isinstance(name, ast.Name):
+                        definitions[name.id] = node
+    return definitions
+
+
+def get_referenced_names(node):
+    return {name.id for name in ast.walk(node) if isinstance(name, ast.Name)}
+
+
+def parser_digest(module, entry_point="parse"):
+    # Only the code reachable from parse() shapes the parsed structure, so
+    # editing star logic elsewhere in the module keeps cached parses valid.
+    source = pathlib.Path(inspect.getfile(module)).read_text()
+    definitions = get_top_level_definitions(ast.parse(source))
+
+    reachable, pending, imported = set(), [entry_point], set()
+    while pending:
+        name = pending.pop()
+        if name in reachable:
+            continue
+        if name in definitions:
+            reachable.add(name)
+            pending.extend(get_referenced_names(definitions[name]))
+        elif not inspect.ismodule(value := vars(module).get(name)):
+            imported.add(getattr(value, "__module__", None))
+
+    digest = hashlib.sha256()
+    for name in sorted(reachable):
+        digest.update(ast.get_source_segment(source, definitions[name]).encode())
+
+    package = __name__.partition(".")[0]
+    dependencies = set()
+    for name in imported:
+        if isinstance(name, str) and name.partition(".")[0] == package:
+            dependencies.add(name)
+            get_local_dependencies(sys.modules[name], dependencies)
+    for name in sorted(dependencies):
+        digest.update(pathlib.Path(inspect.getfile(sys.modules[name])).read_bytes())
+    return digest.hexdigest()
+
+
+class DiskCache:
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = pathlib.Path(directory)
+        self.max_bytes = max_bytes
+
+    def get_path(self, key):
+        return self.directory / f"{key}.pickle"
+
+    def get(self, key, default=MISSING):
+        path = self.get_path(key)
+        try:
+            with path.open("rb") as cache_file:
+                value = pickle.load(cache_file)
+            os.utime(path)  # mark as recently used
+        except FileNotFoundError:
+            return default
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            path.unlink(missing_ok=True)
+            return default
+        return value
+
+    def put(self, key, value):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a
+        # partially written entry
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=self.directory, suffix=".tmp", delete=False
+        ) as cache_file:
+            try:
+                pickle.dump(value, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                cache_file.close()
+                os.unlink(cache_file.name)
+                raise
+        os.replace(cache_file.name, self.get_path(key))
+        self.evict()
+
+    def entries(self):
+        entries = []
+        for path in self.directory.glob("*.pickle"):
+            try:
+                entries.append((path.stat(), path))
+            except FileNotFoundError:  # evicted by another process
+                pass
+        return entries
+
+    def evict(self):
+        entries = sorted(self.entries(), key=lambda entry: entry[0].st_mtime_ns)
+        total_bytes = sum(stat.st_size for stat, _ in entries)
+        for stat, path in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_bytes -= stat.st_size
+
+
+def get_cache_key(day, input_digest, solver_digest):
+    return f"{day}-{input_digest[:32]}-{solver_digest[:32]}"
+
+
+def evict_stale_entries(cache, day, solver_digest):
+    # Entries written by an older version of a day's solver can never be hit
+    # again, so there's no point waiting for them to age out.
+    for _, path in cache.entries():
+        entry_day, _, entry_solver_digest = path.stem.split("-")
+        if entry_day == day and entry_solver_digest != solver_digest[:32]:
+            path.unlink(missing_ok=True)
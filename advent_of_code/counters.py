@@ -0,0 +1,37 @@
+from collections import Counter
+
+# Off by default. Solvers check enabled once, into a local, and only count
+# when it was set, so disabled counters cost their hot loops nothing.
+enabled = False
+# Counts per phase (parse, first_star...), with current the phase's Counter
+phases = {}
+current = Counter()
+
+
+def enable():
+    global enabled
+    enabled = True
+    phases.clear()
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+def begin(phase):
+    global current
+    current = phases[phase] = Counter()
+
+
+def add(name, amount=1):
+    current[name] += amount
+
+
+def merge(counts):
+    # For counts made in worker processes, which have their own current
+    current.update(counts)
+
+
+def format_counts(counts):
+    return ", ".join(f"{name} {count}" for name, count in sorted(counts.items()))
@@ -0,0 +1,195 @@
+import argparse
+import json
+import os
+import pathlib
+import socket
+import sys
+import time
+from collections import OrderedDict
+
+# The client side only needs the standard library, so a query doesn't pay
+# for importing the runner or any day module. Hence the copies of the
+# cache directory and star names.
+SOCKET_PATH = pathlib.Path(".aoc_cache", "daemon.sock")
+MAX_PARSED = 32
+STAR_NAMES = ("first_star", "second_star")
+
+
+class SolverDaemon:
+    # Keeps day modules imported and the most recently used parsed inputs in
+    # memory. Inputs are known by path and stat signature, so an edited input
+    # is parsed again without hashing it on every query.
+    def __init__(self, max_parsed=MAX_PARSED):
+        self.max_parsed = max_parsed
+        self.parsed = OrderedDict()
+
+    def get_parsed(self, module, day, input_path, engine="reference"):
+        from advent_of_code.puzzle_input import open_input
+        from advent_of_code.runner import get_engine_day, get_parser
+
+        stat = os.stat(input_path)
+        key = (
+            get_engine_day(day, engine),
+            os.path.realpath(input_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+        if key in self.parsed:
+            self.parsed.move_to_end(key)
+            return self.parsed[key], True
+
+        parsed = get_parser(module, engine)(open_input(input_path))
+        self.parsed[key] = parsed
+        while len(self.parsed) > self.max_parsed:
+            self.parsed.popitem(last=False)
+        return parsed, False
+
+    def solve(self, request):
+        from advent_of_code.runner import get_engine, get_input_path, import_day
+
+        day = request["day"]
+        stars = request.get("stars") or STAR_NAMES
+        if unknown := set(stars) - set(STAR_NAMES):
+            raise ValueError(f"unknown stars {sorted(unknown)}")
+        module = import_day(day)
+        engine_name = request.get("engine", "reference")
+        engine = get_engine(module, engine_name)
+        input_path = request.get("input") or get_input_path(day)
+
+        # Decoding takes both answers, so a day that decodes solves both
+        decode_answers = getattr(module, "decode_answers", None)
+        solved = STAR_NAMES if decode_answers else stars
+
+        parsed, parsed_cached = self.get_parsed(module, day, input_path, engine_name)
+        start = time.perf_counter()
+        answers = [
+            engine[index](parsed) if star in solved else None
+            for index, star in enumerate(STAR_NAMES)
+        ]
+        seconds = time.perf_counter() - start
+        if decode_answers:
+            answers = decode_answers(*answers)
+        return {
+            "answers": {
+                star: answer
+                for star, answer in zip(STAR_NAMES, answers)
+                if star in stars
+            },
+            "seconds": seconds,
+            "parsed_cached": parsed_cached,
+        }
+
+    def handle(self, request):
+        try:
+            return self.solve(request)
+        except Exception as error:
+            return {"error": repr(error)}
+
+
+def create_server(socket_path=SOCKET_PATH, max_parsed=MAX_PARSED):
+    import socketserver
+    import threading
+
+    daemon = SolverDaemon(max_parsed)
+
+    class RequestHandler(socketserver.StreamRequestHandler):
+        # One JSON request per line, answered with one JSON line, for as
+        # long as the client keeps the connection open
+        def handle(self):
+            for line in self.rfile:
+                request = json.loads(line)
+                if request.get("command") == "stop":
+                    response = {"stopped": True}
+                    threading.Thread(target=self.server.shutdown).start()
+                else:
+                    response = daemon.handle(request)
+                self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+                self.wfile.flush()
+
+    socket_path = pathlib.Path(socket_path)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    socket_path.unlink(missing_ok=True)  # left behind by a daemon that died
+    server = socketserver.UnixStreamServer(str(socket_path), RequestHandler)
+    os.chmod(socket_path, 0o600)
+    server.solver = daemon
+    return server
+
+
+def serve(socket_path=SOCKET_PATH, max_parsed=MAX_PARSED):
+    with create_server(socket_path, max_parsed) as server:
+        print(f"Serving on {socket_path}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            pathlib.Path(socket_path).unlink(missing_ok=True)
+    return 0
+
+
+def send_request(request, socket_path=SOCKET_PATH):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+        client.sendall(json.dumps(request).encode() + b"\n")
+        with client.makefile("rb") as response:
+            return json.loads(response.readline())
+
+
+def query(day, stars=(), input_path=None, engine="reference", socket_path=SOCKET_PATH):
+    request = {"day": day, "stars": list(stars), "engine": engine}
+    if input_path is not None:
+        # Resolved here, since the daemon may run from another directory
+        request["input"] = os.path.abspath(input_path)
+    return send_request(request, socket_path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Keep days imported and inputs parsed in a local daemon, and"
+        " query it for answers."
+    )
+    parser.add_argument("--socket", type=pathlib.Path, default=SOCKET_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="run the daemon")
+    serve_parser.add_argument(
+        "--max-parsed",
+        type=int,
+        default=MAX_PARSED,
+        help="parsed inputs kept in memory, least recently used first out",
+    )
+    query_parser = commands.add_parser("query", help="ask the daemon for answers")
+    query_parser.add_argument("day", help="day to solve, e.g. day_01")
+    query_parser.add_argument(
+        "stars", nargs="*", help="first_star and/or second_star (default: both)"
+    )
+    query_parser.add_argument("--input", dest="input_path", metavar="PATH")
+    query_parser.add_argument("--engine", default="reference")
+    query_parser.add_argument("--json", action="store_true", help="print the response")
+    commands.add_parser("stop", help="stop the daemon")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        return serve(args.socket, args.max_parsed)
+    try:
+        if args.command == "stop":
+            send_request({"command": "stop"}, args.socket)
+            return 0
+        response = query(
+            args.day, args.stars, args.input_path, args.engine, args.socket
+        )
+    except (ConnectionRefusedError, FileNotFoundError):
+        print(f"No daemon is listening on {args.socket}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(response))
+    elif "error" in response:
+        print(f"Failed: {response['error']}", file=sys.stderr)
+    else:
+        for star, answer in response["answers"].items():
+            print(f"{star.replace('_', ' ').capitalize()} answer: {answer}")
+    return 1 if "error" in response else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+import array
+import heapq
+import importlib.util
+import io
+import itertools
+import mmap
+import os
+import pathlib
+import re
+import sys
+
+from advent_of_code.puzzle_input import (
+    get_mappable_fileno,
+    input_buffer,
+    stripped_input_byte_lines,
+)
+
+example_input_string = """
+1000
+2000
+3000
+
+4000
+
+5000
+6000
+
+7000
+8000
+9000
+
+10000
+"""
+
+example_first_star_output = 24000
+example_second_star_output = 45000
+
+CHUNK_SIZE = 32 * 1024 * 1024
+# A line holding nothing but whitespace, which strips down to a blank one
+BLANK_LINE = re.compile(rb"\n[ \t\r\f\v]*\n")
+WHITESPACE = b" \t\n\r\f\v"
+MAX_DIGITS = 18  # the most an int64 always holds
+VECTOR_CHUNK_SIZE = 256 * 1024
+
+
+def parse(input_file):
+    return tuple(stream_of_calorie_totals(input_file))
+
+
+def solve_first_star(calorie_totals):
+    return top_calorie_counts(calorie_totals, 1)
+
+
+def solve_second_star(calorie_totals):
+    return top_calorie_counts(calorie_totals, 3)
+
+
+def solve(input_file):
+    calorie_totals = parse(input_file)
+    return solve_first_star(calorie_totals), solve_second_star(calorie_totals)
+
+
+def first_star(input_file):
+    return solve_first_star(parse(input_file))
+
+
+def second_star(input_file):
+    return solve_second_star(parse(input_file))
+
+
+def main(argv=()):
+    from advent_of_code import runner
+
+    return runner.main([pathlib.Path(__file__).stem, *argv])
+
+
+def stream_of_calorie_totals(input_file):
+    current_elf_calories = 0
+    for line in stripped_input_byte_lines(input_file):
+        if line:
+            line_calories = int(line)
+            current_elf_calories += line_calories
+        else:
+            yield current_elf_calories
+            current_elf_calories = 0
+    else:
+        yield current_elf_calories
+
+
+def top_calorie_totals(calorie_totals, count):
+    # The count largest totals, largest first, as (total, elf index) pairs,
+    # ties going to the earlier elf. One pass over any iterable, the stream
+    # included, keeping the best so far in a min-heap: most elves only get
+    # compared with its root, the rest cost O(log count).
+    elves = enumerate(calorie_totals)
+    heap = [(calories, -index) for index, calories in itertools.islice(elves, count)]
+    heapq.heapify(heap)
+    if heap:
+        lowest = heap[0][0]
+        for index, calories in elves:
+            if calories > lowest:
+                heapq.heapreplace(heap, (calories, -index))
+                lowest = heap[0][0]
+    return [(calories, -index) for calories, index in sorted(heap, reverse=True)]
+
+
+def top_calorie_counts(calorie_totals, count):
+    return sum(calories for calories, _ in top_calorie_totals(calorie_totals, count))
+
+
+def find_chunk_ranges(path, chunk_size=CHUNK_SIZE):
+    # Byte ranges of about chunk_size, each but the last ending just after a
+    # blank line, so no elf straddles two chunks
+    size = os.path.getsize(path)
+    if size == 0:
+        return [(0, 0)]
+
+    ranges = []
+    with open(path, "rb") as input_file, mmap.mmap(
+        input_file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as buffer:
+        start = 0
+        while start < size:
+            # From a byte early, to catch a blank line right at the target
+            match = BLANK_LINE.search(buffer, max(start + chunk_size - 1, start))
+            stop = match.end() if match else size
+            ranges.append((start, stop))
+            start = stop
+    return ranges
+
+
+def rank_calorie_chunk(path, start, stop, count):
+    # The chunk's number of elves and its own top count, indexed from its
+    # first elf
+    with open(path, "rb") as input_file:
+        input_file.seek(start)
+        chunk = io.BytesIO(input_file.read(stop - start))
+    calorie_totals = array.array("q", stream_of_calorie_totals(chunk))
+    if stop != os.path.getsize(path):
+        # A chunk ending in a blank line isn't the end of the input, so the
+        # empty elf the stream yields after it isn't there
+        calorie_totals.pop()
+    return len(calorie_totals), top_calorie_totals(calorie_totals, count)
+
+
+def top_calorie_totals_in_parallel(path, count, jobs=None, chunk_size=CHUNK_SIZE):
+    # top_calorie_totals for a plain file, with the chunks ranked across a
+    # process pool and their rankings merged in input order
+    import multiprocessing
+
+    ranges = find_chunk_ranges(path, chunk_size)
+    jobs = min(jobs or os.cpu_count() or 1, len(ranges))
+    tasks = [(path, start, stop, count) for start, stop in ranges]
+    if jobs == 1:
+        rankings = itertools.starmap(rank_calorie_chunk, tasks)
+    else:
+        with multiprocessing.Pool(jobs) as pool:
+            rankings = pool.starmap(rank_calorie_chunk, tasks)
+
+    candidates = []
+    first_elf = 0
+    for elves, ranked in rankings:
+        candidates.extend((calories, first_elf + index) for calories, index in ranked)
+        first_elf += elves
+    candidates.sort(key=lambda elf: (-elf[0], elf[1]))
+    return candidates[:count]
+
+
+def vectorized_calorie_totals(buffer, chunk_size=VECTOR_CHUNK_SIZE):
+    # Every elf's total from the raw bytes, as an int64 array, without a
+    # Python-level loop: the same elves stream_of_calorie_totals yields.
+    # Line-aligned chunks keep the working arrays to a few times chunk_size,
+    # whatever the size of the input; the elf open at the end of one chunk
+    # carries on into the next.
+    import numpy as np
+
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    elves, open_elf = [], 0
+    start = 0
+    while start < data.size:
+        stop = buffer.find(b"\n", min(start + chunk_size, data.size) - 1) + 1
+        stop = stop or data.size
+        totals = chunk_calorie_totals(data[start:stop])
+        totals[0] += open_elf
+        elves.append(totals[:-1])
+        open_elf = totals[-1]
+        start = stop
+    elves.append(np.array([open_elf], dtype=np.int64))
+    return np.concatenate(elves)
+
+
+def chunk_calorie_totals(data):
+    # The totals of a run of whole lines, the last elf being left open. Only
+    # bool arrays are as long as the chunk; the rest have an entry per number.
+    import numpy as np
+
+    allowed = np.zeros(256, dtype=bool)
+    allowed[np.frombuffer(b"0123456789" + WHITESPACE, np.uint8)] = True
+    if not allowed[data].all():
+        raise ValueError("calorie lines can only hold digits")
+
+    is_digit = data >= ord("0")  # whitespace all sorts below the digits
+    number_starts = np.flatnonzero(is_digit[1:] > is_digit[:-1]) + 1
+    number_ends = np.flatnonzero(is_digit[1:] < is_digit[:-1]) + 1
+    if is_digit[0]:
+        number_starts = np.insert(number_starts, 0, 0)
+    if is_digit[-1]:
+        number_ends = np.append(number_ends, data.size)
+    del is_digit
+
+    newlines = np.flatnonzero(data == ord("\n"))
+    line_count = newlines.size + (data[-1] != ord("\n"))
+    number_lines = np.searchsorted(newlines, number_starts)
+    del newlines
+    if np.any(number_lines[1:] == number_lines[:-1]):
+        raise ValueError("calorie lines can only hold one number")
+
+    # Digit by digit, most significant first, each number as long as it runs
+    lengths = number_ends - number_starts
+    if lengths.max(initial=0) > MAX_DIGITS:
+        raise ValueError(f"calorie counts can only have {MAX_DIGITS} digits")
+    numbers = np.zeros(lengths.size, dtype=np.int64)
+    for place in range(lengths.max(initial=0)):
+        running = np.flatnonzero(lengths > place)
+        digits = data[number_starts[running] + place] - ord("0")
+        numbers[running] = numbers[running] * 10 + digits
+
+    # With one number per line, the blank lines before the i-th number are
+    # its line less the i lines with numbers before it; each closes an elf
+    elf_of_number = number_lines - np.arange(number_lines.size)
+    totals = np.zeros(line_count - number_lines.size + 1, dtype=np.int64)
+    if numbers.size:
+        elf_starts = np.flatnonzero(np.diff(elf_of_number, prepend=-1))
+        totals[elf_of_number[elf_starts]] = np.add.reduceat(numbers, elf_starts)
+    return totals
+
+
+def top_calorie_counts_vectorized(calorie_totals, count):
+    import numpy as np
+
+    calorie_totals = np.asarray(calorie_totals, dtype=np.int64)
+    count = min(count, calorie_totals.size)
+    if count <= 0:
+        return 0
+    top = np.partition(calorie_totals, calorie_totals.size - count)[-count:]
+    return int(top.sum())
+
+
+def parse_vectorized(input_file):
+    with input_buffer(input_file) as buffer:
+        return vectorized_calorie_totals(buffer)
+
+
+def solve_vectorized(input_file):
+    calorie_totals = parse_vectorized(input_file)
+    return (
+        top_calorie_counts_vectorized(calorie_totals, 1),
+        top_calorie_counts_vectorized(calorie_totals, 3),
+    )
+
+
+def solve_first_star_vectorized(calorie_totals):
+    return top_calorie_counts_vectorized(calorie_totals, 1)
+
+
+def solve_second_star_vectorized(calorie_totals):
+    return top_calorie_counts_vectorized(calorie_totals, 3)
+
+
+def solve_in_parallel(path, jobs=None, chunk_size=CHUNK_SIZE):
+    # Both stars from one pass, without holding every elf's total in memory
+    ranked = top_calorie_totals_in_parallel(path, 3, jobs, chunk_size)
+    return ranked[0][0], sum(calories for calories, _ in ranked)
+
+
+def parse_in_parallel(input_file):
+    # Just the top three elves, ranked across processes for a plain file.
+    # Anything else (stdin, a compressed input) is streamed here instead.
+    with input_file:
+        if get_mappable_fileno(input_file) is not None:
+            return top_calorie_totals_in_parallel(
+                input_file.name, 3, chunk_size=CHUNK_SIZE
+            )
+        return top_calorie_totals(stream_of_calorie_totals(input_file), 3)
+
+
+def solve_first_star_ranked(ranked):
+    return sum(calories for calories, _ in ranked[:1])
+
+
+def solve_second_star_ranked(ranked):
+    return sum(calories for calories, _ in ranked[:3])
+
+
+engines = {"parallel": (solve_first_star_ranked, solve_second_star_ranked)}
+engine_parsers = {"parallel": parse_in_parallel}
+# NumPy is optional; without it the engine isn't offered
+if importlib.util.find_spec("numpy") is not None:
+    engines["numpy"] = (solve_first_star_vectorized, solve_second_star_vectorized)
+    engine_parsers["numpy"] = parse_vectorized
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
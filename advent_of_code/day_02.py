@@ -0,0 +1,123 @@
+import functools
+import pathlib
+import sys
+from enum import Enum
+
+
+from advent_of_code.puzzle_input import stripped_input_byte_lines
+
+example_input_string = """
+A Y
+B X
+C Z
+"""
+
+example_first_star_output = 15
+example_second_star_output = 12
+
+
+@functools.total_ordering
+class RoShamBo(Enum):
+    ROCK = 1
+    PAPER = 2
+    SCISSORS = 3
+
+    A = ROCK
+    B = PAPER
+    C = SCISSORS
+
+    X = ROCK
+    Y = PAPER
+    Z = SCISSORS
+
+    def __lt__(self, other):
+        return self.get_winner() == other
+
+    def get_winner(self):
+        match self:
+            case self.ROCK:
+                return self.PAPER
+            case self.PAPER:
+                return self.SCISSORS
+            case self.SCISSORS:
+                return self.ROCK
+
+    def get_loser(self):
+        match self:
+            case self.ROCK:
+                return self.SCISSORS
+            case self.PAPER:
+                return self.ROCK
+            case self.SCISSORS:
+                return self.PAPER
+
+
+def score_round(them, me):
+    score = me.value
+    if me == them:
+        score += 3
+    elif me > them:
+        score += 6
+    return score
+
+
+def choose_move(them, outcome):
+    match outcome:
+        case "X":  # lose
+            return them.get_loser()
+        case "Y":  # draw
+            return them
+        case "Z":  # win
+            return them.get_winner()
+        case _:
+            raise ValueError
+
+
+# Only nine distinct rounds exist, so score every possible line up front
+FIRST_STAR_SCORES = {
+    f"{first} {second}".encode(): score_round(RoShamBo[first], RoShamBo[second])
+    for first in "ABC"
+    for second in "XYZ"
+}
+SECOND_STAR_SCORES = {
+    f"{first} {second}".encode(): score_round(
+        RoShamBo[first], choose_move(RoShamBo[first], second)
+    )
+    for first in "ABC"
+    for second in "XYZ"
+}
+
+
+def parse(input_file):
+    return tuple(line for line in stripped_input_byte_lines(input_file) if line)
+
+
+def solve_first_star(strategy_guide):
+    return sum(FIRST_STAR_SCORES[line] for line in strategy_guide)
+
+
+def solve_second_star(strategy_guide):
+    return sum(SECOND_STAR_SCORES[line] for line in strategy_guide)
+
+
+def solve(input_file):
+    strategy_guide = parse(input_file)
+    return solve_first_star(strategy_guide), solve_second_star(strategy_guide)
+
+
+def first_star(input_file):
+    return solve_first_star(parse(input_file))
+
+
+def second_star(input_file):
+    return solve_second_star(parse(input_file))
+
+
+def main(argv=()):
+    from advent_of_code import runner
+
+    return runner.main([pathlib.Path(__file__).stem, *argv])
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
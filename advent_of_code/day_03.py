@@ -1,8 +1,9 @@
-import io
 import itertools
 import pathlib
+import sys
 
-import pytest
+
+from advent_of_code.puzzle_input import stripped_input_lines
 
 example_input_string = """\
 vJrwpWtwJgWrhcsFMMfFFhFp
@@ -26,15 +27,19 @@ def get_priority(char):
         raise ValueError
 
 
-def three_lines_at_a_time(input_file):
-    line_generator = stripped_input_lines(input_file)
+def three_lines_at_a_time(lines):
+    line_generator = iter(lines)
     while lines := tuple(itertools.islice(line_generator, 3)):
         yield lines
 
 
-def first_star(input_file):
+def parse(input_file):
+    return tuple(stripped_input_lines(input_file))
+
+
+def solve_first_star(rucksacks):
     total = 0
-    for line in stripped_input_lines(input_file):
+    for line in rucksacks:
         length = len(line)
         assert length % 2 == 0
         half_length = int(len(line) / 2)
@@ -45,39 +50,34 @@ def first_star(input_file):
     return total
 
 
-def second_star(input_file):
+def solve_second_star(rucksacks):
     total = 0
-    for first, second, third in three_lines_at_a_time(input_file):
+    for first, second, third in three_lines_at_a_time(rucksacks):
         for letter in set(first) & set(second) & set(third):
             total += get_priority(letter)
 
     return total
 
 
-# noinspection DuplicatedCode
-def main():
-    input_path = pathlib.Path("input", pathlib.Path(__file__).name).with_suffix(".txt")
+def solve(input_file):
+    rucksacks = parse(input_file)
+    return solve_first_star(rucksacks), solve_second_star(rucksacks)
 
-    print(f"First star answer: {first_star(input_path.open())}")
-    print(f"Second star answer: {second_star(input_path.open())}")
-
-
-@pytest.fixture
-def test_input():
-    return io.StringIO(example_input_string)
 
+def first_star(input_file):
+    return solve_first_star(parse(input_file))
 
-def test_first_star(test_input):
-    assert first_star(test_input) == example_first_star_output
 
+def second_star(input_file):
+    return solve_second_star(parse(input_file))
 
-def test_second_star(test_input):
-    assert second_star(test_input) == example_second_star_output
 
+# noinspection DuplicatedCode
+def main(argv=()):
+    from advent_of_code import runner
 
-def stripped_input_lines(input_file):
-    return (line.strip() for line in input_file)
+    return runner.main([pathlib.Path(__file__).stem, *argv])
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(sys.argv[1:]))
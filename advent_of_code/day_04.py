@@ -0,0 +1,79 @@
+import pathlib
+import sys
+
+from advent_of_code.integers import iter_rows, read_integer_table
+from advent_of_code.intervals import InclusiveInterval
+
+example_input_string = """\
+2-4,6-8
+2-3,4-5
+5-7,7-9
+2-8,3-7
+6-6,4-6
+2-6,4-8
+"""
+
+example_first_star_output = 2
+example_second_star_output = 4
+
+
+SECTION_ASSIGNMENT_COLUMNS = 4
+
+
+def parse(input_file):
+    return read_integer_table(input_file, SECTION_ASSIGNMENT_COLUMNS, signed=False)
+
+
+def section_pairs(section_assignments):
+    for first_start, first_stop, second_start, second_stop in iter_rows(
+        section_assignments, SECTION_ASSIGNMENT_COLUMNS
+    ):
+        yield (
+            InclusiveInterval(first_start, first_stop),
+            InclusiveInterval(second_start, second_stop),
+        )
+
+
+def solve_first_star(section_assignments):
+    count = 0
+    for first_elf, second_elf in section_pairs(section_assignments):
+        if first_elf.covers(second_elf) or second_elf.covers(first_elf):
+            count += 1
+
+    return count
+
+
+def solve_second_star(section_assignments):
+    count = 0
+    for first_elf, second_elf in section_pairs(section_assignments):
+        if first_elf.overlaps(second_elf):
+            count += 1
+
+    return count
+
+
+def solve(input_file):
+    section_assignments = parse(input_file)
+    return (
+        solve_first_star(section_assignments),
+        solve_second_star(section_assignments),
+    )
+
+
+def first_star(input_file):
+    return solve_first_star(parse(input_file))
+
+
+def second_star(input_file):
+    return solve_second_star(parse(input_file))
+
+
+# noinspection DuplicatedCode
+def main(argv=()):
+    from advent_of_code import runner
+
+    return runner.main([pathlib.Path(__file__).stem, *argv])
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
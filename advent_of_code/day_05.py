@@ -0,0 +1,109 @@
+import collections
+import itertools
+import pathlib
+import re
+import sys
+
+
+from advent_of_code.integers import iter_rows, read_integer_table
+
+example_input_string = """\
+    [D]    
+[N] [C]    
+[Z] [M] [P]
+ 1   2   3 
+
+move 1 from 2 to 1
+move 3 from 1 to 3
+move 2 from 2 to 1
+move 1 from 1 to 2
+"""
+
+example_first_star_output = "CMZ"
+example_second_star_output = "MCD"
+
+
+CRATE_NUMBERS = re.compile(r"^(?: (?P<crate_num>\d+)  ?)+")
+CRATE_MOVE_COLUMNS = 3  # move <moves> from <from> to <to>
+
+
+def chunk(string, n):
+    it = iter(string)
+    while chunk := "".join(itertools.islice(it, n)):
+        yield chunk
+
+
+def parse_starting_positions(input_file):
+    crates = collections.defaultdict(list)
+    for line in input_file:
+        line = line.rstrip("\n")
+        if crate_number_match := CRATE_NUMBERS.match(line):
+            break
+        for num, crate in enumerate(chunk(line, 4), 1):
+            crate = crate.strip()
+            if crate:
+                crates[num].append(crate[1:-1])
+    else:
+        raise ValueError  # reached end of file before finding crate number row
+    assert int(crate_number_match["crate_num"]) == len(crates)
+    return crates
+
+
+def parse_moves(input_file):
+    moves = read_integer_table(input_file, CRATE_MOVE_COLUMNS, signed=False)
+    return tuple(iter_rows(moves, CRATE_MOVE_COLUMNS))
+
+
+def parse(input_file):
+    crates = parse_starting_positions(input_file)
+    return crates, parse_moves(input_file)
+
+
+def copy_crates(crates):
+    return {num: list(stack) for num, stack in crates.items()}
+
+
+def solve_first_star(parsed):
+    starting_crates, moves = parsed
+    crates = copy_crates(starting_crates)
+
+    for moves_count, frm, to in moves:
+        for _ in range(moves_count):
+            crates[to].insert(0, crates[frm].pop(0))
+
+    return "".join(crates[i + 1][0] for i in range(len(crates)))
+
+
+def solve_second_star(parsed):
+    starting_crates, moves = parsed
+    crates = copy_crates(starting_crates)
+
+    for moves_count, frm, to in moves:
+        crates[to][0:0] = crates[frm][0:moves_count]
+        crates[frm] = crates[frm][moves_count:]
+
+    return "".join(crates[i + 1][0] for i in range(len(crates)))
+
+
+def solve(input_file):
+    parsed = parse(input_file)
+    return solve_first_star(parsed), solve_second_star(parsed)
+
+
+def first_star(input_file):
+    return solve_first_star(parse(input_file))
+
+
+def second_star(input_file):
+    return solve_second_star(parse(input_file))
+
+
+# noinspection DuplicatedCode
+def main(argv=()):
+    from advent_of_code import runner
+
+    return runner.main([pathlib.Path(__file__).stem, *argv])
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,82 @@
+import functools
+import itertools
+import pathlib
+import sys
+
+examples = [
+    ("mjqjpqmgbljsphdztnvjfqwrcgsmlb", 7),
+    ("bvwbjplbgvbhsrlpgdmjqwftvncz", 5),
+    ("nppdvjthqldpwncqszvftbrmjlhg", 6),
+    ("nznrnfrfntjfmvfwmzdfjlvtqnbhcprsg", 10),
+    ("zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw", 11),
+]
+
+
+START_OF_PACKET_LENGTH = 4
+START_OF_MESSAGE_LENGTH = 14
+CHUNK_SIZE = 64 * 1024
+
+
+def find_marker(datastream, consecutive_distincts):
+    # One pass over any iterable of characters: the window of distinct
+    # characters restarts just after the last repeat of the newest one.
+    last_seen = {}
+    window_start = 0
+    for position, character in enumerate(datastream):
+        if last_seen.get(character, -1) >= window_start:
+            window_start = last_seen[character] + 1
+        last_seen[character] = position
+        if position + 1 - window_start == consecutive_distincts:
+            return position + 1
+    raise ValueError
+
+
+def parse(input_file):
+    # A start-of-message marker ends with a start-of-packet marker, so
+    # neither star needs anything past the first one and the rest of the
+    # stream is never read.
+    chunks = []
+
+    def characters():
+        for chunk in iter(functools.partial(input_file.read, CHUNK_SIZE), ""):
+            chunks.append(chunk)
+            yield from chunk
+
+    with input_file:
+        try:
+            end = find_marker(characters(), START_OF_MESSAGE_LENGTH)
+        except ValueError:
+            end = None
+    return "".join(chunks)[:end]
+
+
+def solve_first_star(datastream):
+    return find_marker(datastream, START_OF_PACKET_LENGTH)
+
+
+def solve_second_star(datastream):
+    return find_marker(datastream, START_OF_MESSAGE_LENGTH)
+
+
+def solve(input_file):
+    datastream = parse(input_file)
+    return solve_first_star(datastream), solve_second_star(datastream)
+
+
+def first_star(input_file):
+    return solve_first_star(parse(input_file))
+
+
+def second_star(input_file):
+    return solve_second_star(parse(input_file))
+
+
+# noinspection DuplicatedCode
+def main(argv=()):
+    from advent_of_code import runner
+
+    return runner.main([pathlib.Path(__file__).stem, *argv])
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
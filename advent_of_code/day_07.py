@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import io
 import pathlib
+import sys
 from dataclasses import dataclass, field
 from functools import cached_property
 
-import pytest
+
+from advent_of_code.puzzle_input import stripped_input_lines
 
 example_input_string = """\
 $ cd /
@@ -63,8 +64,7 @@ class Directory:
         yield self
 
 
-def first_star(input_file):
-    root = get_root(input_file)
+def solve_first_star(root):
     return sum(
         directory.size
         for directory in root.recursively_traverse()
@@ -95,11 +95,10 @@ def get_root(input_file):
     return root
 
 
-def second_star(input_file):
+def solve_second_star(root):
     space_total = 70000000
     space_needed = 30000000
 
-    root = get_root(input_file)
     space_free = space_total - root.size
 
     min_space_to_delete = space_needed - space_free
@@ -110,34 +109,29 @@ def second_star(input_file):
     )
 
 
-# noinspection DuplicatedCode
-def main():
-    input_path = pathlib.Path("input", pathlib.Path(__file__).name).with_suffix(".txt")
-
-    print(f"First star answer: {first_star(input_path.open())}")
-    print(f"Second star answer: {second_star(input_path.open())}")
+def parse(input_file):
+    return get_root(input_file)
 
 
-@pytest.fixture
-def example_input():
-    return io.StringIO(example_input_string)
+def solve(input_file):
+    root = parse(input_file)
+    return solve_first_star(root), solve_second_star(root)
 
 
-def test_first_star(example_input):
-    assert first_star(example_input) == example_first_star_output
-
+def first_star(input_file):
+    return solve_first_star(parse(input_file))
 
-def test_second_star(example_input):
-    assert second_star(example_input) == example_second_star_output
 
+def second_star(input_file):
+    return solve_second_star(parse(input_file))
 
-def test_main():
-    main()
 
+# noinspection DuplicatedCode
+def main(argv=()):
+    from advent_of_code import runner
 
-def stripped_input_lines(input_file):
-    return (line.strip() for line in input_file)
+    return runner.main([pathlib.Path(__file__).stem, *argv])
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(sys.argv[1:]))
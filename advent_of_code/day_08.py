@@ -0,0 +1,166 @@
+import itertools
+import pathlib
+import sys
+
+from advent_of_code.grid import Grid2D
+from advent_of_code.puzzle_input import stripped_input_byte_lines
+
+DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+example_input_string = """\
+30373
+25512
+65332
+33549
+35390
+"""
+
+example_first_star_output = 21
+example_second_star_output = 8
+
+
+class TreeGrid(Grid2D):
+    @classmethod
+    def from_input(cls, input_file):
+        # from_rows refuses ragged rows, which would otherwise be wrapped
+        # into a grid of some other shape
+        return cls.from_rows(
+            line.translate(DIGIT_VALUES)
+            for line in stripped_input_byte_lines(input_file)
+            if line
+        )
+
+    def __getitem__(self, row_number):
+        return tuple(self.row(row_number))
+
+    def get_column(self, n):
+        return tuple(self.column(n))
+
+
+def parse(input_file):
+    return TreeGrid.from_input(input_file)
+
+
+def solve_first_star(grid):
+    columns = [grid.column(col_num) for col_num in range(grid.width)]
+    sum_visible = 0
+    for row_num, row in enumerate(grid.rows()):
+        for col_num, entry in enumerate(row):
+            west_trees = row[:col_num]
+            if not west_trees or max(west_trees) < entry:
+                sum_visible += 1
+                continue
+            east_trees = row[col_num + 1 :]
+            if not east_trees or max(east_trees) < entry:
+                sum_visible += 1
+                continue
+            column = columns[col_num]
+            north_trees = column[:row_num]
+            if not north_trees or max(north_trees) < entry:
+                sum_visible += 1
+                continue
+            south_trees = column[row_num + 1 :]
+            if not south_trees or max(south_trees) < entry:
+                sum_visible += 1
+                continue
+    return sum_visible
+
+
+def solve_second_star(grid):
+    columns = [grid.column(col_num) for col_num in range(grid.width)]
+    best_scenic_score = 0
+    for row_num, row in enumerate(grid.rows()):
+        for col_num, entry in enumerate(row):
+            trees_looking_west = reversed(row[:col_num])
+            west_viewing_distance = 0
+            for tree in trees_looking_west:
+                west_viewing_distance += 1
+                if entry <= tree:
+                    break
+
+            trees_looking_east = row[col_num + 1 :]
+            east_viewing_distance = 0
+            for tree in trees_looking_east:
+                east_viewing_distance += 1
+                if entry <= tree:
+                    break
+
+            column = columns[col_num]
+
+            trees_looking_north = reversed(column[:row_num])
+            north_viewing_distance = 0
+            for tree in trees_looking_north:
+                north_viewing_distance += 1
+                if entry <= tree:
+                    break
+
+            trees_looking_south = column[row_num + 1 :]
+            south_viewing_distance = 0
+            for tree in trees_looking_south:
+                south_viewing_distance += 1
+                if entry <= tree:
+                    break
+
+            scenic_score = (
+                west_viewing_distance
+                * east_viewing_distance
+                * north_viewing_distance
+                * south_viewing_distance
+            )
+            best_scenic_score = max(scenic_score, best_scenic_score)
+
+    return best_scenic_score
+
+
+def get_sight_lines(grid):
+    # Cell indexes and tree heights of every row and column, both ways
+    cells, width = grid.cells, grid.width
+    indexes = range(len(cells))
+    rows = [slice(start, start + width) for start in range(0, len(cells), width)]
+    columns = [slice(start, None, width) for start in range(width)]
+    for line in rows + columns:
+        yield indexes[line], cells[line]
+        yield indexes[line][::-1], cells[line][::-1]
+
+
+def solve_first_star_fast(grid):
+    # A tree is visible along a line when it's taller than every tree
+    # before it, so one running maximum per line finds them all
+    visible = bytearray(len(grid.cells))
+    for indexes, heights in get_sight_lines(grid):
+        tallest = -1
+        for index, height in zip(indexes, heights):
+            if height > tallest:
+                tallest = height
+                visible[index] = 1
+    return visible.count(1)
+
+
+# The second star keeps its slicing scans: a view ends at the first tree at
+# least as tall, and with heights of 0 to 9 that's never far, so they already
+# beat a monotonic stack run in Python.
+engines = {"fast": (solve_first_star_fast, solve_second_star)}
+
+
+def solve(input_file):
+    grid = parse(input_file)
+    return solve_first_star(grid), solve_second_star(grid)
+
+
+def first_star(input_file):
+    return solve_first_star(parse(input_file))
+
+
+def second_star(input_file):
+    return solve_second_star(parse(input_file))
+
+
+# noinspection DuplicatedCode
+def main(argv=()):
+    from advent_of_code import runner
+
+    return runner.main([pathlib.Path(__file__).stem, *argv])
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,175 @@
+import pathlib
+import sys
+
+from advent_of_code import counters
+from advent_of_code.grid import Grid2D
+from advent_of_code.puzzle_input import stripped_input_byte_lines
+
+example_first_star_input_string = """\
+R 4
+U 4
+L 3
+D 1
+R 4
+D 1
+L 5
+R 2
+"""
+
+example_first_star_output = 13
+
+example_second_star_input_string = """\
+R 5
+U 8
+L 8
+D 3
+R 17
+D 10
+L 25
+U 20
+"""
+
+example_second_star_output = 36
+
+
+class Grid:
+    tail_visits: Grid2D
+    rope: list[tuple[int, int]]
+
+    def __init__(self, rope_length=2):
+        self.rope = [(0, 0)] * rope_length
+        self.tail_visits = Grid2D(1, 1)
+        self.tail_visits.set(0, 0, 1)
+
+    def move_head_up(self):
+        new_x, new_y = self.rope[0][0], (self.rope[0][1] - 1)
+        self.move_head_to(new_x, new_y)
+
+    def move_head_down(self):
+        new_x, new_y = self.rope[0][0], (self.rope[0][1] + 1)
+        self.move_head_to(new_x, new_y)
+
+    def move_head_left(self):
+        new_x, new_y = (self.rope[0][0] - 1), self.rope[0][1]
+        self.move_head_to(new_x, new_y)
+
+    def move_head_right(self):
+        new_x, new_y = (self.rope[0][0] + 1), self.rope[0][1]
+        self.move_head_to(new_x, new_y)
+
+    def move_head_to(self, x, y):
+        counting = counters.enabled
+        new_rope = [(x, y)]
+        for knot in self.rope[1:]:
+            x, y = knot
+            dx, dy = (new_rope[-1][0] - x), (new_rope[-1][1] - y)
+
+            if abs(dx) == 2:  # left/right move needed
+                x += 1 if dx > 0 else -1
+                if abs(dy) == 1:  # diagonal also needed
+                    y += 1 if dy > 0 else -1
+
+            if abs(dy) == 2:  # up/down move needed
+                y += 1 if dy > 0 else -1
+                if abs(dx) == 1:  # diagonal also needed
+                    x += 1 if dx > 0 else -1
+
+            new_rope.append((x, y))
+            if counting and new_rope[-1] != knot:
+                counters.add("knot_updates")
+
+        self.tail_visits.grow_to_include(x, y)
+        self.tail_visits.set(x, y, 1)
+        self.rope = new_rope
+        # self.visualize()
+
+    def count_tail_visits(self):
+        return self.tail_visits.count(1)
+
+    def visualize(self):
+        visits = self.tail_visits
+        for x, y in self.rope:
+            visits.grow_to_include(x, y)
+
+        print("*" * 80)
+        for y in range(visits.y_offset, visits.y_end):
+            for x in range(visits.x_offset, visits.x_end):
+                try:
+                    index = self.rope.index((x, y))
+                    if index == 0:
+                        print_char = "H"
+                    elif index == len(self.rope) - 1:
+                        print_char = "T"
+                    else:
+                        print_char = str(index)
+                except ValueError:
+                    if (x, y) == (0, 0):
+                        print_char = "s"
+                    elif visits.get(x, y):
+                        print_char = "#"
+                    else:
+                        print_char = "."
+                print(print_char, end="")
+            print()
+        print("*" * 80)
+
+
+def get_count_of_visited(moves, rope_length):
+    grid = Grid(rope_length)
+    for direction, count in moves:
+        match direction:
+            case "L":
+                move_func = grid.move_head_left
+            case "R":
+                move_func = grid.move_head_right
+            case "U":
+                move_func = grid.move_head_up
+            case "D":
+                move_func = grid.move_head_down
+            case _:
+                raise ValueError
+        for _ in range(count):
+            move_func()
+
+    return grid.count_tail_visits()
+
+
+def parse(input_file):
+    moves = []
+    for line in stripped_input_byte_lines(input_file):
+        if line:
+            direction, count = line.split()
+            moves.append((direction.decode(), int(count)))
+    return moves
+
+
+def solve_first_star(moves):
+    return get_count_of_visited(moves, 2)
+
+
+def solve_second_star(moves):
+    return get_count_of_visited(moves, 10)
+
+
+def solve(input_file):
+    moves = parse(input_file)
+    return solve_first_star(moves), solve_second_star(moves)
+
+
+def first_star(input_file):
+    return solve_first_star(parse(input_file))
+
+
+def second_star(input_file):
+    return solve_second_star(parse(input_file))
+
+
+# noinspection DuplicatedCode
+def main(argv=()):
+    from advent_of_code import runner
+
+    return runner.main([pathlib.Path(__file__).stem, *argv])
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
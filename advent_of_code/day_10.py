@@ -1,8 +1,9 @@
-import io
 import itertools
 import pathlib
+import sys
 
-import pytest
+
+from advent_of_code.puzzle_input import stripped_input_lines
 
 example_input_string = """\
 addx 15
@@ -178,8 +179,8 @@ ADDX = "addx"
 DEFERRED_ADD = "deferredadd"
 
 
-def communication_machine_cycles(input_file):
-    line_generator = iter(stripped_input_lines(input_file))
+def communication_machine_cycles(instructions):
+    line_generator = iter(instructions)
     x = 1
     add_in_cycle = -1
     add_this_value = 0
@@ -202,11 +203,15 @@ def communication_machine_cycles(input_file):
             x += add_this_value
 
 
-def first_star(input_file, checkpoints=None):
+def parse(input_file):
+    return tuple(stripped_input_lines(input_file))
+
+
+def solve_first_star(instructions, checkpoints=None):
     cycle_numbers_to_sum = tuple(range(20, 220 + 1, 40))
     signal_strength_sum = 0
 
-    for cycle_number, x in communication_machine_cycles(input_file):
+    for cycle_number, x in communication_machine_cycles(instructions):
         if cycle_number in cycle_numbers_to_sum:
             signal_strength_sum += x * cycle_number
         if checkpoints and cycle_number in checkpoints:
@@ -214,9 +219,9 @@ def first_star(input_file, checkpoints=None):
     return signal_strength_sum
 
 
-def second_star(input_file):
+def solve_second_star(instructions):
     output = ""
-    for cycle_number, x in communication_machine_cycles(input_file):
+    for cycle_number, x in communication_machine_cycles(instructions):
         sprite_positions = (x - 1, x, x + 1)
         pixel_number = (cycle_number - 1) % 40
         output += "#" if pixel_number in sprite_positions else "."
@@ -225,6 +230,19 @@ def second_star(input_file):
     return output
 
 
+def solve(input_file):
+    instructions = parse(input_file)
+    return solve_first_star(instructions), solve_second_star(instructions)
+
+
+def first_star(input_file, checkpoints=None):
+    return solve_first_star(parse(input_file), checkpoints)
+
+
+def second_star(input_file):
+    return solve_second_star(parse(input_file))
+
+
 ASCII_ALPHABET = {
     ".##.\n#..#\n#..#\n####\n#..#\n#..#": "A",
     "###.\n#..#\n###.\n#..#\n#..#\n###.": "B",
@@ -252,15 +270,16 @@ ASCII_ALPHABET_LETTER_WIDTH = 4
 
 def ascii_art_to_string(ascii_art):
     lines = ascii_art.splitlines()
-    assert len(lines) == 6
-    line_lengths = {len(line) for line in lines}
-    assert len(line_lengths) == 1  # all same length
+    if len(lines) != 6 or len({len(line) for line in lines}) != 1:
+        raise ValueError("ASCII art letters are 6 lines of the same length")
     num_letters = (len(lines[0]) + 1) // (ASCII_ALPHABET_LETTER_WIDTH + 1)
     letters = []
     for letter_number in range(num_letters):
         start = letter_number * (ASCII_ALPHABET_LETTER_WIDTH + 1)
         end = start + ASCII_ALPHABET_LETTER_WIDTH
         letters.append("\n".join(line[start:end] for line in lines))
+    if unknown := [letter for letter in letters if letter not in ASCII_ALPHABET]:
+        raise ValueError(f"unknown ASCII art letter\n{unknown[0]}")
     return "".join(ASCII_ALPHABET[letter] for letter in letters)
 
 
@@ -274,42 +293,20 @@ test_ascii_art = """\
 """
 
 
-def test_ascii_art_to_string():
-    assert ascii_art_to_string(test_ascii_art) == "EHPZPJGL"
-
-
-def main():
-    input_path = pathlib.Path("input", pathlib.Path(__file__).name).with_suffix(".txt")
-
-    print(f"First star answer: {first_star(input_path.open())}")
-    second_star_output_ascii = second_star(input_path.open())
-    second_star_output = ascii_art_to_string(second_star_output_ascii)
-    print(f"Second star answer: {second_star_output}")
-
-
-@pytest.fixture
-def example_input():
-    return io.StringIO(example_input_string)
-
-
-def test_first_star(example_input):
-    assert (
-        first_star(example_input, example_first_star_checkpoints)
-        == example_first_star_output
-    )
-
-
-def test_second_star(example_input):
-    assert second_star(example_input) == example_second_star_output
-
+def decode_answers(first_star_answer, second_star_answer):
+    # Screens that don't spell known letters, like generated inputs', are
+    # answered with the art itself rather than failing the whole day
+    try:
+        return first_star_answer, ascii_art_to_string(second_star_answer)
+    except ValueError:
+        return first_star_answer, second_star_answer
 
-def test_main():
-    main()
 
+def main(argv=()):
+    from advent_of_code import runner
 
-def stripped_input_lines(input_file):
-    return (line.strip() for line in input_file)
+    return runner.main([pathlib.Path(__file__).stem, *argv])
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(sys.argv[1:]))
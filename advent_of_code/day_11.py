@@ -1,11 +1,13 @@
+import copy
 import functools
-import io
 import operator
 import pathlib
+import sys
 import typing
 from dataclasses import dataclass, field
 
-import pytest
+from advent_of_code import progress
+from advent_of_code.puzzle_input import stripped_input_lines
 
 example_input_string = """\
 Monkey 0:
@@ -44,11 +46,25 @@ example_second_star_output = 2713310158
 @dataclass
 class Monkey:
     items: list[int]
-    operation: typing.Callable[[int], int]
+    operator: typing.Callable[[int, int], int]
+    operand: int | str
     test_divisor: int
-    lookup_target: typing.Callable[[int], int]
+    target_if_true: int
+    target_if_false: int
     inspections: int = 0
 
+    def operation(self, old):
+        if self.operand == "old":
+            return self.operator(old, old)
+        else:
+            return self.operator(old, self.operand)
+
+    def lookup_target(self, value):
+        if value % self.test_divisor == 0:
+            return self.target_if_true
+        else:
+            return self.target_if_false
+
 
 def build_monkey(line_generator):
     assert next(line_generator).startswith("Monkey")
@@ -67,24 +83,12 @@ def build_monkey(line_generator):
     if operand != "old":
         operand = int(operand)
 
-    def operation(old):
-        if operand == "old":
-            return op(old, old)
-        else:
-            return op(old, operand)
-
     test_divisor = int(next(line_generator).split("divisible by ")[-1])
     target_if_true, target_if_false = tuple(
         int(next(line_generator).split("throw to monkey ")[-1]) for _ in range(2)
     )
 
-    def lookup_target(value):
-        if value % test_divisor == 0:
-            return target_if_true
-        else:
-            return target_if_false
-
-    return Monkey(items, operation, test_divisor, lookup_target)
+    return Monkey(items, op, operand, test_divisor, target_if_true, target_if_false)
 
 
 def parse_monkey_state_file(input_file):
@@ -101,8 +105,12 @@ def parse_monkey_state_file(input_file):
     return monkeys
 
 
-def first_star(input_file):
-    monkeys = parse_monkey_state_file(input_file)
+def parse(input_file):
+    return parse_monkey_state_file(input_file)
+
+
+def solve_first_star(starting_monkeys):
+    monkeys = copy.deepcopy(starting_monkeys)
     for round_number in range(20):
         for monkey in monkeys:
             for item in monkey.items:
@@ -118,12 +126,15 @@ def first_star(input_file):
     return inspections[-1] * inspections[-2]
 
 
-def second_star(input_file):
-    monkeys = parse_monkey_state_file(input_file)
+def solve_second_star(starting_monkeys):
+    monkeys = copy.deepcopy(starting_monkeys)
     max_factor = functools.reduce(
         operator.mul, (monkey.test_divisor for monkey in monkeys)
     )
+    reporting = progress.enabled
     for round_number in range(10000):
+        if reporting:
+            progress.report("day_11 rounds", round_number, 10000)
         for monkey in monkeys:
             for item in monkey.items:
                 new_value = monkey.operation(item)
@@ -138,34 +149,25 @@ def second_star(input_file):
     return inspections[-1] * inspections[-2]
 
 
-# noinspection DuplicatedCode
-def main():
-    input_path = pathlib.Path("input", pathlib.Path(__file__).name).with_suffix(".txt")
-
-    print(f"First star answer: {first_star(input_path.open())}")
-    print(f"Second star answer: {second_star(input_path.open())}")
-
+def solve(input_file):
+    monkeys = parse(input_file)
+    return solve_first_star(monkeys), solve_second_star(monkeys)
 
-@pytest.fixture
-def example_input():
-    return io.StringIO(example_input_string)
-
-
-def test_first_star(example_input):
-    assert first_star(example_input) == example_first_star_output
 
+def first_star(input_file):
+    return solve_first_star(parse(input_file))
 
-def test_second_star(example_input):
-    assert second_star(example_input) == example_second_star_output
 
+def second_star(input_file):
+    return solve_second_star(parse(input_file))
 
-def test_main():
-    main()
 
+# noinspection DuplicatedCode
+def main(argv=()):
+    from advent_of_code import runner
 
-def stripped_input_lines(input_file):
-    return (line.strip() for line in input_file)
+    return runner.main([pathlib.Path(__file__).stem, *argv])
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import array
+import pathlib
+import sys
+
+from advent_of_code import counters
+from advent_of_code.grid import Grid2D
+from advent_of_code.puzzle_input import stripped_input_byte_lines
+
+example_input_string = """\
+Sabqponm
+abcryxxl
+accszExk
+acctuvwj
+abdefghi
+"""
+
+example_first_star_output = 31
+example_second_star_output = 29
+
+
+UNREACHED = sys.maxsize
+
+
+class Grid:
+    # Heights are stored as their letter's byte; S and E are replaced by
+    # the a and z they stand for, and remembered as indexes.
+    def __init__(self, input_file):
+        rows = [line for line in stripped_input_byte_lines(input_file) if line]
+        self.heights = Grid2D.from_rows(rows)
+        cells = self.heights.cells
+        self.a_nodes = [
+            index for index, height in enumerate(cells) if height == ord("a")
+        ]
+        self.marked_start = cells.index(b"S")
+        self.marked_end = cells.index(b"E")
+        cells[self.marked_start] = ord("a")
+        cells[self.marked_end] = ord("z")
+
+    def get_neighbors(self, node, max_height=1):
+        heights = self.heights.cells
+        highest = heights[node] + max_height
+        return [
+            neighbor
+            for neighbor in self.heights.neighbor_indexes(node)
+            if heights[neighbor] <= highest
+        ]
+
+    def do_the_dijkstra(self, starting_points=None):
+        if starting_points is None:
+            starting_points = (self.marked_start,)
+
+        size = len(self.heights.cells)
+        distances = array.array("q", [UNREACHED]) * size
+        visited = bytearray(size)
+        queued = bytearray(size)
+        for starting_point in starting_points:
+            distances[starting_point] = 0
+            queued[starting_point] = 1
+
+        unvisited = list(starting_points)
+        assert len(unvisited) != 0
+
+        counting = counters.enabled
+        while unvisited:
+            unvisited.sort(key=distances.__getitem__)
+            current = unvisited.pop(0)
+            queued[current] = 0
+            if counting:
+                counters.add("nodes_popped")
+
+            if current == self.marked_end:
+                break
+
+            distance_to_neighbors = distances[current] + 1
+            for neighbor in self.get_neighbors(current):
+                if not visited[neighbor]:
+                    if distance_to_neighbors < distances[neighbor]:
+                        distances[neighbor] = distance_to_neighbors
+                        if counting:
+                            counters.add("neighbors_relaxed")
+                        if not queued[neighbor]:
+                            queued[neighbor] = 1
+                            unvisited.append(neighbor)
+
+            visited[current] = 1
+
+        if current != self.marked_end:
+            return None
+        else:
+            return distances[current]
+
+    def do_a_breadth_first_search(self, starting_points=None):
+        # Every step costs the same, so searching level by level reaches the
+        # end in the fewest steps without ordering anything
+        if starting_points is None:
+            starting_points = (self.marked_start,)
+
+        reached = bytearray(len(self.heights.cells))
+        for starting_point in starting_points:
+            reached[starting_point] = 1
+        frontier = list(starting_points)
+        distance = 0
+        counting = counters.enabled
+        while frontier:
+            next_frontier = []
+            for node in frontier:
+                if counting:
+                    counters.add("nodes_popped")
+                if node == self.marked_end:
+                    return distance
+                for neighbor in self.get_neighbors(node):
+                    if not reached[neighbor]:
+                        reached[neighbor] = 1
+                        next_frontier.append(neighbor)
+                        if counting:
+                            counters.add("neighbors_relaxed")
+            frontier = next_frontier
+            distance += 1
+        return None
+
+
+def parse(input_file):
+    return Grid(input_file)
+
+
+def solve_first_star(grid):
+    return grid.do_the_dijkstra()
+
+
+def solve_second_star(grid):
+    return grid.do_the_dijkstra(grid.a_nodes)
+
+
+def solve_first_star_fast(grid):
+    return grid.do_a_breadth_first_search()
+
+
+def solve_second_star_fast(grid):
+    return grid.do_a_breadth_first_search(grid.a_nodes)
+
+
+engines = {"fast": (solve_first_star_fast, solve_second_star_fast)}
+
+
+def solve(input_file):
+    grid = parse(input_file)
+    return solve_first_star(grid), solve_second_star(grid)
+
+
+def first_star(input_file):
+    return solve_first_star(parse(input_file))
+
+
+def second_star(input_file):
+    return solve_second_star(parse(input_file))
+
+
+# noinspection DuplicatedCode
+def main(argv=()):
+    from advent_of_code import runner
+
+    return runner.main([pathlib.Path(__file__).stem, *argv])
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,10 +1,11 @@
-import io
 import itertools
 import pathlib
+import sys
 from ast import literal_eval
 from typing import Iterable
 
-import pytest
+
+from advent_of_code.puzzle_input import stripped_input_lines
 
 UNDEFINED = object()
 
@@ -38,15 +39,14 @@ example_first_star_output = 13
 example_second_star_output = 140
 
 
-def pairs(input_file):
-    line_generator = stripped_input_lines(input_file)
-    while True:
-        left_str = next(line_generator)
-        right_str = next(line_generator)
-        yield literal_eval(left_str), literal_eval(right_str)
+def parse(input_file):
+    return tuple(
+        literal_eval(line) for line in stripped_input_lines(input_file) if line
+    )
+
 
-        if next(line_generator, None) is None:
-            break
+def pairs(packets):
+    return zip(packets[::2], packets[1::2])
 
 
 class ListComparableWithInt(list):
@@ -69,9 +69,9 @@ class ListComparableWithInt(list):
         return super().__gt__(other)
 
 
-def first_star(input_file):
+def solve_first_star(packets):
     correct_indices = []
-    for index, (left, right) in enumerate(pairs(input_file), start=1):
+    for index, (left, right) in enumerate(pairs(packets), start=1):
         left = ListComparableWithInt(left)
         right = ListComparableWithInt(right)
         if left < right:
@@ -80,48 +80,36 @@ def first_star(input_file):
     return sum(correct_indices)
 
 
-def second_star(input_file):
+def solve_second_star(packets):
     divider_packets = ListComparableWithInt(([[2]], [[6]]))
-    line_generator = stripped_input_lines(input_file)
-    packets = list(divider_packets)
-    while (line := next(line_generator, None)) is not None:
-        if line:
-            packet = ListComparableWithInt(literal_eval(line))
-            packets.append(packet)
+    packets = list(divider_packets) + [
+        ListComparableWithInt(packet) for packet in packets
+    ]
     packets.sort()
     first_index = packets.index(divider_packets[0]) + 1
     second_index = packets.index(divider_packets[1]) + 1
     return first_index * second_index
 
 
-# noinspection DuplicatedCode
-def main():
-    input_path = pathlib.Path("input", pathlib.Path(__file__).name).with_suffix(".txt")
-
-    print(f"First star answer: {first_star(input_path.open())}")
-    print(f"Second star answer: {second_star(input_path.open())}")
-
-
-@pytest.fixture
-def example_input():
-    return io.StringIO(example_input_string)
-
+def solve(input_file):
+    packets = parse(input_file)
+    return solve_first_star(packets), solve_second_star(packets)
 
-def test_first_star(example_input):
-    assert first_star(example_input) == example_first_star_output
 
+def first_star(input_file):
+    return solve_first_star(parse(input_file))
 
-def test_second_star(example_input):
-    assert second_star(example_input) == example_second_star_output
 
+def second_star(input_file):
+    return solve_second_star(parse(input_file))
 
-def test_main():
-    main()
 
+# noinspection DuplicatedCode
+def main(argv=()):
+    from advent_of_code import runner
 
-def stripped_input_lines(input_file):
-    return (line.strip() for line in input_file)
+    return runner.main([pathlib.Path(__file__).stem, *argv])
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,204 @@
+import itertools
+import pathlib
+import sys
+
+from advent_of_code import counters, progress
+from advent_of_code.grid import Grid2D
+from advent_of_code.integers import extract_integers
+from advent_of_code.puzzle_input import stripped_input_byte_lines
+
+example_input_string = """\
+498,4 -> 498,6 -> 496,6
+503,4 -> 502,4 -> 502,9 -> 494,9
+"""
+
+example_first_star_output = 24
+example_second_star_output = 93
+
+
+EMPTY = 0
+ROCK = 1
+SAND = 2
+SOURCE = (500, 0)
+
+
+def inclusive_interval_range(first, second):
+    if first < second:
+        return range(first, second + 1)
+    else:
+        return range(second, first + 1)
+
+
+def parse(input_file):
+    rock_paths = []
+    for line in stripped_input_byte_lines(input_file):
+        if coordinates := extract_integers(line, signed=False):
+            rock_paths.append(tuple(zip(coordinates[::2], coordinates[1::2])))
+    return tuple(rock_paths)
+
+
+class Space:
+    def __init__(self, rock_paths, add_floor=False):
+        points = [point for path in rock_paths for point in path] + [SOURCE]
+        min_x = min(x for x, _ in points)
+        max_x = max(x for x, _ in points)
+        self.max_y = max(y for _, y in points)
+        self.floor_y = self.max_y + 2
+        self.add_floor = add_floor
+
+        # Rows reach down to the floor. Columns cover the rock, and grow
+        # when sand spills past them onto the floor.
+        self.cells = Grid2D(max_x - min_x + 1, self.floor_y, x_offset=min_x)
+        for path in rock_paths:
+            for (x_begin, y_begin), (x_end, y_end) in itertools.pairwise(path):
+                for y in inclusive_interval_range(y_begin, y_end):
+                    for x in inclusive_interval_range(x_begin, x_end):
+                        self.cells.set(x, y, ROCK)
+
+        self.start = SOURCE
+
+    def get(self, x, y):
+        if self.add_floor and y == self.floor_y:
+            return ROCK
+        return self.cells.get(x, y, EMPTY)
+
+    def generate_sand_and_get_resting_position(self):
+        position = self.start
+        counting = counters.enabled
+        steps = 0
+        while next := self.get_next_position(position):
+            if next is position:
+                x, y = position
+                self.cells.grow_to_include(x, y)
+                self.cells.set(x, y, SAND)
+                break
+            else:
+                position = next
+                if counting:
+                    steps += 1
+        else:
+            position = None
+
+        if counting:
+            counters.add("grains")
+            counters.add("grain_steps", steps)
+        return position
+
+    def get_next_position(self, position):
+        x, y = position
+        # Below the lowest rock there's nothing left to land on
+        if not self.add_floor and y > self.max_y:
+            return None
+
+        candidate_positions = (
+            (x, y + 1),  # down
+            (x - 1, y + 1),  # down+left
+            (x + 1, y + 1),  # down+right
+        )
+
+        for new_x, new_y in candidate_positions:
+            if self.get(new_x, new_y) == EMPTY:
+                return new_x, new_y
+
+        return position  # stuck
+
+    def visualize(self):
+        visualization = []
+        for y in range(0, self.floor_y + 1):
+            for x in range(self.cells.x_offset, self.cells.x_end):
+                cell = self.get(x, y)
+                if cell == SAND:
+                    visualization.append("O")
+                elif (x, y) == self.start:
+                    visualization.append("+")
+                elif cell == ROCK:
+                    visualization.append("#")
+                else:
+                    visualization.append(".")
+            visualization.append("\n")
+        return "".join(visualization)
+
+
+def solve_first_star(rock_paths):
+    space = Space(rock_paths)
+    count = 0
+    while space.generate_sand_and_get_resting_position():
+        count += 1
+    return count
+
+
+def solve_second_star(rock_paths):
+    space = Space(rock_paths, add_floor=True)
+    count = 0
+    reporting = progress.enabled
+    while position := space.generate_sand_and_get_resting_position():
+        count += 1
+        if reporting:
+            progress.report("day_14 grains", count)
+        if position == space.start:
+            break
+    return count
+
+
+def count_grains_resuming_paths(space):
+    # Each grain falls along the previous grain's path up to the cell that
+    # grain came to rest in, so it can start from the cell before instead of
+    # from the source. The path is that stack of cells.
+    count = 0
+    path = [space.start]
+    reporting = progress.enabled
+    counting = counters.enabled
+    while path:
+        position = path[-1]
+        if not (next := space.get_next_position(position)):
+            break
+        if next is position:
+            x, y = position
+            space.cells.grow_to_include(x, y)
+            space.cells.set(x, y, SAND)
+            path.pop()
+            count += 1
+            if reporting:
+                progress.report("day_14 grains", count)
+            if counting:
+                counters.add("grains")
+        else:
+            path.append(next)
+            if counting:
+                counters.add("grain_steps")
+    return count
+
+
+def solve_first_star_fast(rock_paths):
+    return count_grains_resuming_paths(Space(rock_paths))
+
+
+def solve_second_star_fast(rock_paths):
+    return count_grains_resuming_paths(Space(rock_paths, add_floor=True))
+
+
+engines = {"fast": (solve_first_star_fast, solve_second_star_fast)}
+
+
+def solve(input_file):
+    rock_paths = parse(input_file)
+    return solve_first_star(rock_paths), solve_second_star(rock_paths)
+
+
+def first_star(input_file):
+    return solve_first_star(parse(input_file))
+
+
+def second_star(input_file):
+    return solve_second_star(parse(input_file))
+
+
+# noinspection DuplicatedCode
+def main(argv=()):
+    from advent_of_code import runner
+
+    return runner.main([pathlib.Path(__file__).stem, *argv])
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
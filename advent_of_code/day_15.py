@@ -0,0 +1,208 @@
+import os
+import pathlib
+import queue
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+
+import itertools
+
+from advent_of_code import counters, progress
+from advent_of_code.integers import iter_rows, read_integer_table
+from advent_of_code.intervals import InclusiveInterval, InclusiveIntervalSet
+
+UNDEFINED = object()
+
+example_input_string = """\
+Sensor at x=2, y=18: closest beacon is at x=-2, y=15
+Sensor at x=9, y=16: closest beacon is at x=10, y=16
+Sensor at x=13, y=2: closest beacon is at x=15, y=3
+Sensor at x=12, y=14: closest beacon is at x=10, y=16
+Sensor at x=10, y=20: closest beacon is at x=10, y=16
+Sensor at x=14, y=17: closest beacon is at x=10, y=16
+Sensor at x=8, y=7: closest beacon is at x=2, y=10
+Sensor at x=2, y=0: closest beacon is at x=2, y=10
+Sensor at x=0, y=11: closest beacon is at x=2, y=10
+Sensor at x=20, y=14: closest beacon is at x=25, y=17
+Sensor at x=17, y=20: closest beacon is at x=21, y=22
+Sensor at x=16, y=7: closest beacon is at x=15, y=3
+Sensor at x=14, y=3: closest beacon is at x=15, y=3
+Sensor at x=20, y=1: closest beacon is at x=15, y=3
+"""
+
+example_first_star_output = 26
+example_second_star_output = 56000011
+example_star_kwargs = ({"row_number": 10}, {"range_max": 20})
+
+SENSOR_READING_COLUMNS = 4  # sensor x, sensor y, beacon x, beacon y
+X = 0
+Y = 1
+
+
+@dataclass
+class Sensor:
+    x: int
+    y: int
+
+    beacon_x: int
+    beacon_y: int
+
+    sensor_to_beacon_distance: int = None
+
+    def __post_init__(self):
+        sensor_x, sensor_y = self.x, self.y
+        beacon_x, beacon_y = self.beacon_x, self.beacon_y
+        sensor_to_beacon_distance = abs(sensor_x - beacon_x) + abs(sensor_y - beacon_y)
+        self.exclusion_y_interval = InclusiveInterval(
+            self.y - sensor_to_beacon_distance, self.y + sensor_to_beacon_distance
+        )
+        self.sensor_to_beacon_distance = sensor_to_beacon_distance
+
+    def get_x_exclusion_interval(self, y):
+        if y not in self.exclusion_y_interval:
+            return None
+
+        sensor_x, sensor_y = self.x, self.y
+        spread = self.sensor_to_beacon_distance - abs(sensor_y - y)
+        return InclusiveInterval(sensor_x - spread, sensor_x + spread)
+
+
+class Space:
+    def __init__(self, input_file):
+        sensors = []
+
+        readings = read_integer_table(input_file, SENSOR_READING_COLUMNS)
+        for x, y, beacon_x, beacon_y in iter_rows(readings, SENSOR_READING_COLUMNS):
+            sensor = Sensor(x, y, beacon_x, beacon_y)
+            sensors.append(sensor)
+
+        self.sensors = sensors
+
+    def get_x_exclusion_interval_set(self, y, exclude_beacons=False):
+        sensors = self.get_sensors_affecting_y(y)
+        intervals = InclusiveIntervalSet(
+            sensor.get_x_exclusion_interval(y) for sensor in sensors
+        )
+        beacons_to_remove_from_exclusions = set()
+        if exclude_beacons:
+            for sensor in sensors:
+                if sensor.beacon_y == y:
+                    beacons_to_remove_from_exclusions.add(sensor.beacon_x)
+
+        for beacon_x_position in beacons_to_remove_from_exclusions:
+            intervals.remove(InclusiveInterval(beacon_x_position, beacon_x_position))
+
+        return intervals
+
+    def get_sensors_affecting_y(self, y):
+        sensors = [
+            sensor for sensor in self.sensors if y in sensor.exclusion_y_interval
+        ]
+        return sensors
+
+
+def parse(input_file):
+    return Space(input_file)
+
+
+def solve_first_star(space, row_number=2000000):
+    exclusions = space.get_x_exclusion_interval_set(row_number, exclude_beacons=True)
+    return exclusions.size()
+
+
+def gap_checker(space, range_max, y_start, y_stop, result_queue, counts_queue=None):
+    if counts_queue is not None:
+        counters.begin("worker")
+    search_space = InclusiveInterval(0, range_max)
+    reporting = progress.enabled
+    for y in range(y_start, y_stop):
+        if not result_queue.empty():
+            break
+        if reporting:
+            progress.report(
+                f"day_15 rows {y_start}-{y_stop}", y - y_start, y_stop - y_start
+            )
+
+        interval_set = space.get_x_exclusion_interval_set(y)
+        if (x := interval_set.first_gap(search_space)) is not None:
+            result_queue.put((x, y))
+
+    if counts_queue is not None:
+        counts_queue.put(dict(counters.current))
+
+
+def solve_second_star(space, range_max=4000000):
+    # Only the second star fans out across processes, and multiprocessing is
+    # slow enough to import that the first star shouldn't pay for it.
+    import multiprocessing
+
+    num_processes = os.cpu_count() or 1
+    chunk_size = range_max // num_processes
+    result_queue = multiprocessing.Queue()
+    # Workers count in their own process, so they send their counts back
+    counts_queue = multiprocessing.Queue() if counters.enabled else None
+    processes = []
+    for i in range(num_processes):
+        y_start = i * chunk_size
+        if i == num_processes - 1:
+            y_stop = range_max
+        else:
+            y_stop = (i + 1) * chunk_size
+
+        process = multiprocessing.Process(
+            target=gap_checker,
+            args=(space, range_max, y_start, y_stop, result_queue, counts_queue),
+        )
+        process.start()
+        processes.append(process)
+
+    try:
+        for process in processes:
+            process.join()
+    finally:
+        # Only reached early by an exception (like KeyboardInterrupt), which
+        # would otherwise leave the workers scanning
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+
+    if counts_queue is not None:
+        for _ in processes:
+            try:
+                counters.merge(counts_queue.get(timeout=1))
+            except queue.Empty:
+                break  # a terminated worker
+
+    if result_queue.empty():
+        raise ValueError("no solution found!")
+
+    x, y = result_queue.get()
+    return 4000000 * x + y
+
+
+def solve(input_file, row_number=2000000, range_max=4000000):
+    space = parse(input_file)
+    return (
+        solve_first_star(space, row_number),
+        solve_second_star(space, range_max),
+    )
+
+
+def first_star(input_file, row_number=2000000):
+    return solve_first_star(parse(input_file), row_number)
+
+
+def second_star(input_file, range_max=4000000):
+    return solve_second_star(parse(input_file), range_max)
+
+
+# noinspection DuplicatedCode
+def main(argv=()):
+    from advent_of_code import runner
+
+    return runner.main([pathlib.Path(__file__).stem, *argv])
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,146 @@
+import argparse
+import io
+import pathlib
+import sys
+import time
+from dataclasses import dataclass
+
+from advent_of_code.generators import generate_input_string
+from advent_of_code.puzzle_input import open_input
+from advent_of_code.runner import (
+    REFERENCE_ENGINE,
+    STAR_NAMES,
+    get_engine,
+    get_input_path,
+    get_parser,
+    import_day,
+)
+
+
+@dataclass
+class Comparison:
+    source: str
+    star: str
+    answers: dict
+    seconds: dict
+
+    @property
+    def matches(self):
+        expected, *others = self.answers.values()
+        return all(answer == expected for answer in others)
+
+
+def parse_for_engines(module, engine_names, input_string):
+    # Engines sharing a parse share its parsed input, which solvers never
+    # modify; an engine with a parse of its own gets its own
+    parsed_by_parser, parsed = {}, {}
+    for name in engine_names:
+        parse = get_parser(module, name)
+        if parse not in parsed_by_parser:
+            parsed_by_parser[parse] = parse(io.StringIO(input_string))
+        parsed[name] = parsed_by_parser[parse]
+    return parsed
+
+
+def compare_engines(module, parsed, engine_names, source=""):
+    # parsed holds each engine's parsed input, as from parse_for_engines
+    stars = {name: get_engine(module, name) for name in engine_names}
+    for index, star in enumerate(STAR_NAMES):
+        answers, seconds = {}, {}
+        for name in engine_names:
+            start = time.perf_counter()
+            try:
+                answers[name] = stars[name][index](parsed[name])
+            except Exception as error:
+                answers[name] = error
+            seconds[name] = time.perf_counter() - start
+        yield Comparison(source, star, answers, seconds)
+
+
+def get_sources(day, input_paths=(), generate=0, size=1000, seed=0):
+    for path in input_paths:
+        yield str(path), open_input(path)
+    for seed in range(seed, seed + generate):
+        yield (
+            f"generated {day} size={size} seed={seed}",
+            io.StringIO(generate_input_string(day, size, seed)),
+        )
+
+
+def format_comparison(comparison):
+    # Timings are relative to the first engine, usually the reference
+    (baseline, baseline_seconds), *others = comparison.seconds.items()
+    ratios = ", ".join(
+        f"{name} {baseline_seconds / seconds:.2f}x" if seconds else f"{name} -"
+        for name, seconds in others
+    )
+    line = f"{comparison.source} {comparison.star}:"
+    if comparison.matches:
+        return f"{line} ok, {ratios} the speed of {baseline}"
+    answers = ", ".join(
+        f"{name} {answer!r}" for name, answer in comparison.answers.items()
+    )
+    return f"{line} MISMATCH {answers}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run two or more engines of a day on the same inputs and"
+        " report any answers they disagree on."
+    )
+    parser.add_argument("day", help="day to check, e.g. day_12")
+    parser.add_argument(
+        "--engines",
+        nargs="+",
+        default=[REFERENCE_ENGINE, "fast"],
+        help="engines to compare, the first being the one the others are timed"
+        " against (default: reference fast)",
+    )
+    parser.add_argument(
+        "--input",
+        dest="input_paths",
+        type=pathlib.Path,
+        nargs="+",
+        default=[],
+        metavar="PATH",
+    )
+    parser.add_argument(
+        "--generate",
+        type=int,
+        default=0,
+        metavar="COUNT",
+        help="also check COUNT generated inputs, one per seed",
+    )
+    parser.add_argument("--size", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if len(args.engines) < 2:
+        parser.error("--engines needs at least two engines to compare")
+    module = import_day(args.day)
+    try:
+        for name in args.engines:
+            get_engine(module, name)
+    except ValueError as error:
+        parser.error(str(error))
+    if not args.input_paths and not args.generate:
+        args.input_paths = [get_input_path(args.day)]
+
+    mismatches = 0
+    sources = get_sources(
+        args.day, args.input_paths, args.generate, args.size, args.seed
+    )
+    for source, input_file in sources:
+        with input_file:
+            input_string = input_file.read()
+        parsed = parse_for_engines(module, args.engines, input_string)
+        for comparison in compare_engines(module, parsed, args.engines, source):
+            mismatches += not comparison.matches
+            print(format_comparison(comparison), flush=True)
+
+    print(f"{mismatches} mismatches")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+import importlib
+import random
+
+
+def get_generator(day):
+    return importlib.import_module(f"{__name__}.{day}").generate
+
+
+def generate_input(day, size, seed=0):
+    return get_generator(day)(random.Random(seed), size)
+
+
+def write_input(day, size, output_file, seed=0):
+    for chunk in generate_input(day, size, seed):
+        output_file.write(chunk)
+
+
+def generate_input_string(day, size, seed=0):
+    return "".join(generate_input(day, size, seed))
+
+
+DAYS = tuple(f"day_{number:02}" for number in range(1, 16))
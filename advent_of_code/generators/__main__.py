@@ -0,0 +1,38 @@
+import argparse
+import os
+import sys
+
+from advent_of_code.generators import DAYS, write_input
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Write a seeded, synthetic puzzle input of any size."
+    )
+    parser.add_argument("day", choices=DAYS)
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=1000,
+        help="scale of the input: elves, rounds, moves, grid side, packets...",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="-", help="file to write, - for stdout")
+    args = parser.parse_args(argv)
+
+    if args.output == "-":
+        try:
+            write_input(args.day, args.size, sys.stdout, args.seed)
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # The reader stopped early, as day_06 does once it finds its
+            # marker. Point stdout at devnull so the exit flush stays quiet.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    else:
+        with open(args.output, "w") as output_file:
+            write_input(args.day, args.size, output_file, args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+def generate(rng, size):
+    for elf in range(size):
+        if elf:
+            yield "\n"
+        for _ in range(rng.randint(1, 15)):
+            yield f"{rng.randint(1000, 70000)}\n"
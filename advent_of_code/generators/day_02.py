@@ -0,0 +1,3 @@
+def generate(rng, size):
+    for _ in range(size):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}\n"
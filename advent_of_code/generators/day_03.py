@@ -0,0 +1,24 @@
+import string
+
+ITEM_TYPES = string.ascii_lowercase + string.ascii_uppercase
+
+
+def generate_rucksack(rng, badge, pool):
+    # Each rucksack draws its other items from a pool no other group member
+    # uses, so the badge is the only item type all three have in common.
+    shared, *rest = rng.sample(pool, len(pool))
+    first_items, second_items = rest[::2], rest[1::2]
+    compartment_size = rng.randint(3, 16)
+
+    first = [shared, badge] + rng.choices(first_items, k=compartment_size - 2)
+    second = [shared] + rng.choices(second_items, k=compartment_size - 1)
+    rng.shuffle(first)
+    rng.shuffle(second)
+    return "".join(first + second)
+
+
+def generate(rng, size):
+    for _ in range(size):
+        badge, *others = rng.sample(ITEM_TYPES, len(ITEM_TYPES))
+        for pool in (others[0:17], others[17:34], others[34:51]):
+            yield generate_rucksack(rng, badge, pool) + "\n"
@@ -0,0 +1,10 @@
+def generate_section_range(rng):
+    start = rng.randint(1, 99)
+    return start, rng.randint(start, 99)
+
+
+def generate(rng, size):
+    for _ in range(size):
+        first_start, first_stop = generate_section_range(rng)
+        second_start, second_stop = generate_section_range(rng)
+        yield f"{first_start}-{first_stop},{second_start}-{second_stop}\n"
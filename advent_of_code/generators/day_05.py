@@ -0,0 +1,32 @@
+import string
+
+STACK_COUNT = 9
+MAX_STARTING_HEIGHT = 8
+
+
+def generate(rng, size):
+    stacks = [
+        rng.choices(string.ascii_uppercase, k=rng.randint(1, MAX_STARTING_HEIGHT))
+        for _ in range(STACK_COUNT)
+    ]
+
+    for level in range(MAX_STARTING_HEIGHT, 0, -1):
+        cells = [
+            f"[{stack[-level]}]" if len(stack) >= level else "   " for stack in stacks
+        ]
+        if any(cell.strip() for cell in cells):
+            yield " ".join(cells) + "\n"
+    yield " ".join(f" {number} " for number in range(1, STACK_COUNT + 1)) + "\n"
+    yield "\n"
+
+    # Only the stack heights matter for keeping moves valid. Every stack
+    # keeps at least one crate so both stars can read a crate off each top.
+    heights = [len(stack) for stack in stacks]
+    for _ in range(size):
+        sources = [index for index, height in enumerate(heights) if height > 1]
+        frm = rng.choice(sources)
+        to = rng.choice([index for index in range(STACK_COUNT) if index != frm])
+        moves = rng.randint(1, heights[frm] - 1)
+        heights[frm] -= moves
+        heights[to] += moves
+        yield f"move {moves} from {frm + 1} to {to + 1}\n"
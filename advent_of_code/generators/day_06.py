@@ -0,0 +1,27 @@
+import string
+
+MARKER_LENGTH = 14
+CHUNK_SIZE = 64 * 1024
+
+
+def generate(rng, size):
+    size = max(size, MARKER_LENGTH)
+    # Thirteen letters can't form a 14 character marker, so the prefix hides
+    # the start-of-message marker until the planted one.
+    prefix_alphabet = string.ascii_lowercase[:13]
+    marker_start = rng.randint((size - MARKER_LENGTH) // 2, size - MARKER_LENGTH)
+
+    written = 0
+    while written < marker_start:
+        length = min(CHUNK_SIZE, marker_start - written)
+        yield "".join(rng.choices(prefix_alphabet, k=length))
+        written += length
+
+    yield "".join(rng.sample(string.ascii_lowercase, MARKER_LENGTH))
+    written += MARKER_LENGTH
+
+    while written < size:
+        length = min(CHUNK_SIZE, size - written)
+        yield "".join(rng.choices(string.ascii_lowercase, k=length))
+        written += length
+    yield "\n"
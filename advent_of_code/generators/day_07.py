@@ -0,0 +1,54 @@
+import string
+
+MAX_DEPTH = 12
+MAX_SUBDIRECTORIES = 8
+MAX_FILES = 5
+
+
+def generate_name(rng, index):
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8))) + (
+        f".{index}" if index else ""
+    )
+
+
+def split_budget(rng, budget, parts):
+    cuts = sorted(rng.sample(range(1, budget), parts - 1))
+    return [stop - start for start, stop in zip([0] + cuts, cuts + [budget])]
+
+
+def generate_directory(rng, budget, depth):
+    # budget counts this directory plus everything below it
+    remaining = budget - 1
+    if remaining == 0:
+        subdirectory_budgets = []
+    elif depth >= MAX_DEPTH:
+        subdirectory_budgets = [1] * remaining
+    else:
+        parts = min(remaining, rng.randint(1, MAX_SUBDIRECTORIES))
+        subdirectory_budgets = split_budget(rng, remaining, parts)
+
+    # The index suffix keeps every name within a directory unique
+    names = [
+        generate_name(rng, index)
+        for index in range(len(subdirectory_budgets) + rng.randint(0, MAX_FILES))
+    ]
+    subdirectory_names = names[: len(subdirectory_budgets)]
+    entries = [f"dir {name}" for name in subdirectory_names] + [
+        f"{rng.randint(1000, 300000)} {name}"
+        for name in names[len(subdirectory_budgets) :]
+    ]
+    rng.shuffle(entries)
+
+    yield "$ ls\n"
+    for entry in entries:
+        yield entry + "\n"
+
+    for name, subdirectory_budget in zip(subdirectory_names, subdirectory_budgets):
+        yield f"$ cd {name}\n"
+        yield from generate_directory(rng, subdirectory_budget, depth + 1)
+        yield "$ cd ..\n"
+
+
+def generate(rng, size):
+    yield "$ cd /\n"
+    yield from generate_directory(rng, max(size, 1), 0)
@@ -0,0 +1,3 @@
+def generate(rng, size):
+    for _ in range(size):
+        yield "".join(rng.choices("0123456789", k=size)) + "\n"
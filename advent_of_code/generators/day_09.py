@@ -0,0 +1,3 @@
+def generate(rng, size):
+    for _ in range(size):
+        yield f"{rng.choice('LRUD')} {rng.randint(1, 19)}\n"
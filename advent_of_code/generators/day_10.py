@@ -0,0 +1,6 @@
+def generate(rng, size):
+    for _ in range(size):
+        if rng.random() < 0.4:
+            yield "noop\n"
+        else:
+            yield f"addx {rng.randint(-20, 20)}\n"
@@ -0,0 +1,41 @@
+import itertools
+
+MIN_MONKEYS = 4
+
+
+def primes():
+    found = []
+    for candidate in itertools.count(2):
+        if all(candidate % prime for prime in found):
+            found.append(candidate)
+            yield candidate
+
+
+def generate(rng, size):
+    size = max(size, MIN_MONKEYS)
+    divisors = list(itertools.islice(primes(), size))
+    rng.shuffle(divisors)
+    # Without the part two modulus, squaring grows worry levels
+    # exponentially. Only one monkey squares and nobody throws to it, so
+    # each of its items is squared just once.
+    squaring_monkey = rng.randrange(size)
+
+    for monkey in range(size):
+        if monkey:
+            yield "\n"
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        if monkey == squaring_monkey:
+            operation = "old * old"
+        else:
+            operation = f"old {rng.choice('*+')} {rng.randint(1, 19)}"
+        targets = [
+            other for other in range(size) if other not in (monkey, squaring_monkey)
+        ]
+        target_if_true, target_if_false = rng.sample(targets, 2)
+
+        yield f"Monkey {monkey}:\n"
+        yield f"  Starting items: {items}\n"
+        yield f"  Operation: new = {operation}\n"
+        yield f"  Test: divisible by {divisors[monkey]}\n"
+        yield f"    If true: throw to monkey {target_if_true}\n"
+        yield f"    If false: throw to monkey {target_if_false}\n"
@@ -0,0 +1,28 @@
+import string
+
+HEIGHTS = string.ascii_lowercase
+
+
+def generate(rng, size):
+    height = max(size, 1)
+    width = max(len(HEIGHTS), 4 * height)
+    start_row = rng.randrange(height)
+    end_row = rng.randrange(height)
+
+    for row in range(height):
+        line = []
+        for column in range(width):
+            # Heights climb by at most one per column, so walking along the
+            # start row and then along the last column always reaches the
+            # end. Cells off that route may dip below the slope.
+            base = column * (len(HEIGHTS) - 1) // (width - 1)
+            on_route = row == start_row or column == width - 1
+            if not on_route and rng.random() < 0.3:
+                base = rng.randint(0, base)
+            line.append(HEIGHTS[base])
+
+        if row == start_row:
+            line[0] = "S"
+        if row == end_row:
+            line[-1] = "E"
+        yield "".join(line) + "\n"
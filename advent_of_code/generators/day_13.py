@@ -0,0 +1,22 @@
+import json
+
+MAX_DEPTH = 4
+MAX_LENGTH = 5
+
+
+def generate_packet(rng, depth=0):
+    packet = []
+    for _ in range(rng.randint(0, MAX_LENGTH)):
+        if depth < MAX_DEPTH and rng.random() < 0.3:
+            packet.append(generate_packet(rng, depth + 1))
+        else:
+            packet.append(rng.randint(0, 10))
+    return packet
+
+
+def generate(rng, size):
+    for pair in range(size):
+        if pair:
+            yield "\n"
+        for _ in range(2):
+            yield json.dumps(generate_packet(rng), separators=(",", ":")) + "\n"
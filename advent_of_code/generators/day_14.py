@@ -0,0 +1,33 @@
+SAND_SOURCE_X = 500
+
+
+def clamp(value, low, high):
+    return min(high, max(low, value))
+
+
+def generate_path(rng, spread, top, depth):
+    x = rng.randint(SAND_SOURCE_X - spread, SAND_SOURCE_X + spread)
+    y = rng.randint(top, depth)
+    points = [(x, y)]
+    horizontal = rng.random() < 0.5
+    for _ in range(rng.randint(1, 5)):
+        step = rng.choice((-1, 1)) * rng.randint(1, 10)
+        if horizontal:
+            x = clamp(x + step, SAND_SOURCE_X - spread, SAND_SOURCE_X + spread)
+        else:
+            y = clamp(y + step, top, depth)
+        points.append((x, y))
+        horizontal = not horizontal
+    return points
+
+
+def generate(rng, size):
+    # Sand can only pile up to its source on a rock base at least as wide as
+    # twice its depth. Keeping every rock deeper than the rocks are wide
+    # means the first star always ends with sand falling into the abyss.
+    spread = max(10, size // 2)
+    top = spread + 1
+    depth = top + max(10, size)
+    for _ in range(size):
+        points = generate_path(rng, spread, top, depth)
+        yield " -> ".join(f"{x},{y}" for x, y in points) + "\n"
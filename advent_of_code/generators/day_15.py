@@ -0,0 +1,27 @@
+SEARCH_MAX = 4000000
+
+
+def manhattan_distance(x, y, other_x, other_y):
+    return abs(x - other_x) + abs(y - other_y)
+
+
+def generate(rng, size):
+    # Every sensor's exclusion zone stops just short of a hidden point, so
+    # the distress beacon search always has that point available. Whether it
+    # is the only gap depends on how densely the sensors cover the area.
+    hidden_x = rng.randint(0, SEARCH_MAX)
+    hidden_y = rng.randint(0, SEARCH_MAX)
+
+    for _ in range(size):
+        x, y = hidden_x, hidden_y
+        while (x, y) == (hidden_x, hidden_y):
+            x = rng.randint(0, SEARCH_MAX)
+            y = rng.randint(0, SEARCH_MAX)
+
+        hidden_distance = manhattan_distance(x, y, hidden_x, hidden_y)
+        distance = rng.randint(hidden_distance // 2, hidden_distance - 1)
+        dx = rng.randint(-distance, distance)
+        dy = rng.choice((-1, 1)) * (distance - abs(dx))
+        yield (
+            f"Sensor at x={x}, y={y}: " f"closest beacon is at x={x + dx}, y={y + dy}\n"
+        )
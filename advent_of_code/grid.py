@@ -0,0 +1,121 @@
+import array
+import itertools
+
+
+def allocate(typecode, fill, size):
+    if typecode == "B":
+        return bytearray([fill]) * size
+    return array.array(typecode, [fill]) * size
+
+
+class Grid2D:
+    # Cells live row by row in one flat buffer: a bytearray for typecode "B",
+    # otherwise an array. (x_offset, y_offset) is the coordinate of the first
+    # cell, so a grid can cover negative coordinates and grow in any
+    # direction. Hot loops should work on indexes into cells directly.
+    def __init__(self, width, height, typecode="B", fill=0, x_offset=0, y_offset=0):
+        self.width = width
+        self.height = height
+        self.typecode = typecode
+        self.fill = fill
+        self.x_offset = x_offset
+        self.y_offset = y_offset
+        self.cells = allocate(typecode, fill, width * height)
+
+    @classmethod
+    def from_rows(cls, rows, typecode="B"):
+        rows = list(rows)
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError("every row of a grid needs the same length")
+        grid = cls(width, len(rows), typecode)
+        if typecode == "B":
+            grid.cells[:] = b"".join(rows)
+        else:
+            grid.cells[:] = array.array(typecode, itertools.chain.from_iterable(rows))
+        return grid
+
+    @property
+    def x_end(self):
+        return self.x_offset + self.width
+
+    @property
+    def y_end(self):
+        return self.y_offset + self.height
+
+    def contains(self, x, y):
+        return (
+            self.x_offset <= x < self.x_offset + self.width
+            and self.y_offset <= y < self.y_offset + self.height
+        )
+
+    def index(self, x, y):
+        # Unchecked: coordinates outside the grid alias other cells
+        return (y - self.y_offset) * self.width + x - self.x_offset
+
+    def coordinates(self, index):
+        y, x = divmod(index, self.width)
+        return x + self.x_offset, y + self.y_offset
+
+    def get(self, x, y, default=None):
+        if not self.contains(x, y):
+            return default
+        return self.cells[self.index(x, y)]
+
+    def set(self, x, y, value):
+        if not self.contains(x, y):
+            raise IndexError(f"({x}, {y}) is outside the grid")
+        self.cells[self.index(x, y)] = value
+
+    def neighbor_indexes(self, index):
+        # West, east, north, south, skipping those past an edge
+        width = self.width
+        column = index % width
+        if column:
+            yield index - 1
+        if column + 1 < width:
+            yield index + 1
+        if index >= width:
+            yield index - width
+        if index + width < len(self.cells):
+            yield index + width
+
+    def row(self, y):
+        start = (y - self.y_offset) * self.width
+        return self.cells[start : start + self.width]
+
+    def column(self, x):
+        return self.cells[x - self.x_offset :: self.width]
+
+    def rows(self):
+        return (self.row(y) for y in range(self.y_offset, self.y_end))
+
+    def count(self, value):
+        return self.cells.count(value)
+
+    def grow_to_include(self, x, y):
+        # Returns whether the grid grew, which moves every index. Each growth
+        # adds at least half the current size on the side that needed it, so
+        # walking outwards one cell at a time copies each cell O(1) times.
+        if self.contains(x, y):
+            return False
+
+        x_slack, y_slack = max(self.width // 2, 1), max(self.height // 2, 1)
+        x_offset = x - x_slack if x < self.x_offset else self.x_offset
+        x_end = x + 1 + x_slack if x >= self.x_end else self.x_end
+        y_offset = y - y_slack if y < self.y_offset else self.y_offset
+        y_end = y + 1 + y_slack if y >= self.y_end else self.y_end
+
+        width = x_end - x_offset
+        cells = allocate(self.typecode, self.fill, width * (y_end - y_offset))
+        start = (self.y_offset - y_offset) * width + self.x_offset - x_offset
+        for row in range(self.height):
+            cells[start : start + self.width] = self.cells[
+                row * self.width : (row + 1) * self.width
+            ]
+            start += width
+
+        self.cells = cells
+        self.width, self.height = width, y_end - y_offset
+        self.x_offset, self.y_offset = x_offset, y_offset
+        return True
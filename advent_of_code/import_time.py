@@ -0,0 +1,150 @@
+import argparse
+import json
+import pathlib
+import re
+import subprocess
+import sys
+
+from advent_of_code.runner import DAYS_PACKAGE, discover_days
+
+BASELINE_PATH = pathlib.Path("import_time_baseline.json")
+MODULE_FORMAT = f"{DAYS_PACKAGE}.{{day}}"
+TIMER = (
+    "import time; start = time.perf_counter(); import {module};"
+    " print(time.perf_counter() - start)"
+)
+IMPORT_TIME_LINE = re.compile(
+    r"^import time:\s+\d+ \|\s+(?P<cumulative>\d+) \|(?P<indent> +)(?P<name>\S+)$",
+    re.MULTILINE,
+)
+
+
+def measure_import_seconds(module, repeat=5, cwd=None):
+    # Every sample needs a fresh interpreter, since a second import in the
+    # same process is just a sys.modules lookup.
+    return min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", TIMER.format(module=module)],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=cwd,
+            ).stdout
+        )
+        for _ in range(repeat)
+    )
+
+
+def parse_import_times(stderr):
+    for match in IMPORT_TIME_LINE.finditer(stderr):
+        depth = (len(match["indent"]) - 1) // 2
+        yield match["name"], depth, int(match["cumulative"]) / 1e6
+
+
+def trace_imports(statement, cwd=None):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=cwd,
+    )
+    return list(parse_import_times(result.stderr))
+
+
+def heaviest_imports(module, limit=3, cwd=None):
+    startup = {name for name, _, _ in trace_imports("pass", cwd)}
+    # What the module imports directly is where any avoidable cost shows up;
+    # its own parent packages are reported at that depth too, so skip them.
+    imported = [
+        (name, seconds)
+        for name, depth, seconds in trace_imports(f"import {module}", cwd)
+        if depth <= 1
+        and name != module
+        and not module.startswith(f"{name}.")
+        and name not in startup
+    ]
+    imported.sort(key=lambda entry: entry[1], reverse=True)
+    return imported[:limit]
+
+
+def format_row(day, seconds, baseline_seconds=None, heaviest=()):
+    line = f"{day}: {seconds * 1000:8.1f}ms"
+    if baseline_seconds is not None:
+        line += (
+            f"  (before {baseline_seconds * 1000:8.1f}ms,"
+            f" {baseline_seconds / seconds:5.1f}x faster)"
+        )
+    if heaviest:
+        line += "  heaviest: " + ", ".join(
+            f"{name} {module_seconds * 1000:.1f}ms" for name, module_seconds in heaviest
+        )
+    return line
+
+
+def load_baseline(path):
+    path = pathlib.Path(path)
+    return json.loads(path.read_text()) if path.exists() else {}
+
+
+def save_baseline(path, results):
+    # Merged into what's there, so measuring a few days keeps the others,
+    # the before-layout numbers included
+    baseline = load_baseline(path)
+    baseline.update(results)
+    pathlib.Path(path).write_text(json.dumps(baseline, indent=2) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Time a cold import of each day module in a fresh interpreter."
+    )
+    parser.add_argument("days", nargs="*", help="days to measure (default: all)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--module-format",
+        default=MODULE_FORMAT,
+        help="how a day maps to an importable module, e.g. '{day}' for a checkout"
+        " with the days at the top level",
+    )
+    parser.add_argument(
+        "--directory",
+        type=pathlib.Path,
+        default=None,
+        help="directory to import from (default: the current one)",
+    )
+    parser.add_argument("--baseline", type=pathlib.Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--save", action="store_true", help="write the results as the new baseline"
+    )
+    parser.add_argument(
+        "--heaviest",
+        type=int,
+        default=0,
+        metavar="COUNT",
+        help="also list the COUNT slowest modules each day pulls in",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline)
+    results = {}
+    for day in args.days or discover_days():
+        module = args.module_format.format(day=day)
+        seconds = measure_import_seconds(module, args.repeat, args.directory)
+        heaviest = (
+            heaviest_imports(module, args.heaviest, args.directory)
+            if args.heaviest
+            else ()
+        )
+        print(format_row(day, seconds, baseline.get(day), heaviest), flush=True)
+        results[day] = seconds
+
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(f"Saved baseline to {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
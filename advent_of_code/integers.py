@@ -0,0 +1,56 @@
+import array
+import re
+
+from advent_of_code.puzzle_input import input_chunks
+
+SIGNED_INTEGER = re.compile(rb"-?\d+")
+UNSIGNED_INTEGER = re.compile(rb"\d+")
+LINE_START = re.compile(rb"(?m)^")
+
+
+def extract_integers(buffer, signed=True):
+    pattern = SIGNED_INTEGER if signed else UNSIGNED_INTEGER
+    return array.array("q", map(int, pattern.findall(buffer)))
+
+
+def get_row_pattern(columns):
+    # The start of a line holding no integers or exactly columns of them. A
+    # sign is just another separator here, as it never changes how many there
+    # are. Matches are empty, so finding them all copies none of the input.
+    separator = rb"[^\d\n]*"
+    row = separator + (rb"\d+" + separator) * columns
+    return re.compile(rb"(?m)^(?=(?:" + separator + rb"|" + row + rb")$)")
+
+
+def find_ragged_line(chunk, columns):
+    for line_number, line in enumerate(bytes(chunk).split(b"\n")):
+        if len(UNSIGNED_INTEGER.findall(line)) not in (0, columns):
+            return line_number, line
+    return None
+
+
+def read_integer_table(input_file, columns, signed=True):
+    # Every line must hold the same number of integers, or none, so a short
+    # line can't shift the integers after it into other rows
+    row_pattern = get_row_pattern(columns)
+    table = array.array("q")
+    lines_before = 0
+    for chunk in input_chunks(input_file):
+        lines = len(LINE_START.findall(chunk))
+        if len(row_pattern.findall(chunk)) != lines:
+            line_number, line = find_ragged_line(chunk, columns)
+            raise ValueError(
+                f"line {lines_before + line_number + 1} doesn't hold {columns}"
+                f" integers: {line!r}"
+            )
+        table += extract_integers(chunk, signed)
+        lines_before += lines - 1
+    return table
+
+
+def get_column(table, columns, index):
+    return table[index::columns]
+
+
+def iter_rows(table, columns):
+    return zip(*(get_column(table, columns, index) for index in range(columns)))
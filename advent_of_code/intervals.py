@@ -0,0 +1,119 @@
+import bisect
+from dataclasses import dataclass
+
+from advent_of_code import counters
+
+
+@dataclass(frozen=True)
+class InclusiveInterval:
+    min: int
+    max: int
+
+    def __iter__(self):
+        yield from iter(range(self.min, self.max + 1))
+
+    def __contains__(self, item):
+        return self.min <= item <= self.max
+
+    def size(self):
+        return self.max - self.min + 1
+
+    def covers(self, other):
+        return self.min <= other.min and other.max <= self.max
+
+    def overlaps(self, other):
+        return self.min <= other.max and other.min <= self.max
+
+
+class InclusiveIntervalSet:
+    # Disjoint, non-adjacent intervals kept as two parallel sorted lists of
+    # bounds. Every query is a bisect; add and remove replace the affected
+    # run of intervals with one list splice.
+    def __init__(self, iterable=None):
+        self.starts = []
+        self.ends = []
+        if iterable:
+            self.add_all(iterable)
+
+    def add_all(self, intervals):
+        # Sort everything once and merge in a single pass, instead of
+        # splicing interval by interval
+        counting = counters.enabled
+        merged_starts, merged_ends = [], []
+        pending = sorted(
+            [
+                *((interval.min, interval.max) for interval in intervals),
+                *zip(self.starts, self.ends),
+            ]
+        )
+        for start, end in pending:
+            if merged_ends and start <= merged_ends[-1] + 1:
+                if end > merged_ends[-1]:
+                    merged_ends[-1] = end
+                if counting:
+                    counters.add("interval_merges")
+            else:
+                merged_starts.append(start)
+                merged_ends.append(end)
+        self.starts, self.ends = merged_starts, merged_ends
+
+    def add(self, new_interval):
+        # Intervals from lo up to hi touch or overlap the new one
+        lo = bisect.bisect_left(self.ends, new_interval.min - 1)
+        hi = bisect.bisect_right(self.starts, new_interval.max + 1)
+        start, end = new_interval.min, new_interval.max
+        if lo < hi:
+            start = min(start, self.starts[lo])
+            end = max(end, self.ends[hi - 1])
+            if counters.enabled:
+                counters.add("interval_merges", hi - lo)
+        self.starts[lo:hi] = (start,)
+        self.ends[lo:hi] = (end,)
+
+    def remove(self, remove_interval):
+        # Intervals from lo up to hi overlap the removed one
+        lo = bisect.bisect_left(self.ends, remove_interval.min)
+        hi = bisect.bisect_right(self.starts, remove_interval.max)
+        if lo >= hi:
+            return
+
+        starts, ends = [], []
+        if self.starts[lo] < remove_interval.min:
+            starts.append(self.starts[lo])
+            ends.append(remove_interval.min - 1)
+        if remove_interval.max < self.ends[hi - 1]:
+            starts.append(remove_interval.max + 1)
+            ends.append(self.ends[hi - 1])
+        self.starts[lo:hi] = starts
+        self.ends[lo:hi] = ends
+
+    def find(self, value):
+        # Index of the interval holding value, or -1
+        index = bisect.bisect_right(self.starts, value) - 1
+        if index >= 0 and value <= self.ends[index]:
+            return index
+        return -1
+
+    def __contains__(self, value):
+        return self.find(value) >= 0
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        return map(InclusiveInterval, self.starts, self.ends)
+
+    @property
+    def intervals(self):
+        return list(self)
+
+    def size(self):
+        return sum(self.ends) - sum(self.starts) + len(self.starts)
+
+    def first_gap(self, within_interval):
+        # Intervals never touch, so the value just past the one covering
+        # within_interval.min is always uncovered
+        value = within_interval.min
+        if (index := self.find(value)) >= 0:
+            value = self.ends[index] + 1
+        return value if value <= within_interval.max else None
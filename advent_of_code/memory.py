@@ -0,0 +1,168 @@
+import threading
+import tracemalloc
+from dataclasses import dataclass, field
+
+
+from advent_of_code.profiling import PHASES
+
+SAMPLE_INTERVAL = 0.05
+CLEAR_REFS = "/proc/self/clear_refs"
+PROCESS_STATUS = "/proc/self/status"
+
+
+@dataclass
+class AllocationSite:
+    location: str
+    size_bytes: int
+    blocks: int
+
+
+@dataclass
+class MemoryReport:
+    phase: str
+    peak_bytes: int
+    retained_bytes: int
+    retained_blocks: int
+    top_sites: list[AllocationSite] = field(default_factory=list)
+
+
+def format_bytes(size):
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+class PeakSnapshotSampler(threading.Thread):
+    # tracemalloc only reports the size of the peak, not where it came from,
+    # so snapshots are sampled while the phase runs and the largest is kept.
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.stopped = threading.Event()
+        self.snapshot = None
+        self.snapshot_size = -1
+
+    def sample(self):
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.snapshot_size:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = current
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        self.sample()
+
+
+def get_top_sites(snapshot, baseline, limit):
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, threading.__file__),
+        tracemalloc.Filter(False, "*/_weakrefset.py"),
+        tracemalloc.Filter(False, __file__),
+    ]
+    differences = snapshot.filter_traces(filters).compare_to(
+        baseline.filter_traces(filters), "lineno"
+    )
+    differences.sort(key=lambda difference: difference.size_diff, reverse=True)
+    return [
+        AllocationSite(
+            f"{difference.traceback[0].filename}:{difference.traceback[0].lineno}",
+            difference.size_diff,
+            difference.count_diff,
+        )
+        for difference in differences[:limit]
+        if difference.size_diff > 0
+    ]
+
+
+def trace_call(phase, function, *args, top=5):
+    baseline = tracemalloc.take_snapshot()
+    start_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+
+    sampler = PeakSnapshotSampler()
+    sampler.start()
+    try:
+        result = function(*args)
+    finally:
+        sampler.stop()
+
+    end_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    end_snapshot = tracemalloc.take_snapshot()
+    retained = end_snapshot.compare_to(baseline, "filename")
+    report = MemoryReport(
+        phase,
+        peak_bytes - start_bytes,
+        end_bytes - start_bytes,
+        sum(difference.count_diff for difference in retained),
+        get_top_sites(sampler.snapshot, baseline, top),
+    )
+    return result, report
+
+
+def trace_day(module, input_file, top=5):
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        parsed, parse_report = trace_call("parse", module.parse, input_file, top=top)
+        reports = [parse_report]
+        answers = []
+        for phase in PHASES[1:]:
+            star = getattr(module, f"solve_{phase}")
+            answer, report = trace_call(phase, star, parsed, top=top)
+            answers.append(answer)
+            reports.append(report)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    return tuple(answers), reports
+
+
+def get_rss_status(field):
+    try:
+        with open(PROCESS_STATUS) as status:
+            for line in status:
+                if line.startswith(f"{field}:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def reset_peak_rss():
+    # Linux lets a process reset its resident set high-water mark (VmHWM),
+    # which is what makes a peak per phase possible without tracing. The
+    # resident set size it starts from, or None where it can't be reset.
+    try:
+        with open(CLEAR_REFS, "w") as clear_refs:
+            clear_refs.write("5")
+    except OSError:
+        return None
+    return get_rss_status("VmRSS")
+
+
+def get_peak_rss_bytes():
+    return get_rss_status("VmHWM")
+
+
+def format_report(report):
+    lines = [
+        f"  {report.phase}: peak {format_bytes(report.peak_bytes)},"
+        f" retained {format_bytes(report.retained_bytes)}"
+        f" in {report.retained_blocks} blocks"
+    ]
+    for site in report.top_sites:
+        lines.append(
+            f"    {format_bytes(site.size_bytes):>10} {site.blocks:>8} blocks"
+            f"  {site.location}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,52 @@
+import datetime
+import json
+import platform
+
+from advent_of_code.runner import STAR_NAMES
+
+
+def get_run_context():
+    # Shared by every record of a run, so runs can be charted over time and
+    # told apart across machines
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "host": platform.node(),
+        "python": platform.python_version(),
+    }
+
+
+def get_star_records(result, context=None):
+    timings = result.timings or {}
+    memory_reports = {report.phase: report for report in result.memory_reports or ()}
+    peak_rss_bytes = result.peak_rss_bytes or {}
+    for index, star in enumerate(STAR_NAMES):
+        # None when the star wasn't run (a cached answer) or couldn't be
+        # measured on its own
+        peak_bytes = peak_bytes_source = None
+        if report := memory_reports.get(star):
+            peak_bytes, peak_bytes_source = report.peak_bytes, "tracemalloc"
+        elif star in peak_rss_bytes:
+            peak_bytes, peak_bytes_source = peak_rss_bytes[star], "peak_rss"
+        yield {
+            **(context or {}),
+            "day": result.day,
+            "star": star,
+            "answer": result.answers[index] if index < len(result.answers) else None,
+            "error": result.error,
+            "cached": result.cached,
+            "parse_seconds": timings.get("parse"),
+            "solve_seconds": timings.get(star),
+            "peak_bytes": peak_bytes,
+            "peak_bytes_source": peak_bytes_source,
+            "input_bytes": result.input_bytes,
+            "input_digest": result.input_digest,
+            "counters": (result.counters or {}).get(star),
+        }
+
+
+def format_record(record):
+    return json.dumps(record, default=str)
+
+
+def format_records(records):
+    return json.dumps(list(records), indent=2, default=str)
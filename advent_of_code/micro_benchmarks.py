@@ -0,0 +1,54 @@
+import random
+
+from advent_of_code.intervals import InclusiveInterval, InclusiveIntervalSet
+
+DEFAULT_SIZE = 10000
+
+
+def random_intervals(rng, count, span):
+    # Lengths average half the spacing, leaving the set about a third
+    # covered and fragmented into many intervals
+    mean_length = span // count // 2
+    for _ in range(count):
+        start = rng.randrange(span)
+        yield InclusiveInterval(start, start + rng.randrange(2 * mean_length + 1))
+
+
+def get_interval_cases(size=DEFAULT_SIZE, seed=0):
+    rng = random.Random(seed)
+    span = size * 100
+    intervals = list(random_intervals(rng, size, span))
+    points = [rng.randrange(span) for _ in range(size)]
+    interval_set = InclusiveIntervalSet(intervals)
+
+    def add_one_by_one():
+        incremental_set = InclusiveIntervalSet()
+        for interval in intervals:
+            incremental_set.add(interval)
+
+    def build_in_bulk():
+        InclusiveIntervalSet(intervals)
+
+    def remove_points():
+        punctured_set = InclusiveIntervalSet()
+        punctured_set.starts = interval_set.starts.copy()
+        punctured_set.ends = interval_set.ends.copy()
+        for point in points:
+            punctured_set.remove(InclusiveInterval(point, point))
+
+    def contains():
+        for point in points:
+            point in interval_set
+
+    def first_gap():
+        for point in points:
+            interval_set.first_gap(InclusiveInterval(point, span))
+
+    yield f"intervals.add.{size}", add_one_by_one
+    yield f"intervals.bulk.{size}", build_in_bulk
+    yield f"intervals.remove.{size}", remove_points
+    yield f"intervals.contains.{size}", contains
+    yield f"intervals.first_gap.{size}", first_gap
+
+
+SUITES = {"intervals": get_interval_cases}
@@ -0,0 +1,43 @@
+import cProfile
+import pathlib
+import pstats
+import time
+
+PHASES = ("parse", "first_star", "second_star")
+
+
+def profile_call(function, *args):
+    profiler = cProfile.Profile()
+    start = time.perf_counter()
+    result = profiler.runcall(function, *args)
+    return result, profiler, time.perf_counter() - start
+
+
+def write_summary(summary_file, phase, seconds, profiler, sort_key, limit):
+    summary_file.write(f"{'=' * 30} {phase} ({seconds:.3f}s) {'=' * 30}\n")
+    stats = pstats.Stats(profiler, stream=summary_file)
+    stats.strip_dirs().sort_stats(sort_key).print_stats(limit)
+
+
+def profile_day(
+    module, day, input_file, output_directory, sort_key="cumulative", limit=25
+):
+    output_directory = pathlib.Path(output_directory)
+    output_directory.mkdir(parents=True, exist_ok=True)
+
+    parsed, parse_profiler, parse_seconds = profile_call(module.parse, input_file)
+    profiles = [("parse", parse_profiler, parse_seconds)]
+    answers = []
+    for phase in PHASES[1:]:
+        answer, profiler, seconds = profile_call(
+            getattr(module, f"solve_{phase}"), parsed
+        )
+        answers.append(answer)
+        profiles.append((phase, profiler, seconds))
+
+    with (output_directory / f"{day}.txt").open("w") as summary_file:
+        for phase, profiler, seconds in profiles:
+            profiler.dump_stats(output_directory / f"{day}.{phase}.pstats")
+            write_summary(summary_file, phase, seconds, profiler, sort_key, limit)
+
+    return tuple(answers), {phase: seconds for phase, _, seconds in profiles}
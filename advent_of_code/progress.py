@@ -0,0 +1,37 @@
+import sys
+import time
+
+INTERVAL = 1.0
+
+# Off by default. Long loops check enabled once, into a local, and only
+# call report() when it was set, so a disabled reporter costs them nothing.
+enabled = False
+interval = INTERVAL
+output = None
+last_reported = {}
+
+
+def enable(report_interval=INTERVAL, report_output=None):
+    global enabled, interval, output
+    enabled, interval, output = True, report_interval, report_output
+    last_reported.clear()
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+def report(label, done, total=None):
+    # At most one line per label per interval, the first an interval after
+    # the label's first report, so quick loops never print anything
+    now = time.monotonic()
+    if label not in last_reported:
+        last_reported[label] = now
+        return
+    if now - last_reported[label] < interval:
+        return
+    last_reported[label] = now
+
+    count = f"{done}/{total} ({done / total:.0%})" if total else f"{done}"
+    print(f"{label}: {count}", file=output or sys.stderr, flush=True)
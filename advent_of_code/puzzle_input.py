@@ -0,0 +1,93 @@
+import contextlib
+import importlib
+import io
+import mmap
+import os
+import pathlib
+import stat
+import sys
+
+STDIN = "-"
+# Suffix to the stdlib module whose open() decompresses it
+COMPRESSED_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma"}
+CHUNK_SIZE = 1024 * 1024
+
+
+def open_input(path):
+    if str(path) == STDIN:
+        return sys.stdin
+    path = pathlib.Path(path)
+    if (codec := COMPRESSED_SUFFIXES.get(path.suffix)) is not None:
+        return importlib.import_module(codec).open(path, "rt")
+    return path.open()
+
+
+def stripped_input_lines(input_file):
+    return (line.strip() for line in input_file)
+
+
+def get_mappable_fileno(input_file):
+    raw = getattr(getattr(input_file, "buffer", input_file), "raw", None)
+    if not isinstance(raw, io.FileIO):
+        return None
+
+    try:
+        if input_file.tell() != 0:
+            return None
+    except OSError:  # text files refuse tell() while being iterated
+        return None
+
+    fileno = raw.fileno()
+    file_stat = os.fstat(fileno)
+    if not stat.S_ISREG(file_stat.st_mode) or file_stat.st_size == 0:
+        return None  # pipes, devices and empty files can't be mapped
+
+    return fileno
+
+
+def stripped_input_byte_lines(input_file):
+    with input_file:
+        fileno = get_mappable_fileno(input_file)
+        if fileno is None:
+            for line in input_file:
+                if isinstance(line, str):
+                    line = line.encode()
+                yield line.strip()
+            return
+
+        with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as buffer:
+            start, end = 0, len(buffer)
+            while start < end:
+                stop = buffer.find(b"\n", start)
+                if stop == -1:
+                    stop = end
+                yield buffer[start:stop].strip()
+                start = stop + 1
+
+
+@contextlib.contextmanager
+def input_buffer(input_file):
+    with input_file:
+        fileno = get_mappable_fileno(input_file)
+        if fileno is None:
+            contents = input_file.read()
+            yield contents.encode() if isinstance(contents, str) else contents
+            return
+
+        with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def input_chunks(input_file, size=CHUNK_SIZE):
+    # Chunks end on line boundaries, so nothing on a line is split between
+    # two of them. A mappable file is a single chunk.
+    with input_file:
+        fileno = get_mappable_fileno(input_file)
+        if fileno is not None:
+            with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as buffer:
+                yield buffer
+            return
+
+        while lines := input_file.readlines(size):
+            chunk = "".join(lines) if isinstance(lines[0], str) else b"".join(lines)
+            yield chunk.encode() if isinstance(chunk, str) else chunk
@@ -0,0 +1,464 @@
+import argparse
+import importlib
+import os
+import pathlib
+import pickle
+import sys
+import time
+from dataclasses import dataclass
+
+from advent_of_code import counters
+from advent_of_code.cache import (
+    CACHE_DIRECTORY,
+    MISSING,
+    PARSED_MAX_BYTES,
+    DiskCache,
+    evict_stale_entries,
+    file_digest,
+    get_cache_key,
+    parser_digest,
+    solver_digest,
+)
+from advent_of_code.puzzle_input import COMPRESSED_SUFFIXES, STDIN, open_input
+
+DAYS_PACKAGE = __package__
+DAYS_DIRECTORY = pathlib.Path(__file__).resolve().parent
+DAY_MODULE_GLOB = "day_[0-9][0-9].py"
+STAR_NAMES = ("first_star", "second_star")
+REFERENCE_ENGINE = "reference"
+
+
+@dataclass(frozen=True)
+class RunOptions:
+    input_directory: pathlib.Path = pathlib.Path("input")
+    use_cache: bool = True
+    cache_directory: pathlib.Path = CACHE_DIRECTORY
+    profile_directory: pathlib.Path = None
+    trace_memory: bool = False
+    input_path: pathlib.Path = None
+    timeout: float = None
+    engine: str = REFERENCE_ENGINE
+    count_operations: bool = False
+    # Hashing a large input costs a full read, so it's only done for the
+    # cache or when asked, as metrics records are
+    digest_input: bool = False
+
+
+@dataclass
+class DayResult:
+    day: str
+    answers: tuple = ()
+    seconds: float = 0.0
+    error: str = None
+    cached: bool = False
+    phase_seconds: dict = None
+    memory_reports: list = None
+    # Parse and star seconds in every mode but --memory, where tracing
+    # would distort them
+    timings: dict = None
+    # Each phase's resident set peak, where the platform can reset it
+    peak_rss_bytes: dict = None
+    input_bytes: int = None
+    input_digest: str = None
+    counters: dict = None
+
+
+def discover_days(directory=DAYS_DIRECTORY):
+    return sorted(path.stem for path in pathlib.Path(directory).glob(DAY_MODULE_GLOB))
+
+
+def import_day(day):
+    return importlib.import_module(f"{DAYS_PACKAGE}.{day}")
+
+
+def get_input_path(day, input_directory="input"):
+    return pathlib.Path(input_directory, day).with_suffix(".txt")
+
+
+def get_day_input_path(day, options):
+    if options.input_path is not None:
+        return pathlib.Path(options.input_path)
+    return get_input_path(day, options.input_directory)
+
+
+def parse_with_cache(module, day, input_path, input_digest, options):
+    # Engines sharing the day's parse share its cached parses too
+    entry_point, parse_day = "parse", day
+    if options.engine in getattr(module, "engine_parsers", {}):
+        entry_point = get_parser(module, options.engine).__name__
+        parse_day = get_engine_day(day, options.engine)
+    digest = parser_digest(module, entry_point)
+    key = get_cache_key(parse_day, input_digest, digest)
+    cache = DiskCache(options.cache_directory / "parsed", PARSED_MAX_BYTES)
+    if (parsed := cache.get(key)) is not MISSING:
+        return parsed
+
+    parsed = get_parser(module, options.engine)(open_input(input_path))
+    try:
+        cache.put(key, parsed)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        pass  # not every parsed structure can be serialized
+    else:
+        evict_stale_entries(cache, parse_day, digest)
+    return parsed
+
+
+def get_engines(module):
+    # A day's solve_first_star and solve_second_star are its reference
+    # engine. Days can offer other implementations of the two stars in an
+    # engines dict, to be picked by name and checked against the reference.
+    return {
+        REFERENCE_ENGINE: (module.solve_first_star, module.solve_second_star),
+        **getattr(module, "engines", {}),
+    }
+
+
+def get_engine(module, name=REFERENCE_ENGINE):
+    engines = get_engines(module)
+    if name not in engines:
+        raise ValueError(
+            f"{module.__name__} has no {name!r} engine, only {', '.join(engines)}"
+        )
+    return engines[name]
+
+
+def get_parser(module, engine=REFERENCE_ENGINE):
+    # An engine can bring its own parse, from an engine_parsers dict, when
+    # its stars want a parsed structure of their own. Otherwise it shares
+    # the day's parse.
+    return getattr(module, "engine_parsers", {}).get(engine, module.parse)
+
+
+def get_engine_day(day, engine=REFERENCE_ENGINE):
+    # Cached answers and parses are kept apart per engine, so they never
+    # stand in for another engine's
+    return day if engine == REFERENCE_ENGINE else f"{day}.{engine}"
+
+
+def solve_stars(
+    module,
+    parsed,
+    timeout=None,
+    engine=REFERENCE_ENGINE,
+    star_kwargs=({}, {}),
+    peaks=None,
+):
+    # The answers, and the seconds each star took. Given peaks, a dict, each
+    # star's resident set peak above where it started goes in it too, but not
+    # for stars run under a timeout, in a child process.
+    if timeout is not None:
+        from advent_of_code.timeouts import call_with_timeout
+    if peaks is not None:
+        from advent_of_code.memory import get_peak_rss_bytes, reset_peak_rss
+
+    answers, star_seconds = [], {}
+    stars = zip(STAR_NAMES, get_engine(module, engine), star_kwargs)
+    for name, star, kwargs in stars:
+        if counters.enabled:
+            counters.begin(name)
+        start_rss = None
+        if peaks is not None and timeout is None:
+            start_rss = reset_peak_rss()
+        start = time.perf_counter()
+        if timeout is None:
+            answers.append(star(parsed, **kwargs))
+        else:
+            answers.append(call_with_timeout(star, (parsed,), timeout, kwargs))
+        star_seconds[name] = time.perf_counter() - start
+        if start_rss is not None:
+            peaks[name] = get_peak_rss_bytes() - start_rss
+    return tuple(answers), star_seconds
+
+
+def solve_with_cache(module, day, input_path, input_digest, options, peaks=None):
+    digest = solver_digest(module)
+    engine_day = get_engine_day(day, options.engine)
+    key = get_cache_key(engine_day, input_digest, digest)
+    cache = DiskCache(options.cache_directory / "answers")
+    if (answers := cache.get(key)) is not MISSING:
+        return answers, True, {}
+
+    start = time.perf_counter()
+    parsed = parse_with_cache(module, day, input_path, input_digest, options)
+    phase_seconds = {"parse": time.perf_counter() - start}
+    answers, star_seconds = solve_stars(
+        module, parsed, options.timeout, options.engine, peaks=peaks
+    )
+    cache.put(key, answers)
+    evict_stale_entries(cache, engine_day, digest)
+    return answers, False, phase_seconds | star_seconds
+
+
+def run_day(day, options=RunOptions()):
+    start = time.perf_counter()
+    cached = False
+    timings = None
+    phase_seconds = None
+    memory_reports = None
+    input_bytes = input_digest = None
+    peaks = {}
+    if options.count_operations:
+        counters.enable()
+    try:
+        module = import_day(day)
+        input_path = get_day_input_path(day, options)
+        use_cache = (
+            options.use_cache
+            and options.profile_directory is None
+            and not options.trace_memory
+            and not options.count_operations
+        )
+        if str(input_path) != STDIN:
+            input_bytes = os.path.getsize(input_path)
+            if use_cache or options.digest_input:
+                input_digest = file_digest(input_path)
+
+        if options.profile_directory is not None:
+            from advent_of_code.profiling import profile_day
+
+            answers, phase_seconds = profile_day(
+                module, day, open_input(input_path), options.profile_directory
+            )
+            timings = phase_seconds
+        elif options.trace_memory:
+            from advent_of_code.memory import trace_day
+
+            answers, memory_reports = trace_day(module, open_input(input_path))
+        elif use_cache and input_digest is not None:
+            answers, cached, timings = solve_with_cache(
+                module, day, input_path, input_digest, options, peaks
+            )
+        else:
+            if options.count_operations:
+                counters.begin("parse")
+            parse_start = time.perf_counter()
+            parsed = get_parser(module, options.engine)(open_input(input_path))
+            timings = {"parse": time.perf_counter() - parse_start}
+            answers, star_seconds = solve_stars(
+                module, parsed, options.timeout, options.engine, peaks=peaks
+            )
+            timings |= star_seconds
+        if decode_answers := getattr(module, "decode_answers", None):
+            answers = decode_answers(*answers)
+    except Exception as error:
+        return DayResult(
+            day,
+            seconds=time.perf_counter() - start,
+            error=repr(error),
+            input_bytes=input_bytes,
+            input_digest=input_digest,
+        )
+    finally:
+        counters.disable()
+
+    return DayResult(
+        day,
+        answers,
+        time.perf_counter() - start,
+        cached=cached,
+        phase_seconds=phase_seconds,
+        memory_reports=memory_reports,
+        timings=timings,
+        peak_rss_bytes=peaks,
+        input_bytes=input_bytes,
+        input_digest=input_digest,
+        counters=(
+            {phase: dict(counts) for phase, counts in counters.phases.items()}
+            if options.count_operations
+            else None
+        ),
+    )
+
+
+def run_days(days, options=RunOptions(), jobs=None):
+    jobs = jobs or os.cpu_count() or 1
+    if len(days) == 1 or jobs == 1:
+        yield from (run_day(day, options) for day in days)
+        return
+
+    import concurrent.futures
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(run_day, day, options) for day in days]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+
+def format_result(result):
+    cached = ", cached" if result.cached else ""
+    lines = [f"{result.day} ({result.seconds:.3f}s{cached})"]
+    if result.phase_seconds:
+        lines.append(
+            "  "
+            + ", ".join(
+                f"{phase} {seconds:.3f}s"
+                for phase, seconds in result.phase_seconds.items()
+            )
+        )
+    if result.memory_reports:
+        from advent_of_code.memory import format_report
+
+        lines.extend(format_report(report) for report in result.memory_reports)
+    if result.counters:
+        lines.extend(
+            f"  {phase} counters: {counters.format_counts(counts)}"
+            for phase, counts in result.counters.items()
+            if counts
+        )
+    if result.error is not None:
+        lines.append(f"  Failed: {result.error}")
+    else:
+        for star, answer in zip(("First", "Second"), result.answers):
+            lines.append(f"  {star} star answer: {answer}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Solve every day (or the given days) across a process pool."
+    )
+    parser.add_argument(
+        "days", nargs="*", help="days to run, e.g. day_01 (default: all)"
+    )
+    parser.add_argument("--input-directory", type=pathlib.Path, default="input")
+    parser.add_argument(
+        "--input",
+        dest="input_path",
+        type=pathlib.Path,
+        metavar="PATH",
+        help="input for a single day instead of the input directory: a file,"
+        f" a {'/'.join(COMPRESSED_SUFFIXES)} compressed file, or {STDIN} for stdin",
+    )
+    parser.add_argument("--jobs", type=int, default=None)
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="always solve, ignoring and not updating the answer cache",
+    )
+    parser.add_argument("--cache-directory", type=pathlib.Path, default=CACHE_DIRECTORY)
+    modes = parser.add_mutually_exclusive_group()
+    modes.add_argument(
+        "--profile",
+        dest="profile_directory",
+        type=pathlib.Path,
+        metavar="DIRECTORY",
+        help="profile parse and each star, writing .pstats files and a summary",
+    )
+    modes.add_argument(
+        "--memory",
+        dest="trace_memory",
+        action="store_true",
+        help="trace parse and each star with tracemalloc, reporting peak memory"
+        " and the top allocation sites",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SECONDS",
+        help="fail a star that runs longer than this, killing any processes"
+        " it started",
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="report the progress of long loops on stderr about once a second",
+    )
+    parser.add_argument(
+        "--counters",
+        dest="count_operations",
+        action="store_true",
+        help="count each solver's core operations, like nodes popped or grains"
+        " dropped, and report them with the answers (skips the answer cache)",
+    )
+    parser.add_argument(
+        "--engine",
+        default=REFERENCE_ENGINE,
+        help="implementation of the stars to run, for days that offer several",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "json", "ndjson"),
+        default="text",
+        help="json and ndjson print a record per day and star with its answer,"
+        " timings, peak memory and input size and digest",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="keep running, re-solving a day whenever its input or code changes",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=0.5,
+        metavar="SECONDS",
+        help="how often --watch checks for changes",
+    )
+    args = parser.parse_args(argv)
+
+    options = RunOptions(
+        args.input_directory,
+        args.use_cache,
+        args.cache_directory,
+        args.profile_directory,
+        args.trace_memory,
+        args.input_path,
+        args.timeout,
+        args.engine,
+        args.count_operations,
+        digest_input=args.format != "text",
+    )
+    days = args.days or discover_days()
+    if args.input_path is not None and len(days) != 1:
+        parser.error("--input needs exactly one day")
+    if args.engine != REFERENCE_ENGINE and (
+        args.profile_directory is not None or args.trace_memory
+    ):
+        parser.error("--profile and --memory only run the reference engine")
+    if args.count_operations and (
+        args.profile_directory is not None
+        or args.trace_memory
+        or args.timeout is not None
+    ):
+        parser.error("--counters can't count under --profile, --memory or --timeout")
+    if args.progress:
+        from advent_of_code import progress
+
+        progress.enable()
+    if args.watch:
+        if str(args.input_path) == STDIN:
+            parser.error("--watch can't watch stdin")
+        from advent_of_code.watch import watch
+
+        return watch(days, options, args.poll_interval)
+
+    if args.format != "text":
+        from advent_of_code import metrics
+
+        context = metrics.get_run_context()
+    start = time.perf_counter()
+    failed = False
+    records = []
+    for result in run_days(days, options, args.jobs):
+        failed |= result.error is not None
+        if args.format == "text":
+            print(format_result(result), flush=True)
+            continue
+        day_records = metrics.get_star_records(result, context)
+        if args.format == "ndjson":
+            for record in day_records:
+                print(metrics.format_record(record), flush=True)
+        else:
+            records.extend(day_records)
+
+    if args.format == "json":
+        print(metrics.format_records(records))
+    elif args.format == "text":
+        print(f"Total wall time: {time.perf_counter() - start:.3f}s")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+import multiprocessing
+import os
+import signal
+
+
+class StarTimeout(TimeoutError):
+    pass
+
+
+def run_in_process_group(connection, function, args, kwargs):
+    # A group of its own lets the parent kill this process together with
+    # any workers it starts, like day_15's, in one signal
+    os.setpgid(0, 0)
+    try:
+        result = "answer", function(*args, **kwargs)
+    except Exception as error:
+        result = "error", error
+    try:
+        connection.send(result)
+    except Exception as error:  # an unpicklable answer or error
+        connection.send(("error", RuntimeError(repr(error))))
+    connection.close()
+
+
+def call_with_timeout(function, args, timeout, kwargs=None):
+    # Forked, so args (a parsed input) are inherited rather than pickled
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=run_in_process_group, args=(sender, function, args, kwargs or {})
+    )
+    process.start()
+    sender.close()
+    try:
+        # Set from both sides, so the group exists whenever the kill comes
+        os.setpgid(process.pid, process.pid)
+    except OSError:
+        pass  # the child got there first
+
+    try:
+        if not receiver.poll(timeout):
+            raise StarTimeout(f"{function.__name__} took over {timeout}s")
+        kind, value = receiver.recv()
+    except EOFError:
+        process.join()
+        raise RuntimeError(
+            f"{function.__name__} exited with code {process.exitcode}"
+        ) from None
+    finally:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass  # the whole group has already exited
+        process.join()
+        receiver.close()
+
+    if kind == "error":
+        raise value
+    return value
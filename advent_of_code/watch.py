@@ -0,0 +1,123 @@
+import importlib
+import inspect
+import os
+import sys
+import time
+from collections import defaultdict
+
+from advent_of_code.cache import get_local_dependencies
+from advent_of_code.puzzle_input import STDIN
+from advent_of_code.runner import (
+    DayResult,
+    format_result,
+    get_day_input_path,
+    import_day,
+    run_days,
+)
+
+POLL_INTERVAL = 0.5
+
+
+def get_signature(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def get_module_path(name):
+    return os.path.abspath(inspect.getfile(sys.modules[name]))
+
+
+def reload_in_dependency_order(names):
+    # A module's transitive dependencies always number fewer than its own,
+    # so sorting on that count reloads every dependency before its users
+    # and they pick up the new definitions with their imports.
+    depths = {name: len(get_local_dependencies(sys.modules[name])) for name in names}
+    for name in sorted(names, key=lambda name: (depths[name], name)):
+        importlib.reload(sys.modules[name])
+
+
+class Watcher:
+    # Polls the stat signature (mtime and size) of every input and module
+    # each watched day depends on. A stat per file per poll keeps it idle
+    # between changes, however long it sleeps.
+    def __init__(self, days, options):
+        self.days = days
+        self.options = options
+        self.watched = {}
+        self.modules = {}
+        self.signatures = {}
+        self.refresh()
+
+    def refresh(self):
+        watched = defaultdict(set)
+        modules = {}
+        for day in self.days:
+            input_path = get_day_input_path(day, self.options)
+            if str(input_path) == STDIN:
+                raise ValueError("stdin can't be watched for changes")
+            watched[os.path.abspath(input_path)].add(day)
+
+            module = import_day(day)
+            for name in [module.__name__, *get_local_dependencies(module)]:
+                path = get_module_path(name)
+                watched[path].add(day)
+                modules[path] = name
+
+        self.watched, self.modules = dict(watched), modules
+        self.signatures = {
+            path: self.signatures.get(path, get_signature(path)) for path in watched
+        }
+
+    def poll(self):
+        changed = []
+        for path, signature in self.signatures.items():
+            if (current := get_signature(path)) != signature:
+                self.signatures[path] = current
+                changed.append(path)
+        if not changed:
+            return [], []
+
+        days = sorted(set().union(*(self.watched[path] for path in changed)))
+        errors = []
+        if changed_modules := [self.modules[p] for p in changed if p in self.modules]:
+            # Reload what changed plus everything depending on it in the
+            # affected days, which still hold the old definitions
+            to_reload = set(changed_modules)
+            for day in days:
+                module = import_day(day)
+                dependencies = get_local_dependencies(module)
+                if to_reload.intersection(dependencies):
+                    to_reload.update(dependencies)
+                to_reload.add(module.__name__)
+            try:
+                reload_in_dependency_order(to_reload)
+                self.refresh()
+            except Exception as error:
+                errors = [DayResult(day, error=repr(error)) for day in days]
+        return days, errors
+
+    def run(self, days):
+        return list(run_days(days, self.options, jobs=1))
+
+
+def watch(days, options, interval=POLL_INTERVAL, output=sys.stdout, max_polls=None):
+    watcher = Watcher(days, options)
+    for result in watcher.run(days):
+        print(format_result(result), file=output, flush=True)
+    print(f"Watching {len(watcher.watched)} files for changes", file=output, flush=True)
+
+    polls = 0
+    try:
+        while max_polls is None or polls < max_polls:
+            time.sleep(interval)
+            polls += 1
+            changed_days, errors = watcher.poll()
+            results = errors or (watcher.run(changed_days) if changed_days else [])
+            for result in results:
+                print(format_result(result), file=output, flush=True)
+    except KeyboardInterrupt:
+        pass
+    return 0
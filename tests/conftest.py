@@ -0,0 +1,105 @@
+import pathlib
+
+import pytest
+
+from advent_of_code import day_01
+from advent_of_code.budget import (
+    BASELINE_PATH,
+    TOLERANCE,
+    check_budget,
+    load_baseline,
+    measure_star,
+    save_baseline,
+    write_report,
+)
+from advent_of_code.runner import RunOptions, get_input_path
+
+BUDGET_RESULTS = pytest.StashKey[list]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("budget", "per-star time and peak-memory budgets")
+    group.addoption(
+        "--budget",
+        action="store_true",
+        help="run the budget tests, which solve every real input",
+    )
+    group.addoption(
+        "--budget-baseline",
+        type=pathlib.Path,
+        default=BASELINE_PATH,
+        help="stored measurements the budgets are derived from",
+    )
+    group.addoption(
+        "--budget-tolerance",
+        type=float,
+        default=TOLERANCE,
+        help="allowed growth over the baseline before a star fails, as a fraction",
+    )
+    group.addoption(
+        "--budget-save",
+        action="store_true",
+        help="write the measurements as the new baseline instead of checking them",
+    )
+    group.addoption(
+        "--budget-report",
+        type=pathlib.Path,
+        help="write every star's measurement and verdict to this JSON file",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "budget: checks a star against its time and peak-memory budget"
+    )
+    config.stash[BUDGET_RESULTS] = []
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--budget"):
+        return
+    skip = pytest.mark.skip(reason="budget tests only run with --budget")
+    for item in items:
+        if "budget" in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    results = config.stash[BUDGET_RESULTS]
+    if not results:
+        return
+    if config.getoption("--budget-save"):
+        save_baseline(
+            config.getoption("--budget-baseline"),
+            [result.measurement for result in results],
+        )
+    if report_path := config.getoption("--budget-report"):
+        write_report(report_path, results, config.getoption("--budget-tolerance"))
+
+
+@pytest.fixture
+def day_01_options(tmp_path):
+    get_input_path("day_01", tmp_path).write_text(day_01.example_input_string)
+    return RunOptions(tmp_path, cache_directory=tmp_path / "cache")
+
+
+@pytest.fixture
+def star_budget(request):
+    config = request.config
+    baseline = load_baseline(config.getoption("--budget-baseline"))
+
+    def check(day, star):
+        measurement = measure_star(day, star)
+        if config.getoption("--budget-save"):
+            baseline.pop(measurement.name, None)
+        result = check_budget(
+            measurement, baseline, config.getoption("--budget-tolerance")
+        )
+        config.stash[BUDGET_RESULTS].append(result)
+        assert not result.violations, f"{measurement.name}: " + "; ".join(
+            result.violations
+        )
+        return result
+
+    return check
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from advent_of_code import day_01, day_15
+from advent_of_code.batch import find_inputs, format_throughput, main, solve_inputs
+from advent_of_code.generators import write_input
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    for seed in range(4):
+        with (tmp_path / f"input_{seed}.txt").open("w") as output_file:
+            write_input("day_01", 50, output_file, seed)
+    return tmp_path
+
+
+def test_find_inputs(corpus):
+    paths = [str(corpus / f"input_{seed}.txt") for seed in range(4)]
+    assert find_inputs([corpus]) == paths
+    assert find_inputs([corpus / "input_[12].txt"]) == paths[1:3]
+    assert find_inputs([paths[3], paths[0]]) == [paths[3], paths[0]]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_solve_inputs(corpus, jobs):
+    paths = find_inputs([corpus])
+    results = sorted(solve_inputs("day_01", paths, jobs), key=lambda r: r.path)
+    assert [result.path for result in results] == paths
+    for result in results:
+        with open(result.path) as input_file:
+            assert result.answers == day_01.solve(input_file)
+
+
+def test_solve_inputs_reports_failures(tmp_path):
+    (tmp_path / "bad.txt").write_text("not a number\n")
+    [result] = solve_inputs("day_01", [tmp_path / "bad.txt"], jobs=1)
+    assert result.error.startswith("ValueError")
+
+
+def test_format_throughput():
+    assert (
+        format_throughput(10, 1, 2.0) == "10 inputs in 2.000s (5.0 inputs/s), 1 failed"
+    )
+
+
+def test_main(corpus, capsys):
+    assert main(["day_01", str(corpus), "--jobs", "2", "--format", "ndjson"]) == 0
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert len(records) == 4
+    assert all(len(record["answers"]) == 2 for record in records)
+    assert captured.err.startswith("4 inputs in")
+
+
+def test_solve_inputs_with_days_starting_processes(tmp_path):
+    # day_15's second star starts processes of its own, which pool workers
+    # have to be allowed to do
+    for index in range(2):
+        (tmp_path / f"input_{index}.txt").write_text(day_15.example_input_string)
+    paths = find_inputs([tmp_path])
+    results = list(
+        solve_inputs("day_15", paths, 2, star_kwargs=day_15.example_star_kwargs)
+    )
+    assert [result.error for result in results] == [None, None]
+    assert {result.answers for result in results} == {
+        (day_15.example_first_star_output, day_15.example_second_star_output)
+    }
@@ -0,0 +1,87 @@
+import pytest
+
+from advent_of_code import day_06, day_09
+from advent_of_code.benchmark import (
+    Timing,
+    find_regressions,
+    get_example_input_strings,
+    load_baseline,
+    run_benchmarks,
+    run_micro_benchmarks,
+    save_baseline,
+)
+
+
+def test_timing_statistics():
+    timing = Timing("day_01.parse.input", [float(n) for n in range(1, 21)])
+    assert timing.min == 1
+    assert timing.median == 10.5
+    assert timing.p95 == pytest.approx(19.05)
+    assert Timing("single", [3.0]).p95 == 3.0
+
+
+def test_get_example_input_strings():
+    assert get_example_input_strings(day_06) == (day_06.examples[0][0],) * 2
+    assert get_example_input_strings(day_09) == (
+        day_09.example_first_star_input_string,
+        day_09.example_second_star_input_string,
+    )
+
+
+def test_run_benchmarks():
+    timings = list(run_benchmarks(["day_15"], input_kinds=("example",), repeat=2))
+    assert [timing.name for timing in timings] == [
+        "day_15.parse.example",
+        "day_15.first_star.example",
+        "day_15.second_star.example",
+    ]
+    assert all(len(timing.samples) == 2 for timing in timings)
+
+
+def test_run_micro_benchmarks():
+    timings = list(run_micro_benchmarks(["intervals"], size=100, repeat=2))
+    assert [timing.name for timing in timings] == [
+        "intervals.add.100",
+        "intervals.bulk.100",
+        "intervals.remove.100",
+        "intervals.contains.100",
+        "intervals.first_gap.100",
+    ]
+    assert all(len(timing.samples) == 2 for timing in timings)
+
+
+def test_find_regressions():
+    baseline = {
+        "slower": {"median": 0.010},
+        "noise": {"median": 0.0001},
+        "same": {"median": 0.010},
+    }
+    timings = [
+        Timing("slower", [0.020]),
+        Timing("noise", [0.0005]),
+        Timing("same", [0.011]),
+        Timing("new", [1.0]),
+    ]
+    regressions = find_regressions(timings, baseline)
+    assert [regression.name for regression in regressions] == ["slower"]
+    assert regressions[0].ratio == pytest.approx(2.0)
+
+
+def test_save_and_load_baseline(tmp_path):
+    timing = Timing("day_01.parse.input", [0.5, 1.5])
+    save_baseline(tmp_path / "baseline.json", [timing])
+    assert load_baseline(tmp_path / "baseline.json") == {
+        "day_01.parse.input": timing.summary()
+    }
+    assert load_baseline(tmp_path / "missing.json") == {}
+
+
+def test_save_baseline_merges(tmp_path):
+    path = tmp_path / "baseline.json"
+    first, second = Timing("day_01.parse.input", [0.5]), Timing("micro", [0.25])
+    save_baseline(path, [first])
+    save_baseline(path, [second])
+    assert load_baseline(path) == {
+        "day_01.parse.input": first.summary(),
+        "micro": second.summary(),
+    }
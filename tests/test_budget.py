@@ -0,0 +1,86 @@
+import json
+
+from advent_of_code.budget import (
+    StarMeasurement,
+    check_budget,
+    load_baseline,
+    measure_peak_bytes,
+    measure_star,
+    save_baseline,
+    time_star,
+    write_report,
+)
+
+BASELINE = {"day_12.first_star": {"seconds": 0.1, "peak_bytes": 1024 * 1024}}
+
+
+def test_check_budget():
+    within = StarMeasurement("day_12.first_star", 0.19, 1024 * 1024)
+    assert check_budget(within, BASELINE).status == "ok"
+
+    slower = StarMeasurement("day_12.first_star", 0.21, 1024 * 1024)
+    result = check_budget(slower, BASELINE)
+    assert result.status == "regressed"
+    assert result.violations[0].startswith("seconds 0.21s")
+
+    bigger = StarMeasurement("day_12.first_star", 0.1, 4 * 1024 * 1024)
+    assert check_budget(bigger, BASELINE, tolerance=1).status == "regressed"
+
+    unknown = StarMeasurement("day_13.first_star", 10.0, 0)
+    assert check_budget(unknown, BASELINE).status == "unbudgeted"
+
+
+def test_check_budget_ignores_noise():
+    baseline = {"day_06.first_star": {"seconds": 0.001, "peak_bytes": 1000}}
+    measurement = StarMeasurement("day_06.first_star", 0.003, 3000)
+    assert check_budget(measurement, baseline).status == "ok"
+
+
+def test_time_star_stops_slow_stars_early():
+    calls = []
+
+    def star(parsed):
+        calls.append(parsed)
+
+    time_star(star, "parsed", repeat=3)
+    assert calls == ["parsed"] * 3
+
+    calls.clear()
+    time_star(star, "parsed", repeat=3, max_seconds=0)
+    assert calls == ["parsed"]
+
+
+def test_measure_peak_bytes():
+    assert measure_peak_bytes(lambda size: bytearray(size), 10**6) >= 10**6
+
+
+def test_measure_star(day_01_options):
+    measurement = measure_star(
+        "day_01", "second_star", day_01_options.input_directory, repeat=2
+    )
+    assert measurement.name == "day_01.second_star"
+    assert measurement.seconds > 0
+
+
+def test_save_baseline_merges(tmp_path):
+    path = tmp_path / "budget.json"
+    save_baseline(path, [StarMeasurement("day_01.first_star", 0.5, 100)])
+    save_baseline(path, [StarMeasurement("day_02.first_star", 0.25, 200)])
+    assert load_baseline(path) == {
+        "day_01.first_star": {"seconds": 0.5, "peak_bytes": 100},
+        "day_02.first_star": {"seconds": 0.25, "peak_bytes": 200},
+    }
+    assert load_baseline(tmp_path / "missing.json") == {}
+
+
+def test_write_report(tmp_path):
+    results = [
+        check_budget(StarMeasurement("day_12.first_star", 0.3, 0), BASELINE),
+        check_budget(StarMeasurement("day_13.first_star", 0.2, 0), BASELINE),
+    ]
+    write_report(tmp_path / "report.json", results)
+
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert report["regressed"] == 1
+    assert [star["status"] for star in report["stars"]] == ["regressed", "unbudgeted"]
+    assert report["stars"][0]["budget"] == BASELINE["day_12.first_star"]
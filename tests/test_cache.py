@@ -0,0 +1,113 @@
+import hashlib
+import os
+import sys
+
+import pytest
+
+from advent_of_code.cache import (
+    DiskCache,
+    MISSING,
+    evict_stale_entries,
+    file_digest,
+    get_cache_key,
+    get_local_dependencies,
+    parser_digest,
+    solver_digest,
+)
+
+
+def test_disk_cache_round_trip(tmp_path):
+    cache = DiskCache(tmp_path)
+    assert cache.get("key") is MISSING
+    cache.put("key", (1, "two"))
+    assert cache.get("key") == (1, "two")
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(tmp_path)
+    for index, key in enumerate(("first", "second", "third")):
+        cache.put(key, key * 100)
+        os.utime(cache.get_path(key), ns=(index, index))
+    cache.max_bytes = sum(stat.st_size for stat, _ in cache.entries()) - 1
+
+    cache.get("first")  # now the most recently used
+    cache.evict()
+
+    assert cache.get("second") is MISSING
+    assert cache.get("first") == "first" * 100
+    assert cache.get("third") == "third" * 100
+
+
+def test_disk_cache_discards_corrupt_entries(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.get_path("key").write_bytes(b"not a pickle")
+    assert cache.get("key", None) is None
+    assert not cache.get_path("key").exists()
+
+
+def test_disk_cache_skips_unpicklable_values(tmp_path):
+    cache = DiskCache(tmp_path)
+    with pytest.raises(Exception):
+        cache.put("key", lambda: None)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_file_digest(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"abc")
+    assert file_digest(path) == hashlib.sha256(b"abc").hexdigest()
+
+
+def test_solver_digest():
+    from advent_of_code import day_04
+
+    assert get_local_dependencies(day_04) == [
+        "advent_of_code.integers",
+        "advent_of_code.intervals",
+        "advent_of_code.puzzle_input",
+    ]
+    assert solver_digest(day_04) == solver_digest(day_04)
+    assert solver_digest(day_04) != solver_digest(sys.modules[__name__])
+
+
+def test_evict_stale_entries(tmp_path):
+    cache = DiskCache(tmp_path)
+    current = get_cache_key("day_01", "input", "new_solver")
+    stale = get_cache_key("day_01", "other_input", "old_solver")
+    other_day = get_cache_key("day_02", "input", "old_solver")
+    for key in (current, stale, other_day):
+        cache.put(key, key)
+
+    evict_stale_entries(cache, "day_01", "new_solver")
+    assert cache.get(current) == current
+    assert cache.get(stale) is MISSING
+    assert cache.get(other_day) == other_day
+
+
+def test_parser_digest(tmp_path, monkeypatch):
+    source = """\
+from advent_of_code.integers import extract_integers
+
+SCALE = 2
+
+
+def parse(input_file):
+    return [value * SCALE for value in extract_integers(input_file.read())]
+
+
+def solve_first_star(values):
+    return sum(values)
+"""
+    monkeypatch.syspath_prepend(tmp_path)
+    module_path = tmp_path / "parser_digest_day.py"
+
+    def load(source):
+        module_path.write_text(source)
+        sys.modules.pop("parser_digest_day", None)
+        import parser_digest_day
+
+        return parser_digest_day
+
+    digest = parser_digest(load(source))
+    assert parser_digest(load(source.replace("sum(values)", "max(values)"))) == digest
+    assert parser_digest(load(source.replace("SCALE = 2", "SCALE = 3"))) != digest
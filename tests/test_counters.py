@@ -0,0 +1,78 @@
+import io
+
+import pytest
+
+from advent_of_code import counters, day_09, day_12, day_14, day_15
+from advent_of_code.intervals import InclusiveInterval, InclusiveIntervalSet
+
+
+@pytest.fixture
+def counting():
+    counters.enable()
+    counters.begin("test")
+    yield counters.phases
+    counters.disable()
+
+
+def parse_example(module):
+    return module.parse(io.StringIO(module.example_input_string))
+
+
+def test_counters(counting):
+    counters.add("steps")
+    counters.add("steps", 2)
+    counters.begin("other")
+    counters.merge({"steps": 1, "grains": 4})
+    assert counting == {"test": {"steps": 3}, "other": {"steps": 1, "grains": 4}}
+    assert counters.format_counts(counting["other"]) == "grains 4, steps 1"
+
+
+def test_disabled_counters_count_nothing():
+    assert not counters.enabled
+    counters.phases.clear()
+    day_12.solve_first_star(parse_example(day_12))
+    assert not counters.phases
+
+
+def test_solvers_count_operations(counting):
+    day_09.solve_first_star(
+        day_09.parse(io.StringIO(day_09.example_first_star_input_string))
+    )
+    day_12.solve_first_star(parse_example(day_12))
+    assert day_14.solve_first_star(parse_example(day_14)) == 24
+    counts = counting["test"]
+    assert counts["knot_updates"] > 0
+    assert counts["nodes_popped"] >= day_12.example_first_star_output
+    assert counts["neighbors_relaxed"] >= day_12.example_first_star_output
+    # The last grain falls into the void rather than coming to rest
+    assert counts["grains"] == 25
+    assert counts["grain_steps"] > counts["grains"]
+
+
+@pytest.mark.parametrize("module", [day_12, day_14])
+def test_fast_engines_count_operations(counting, module):
+    for index, star in enumerate(module.engines["fast"]):
+        counters.begin(index)
+        star(parse_example(module))
+    assert counting[0] and counting[1]
+
+
+def test_fast_engine_counts_fewer_grain_steps(counting):
+    day_14.solve_second_star(parse_example(day_14))
+    counters.begin("fast")
+    day_14.solve_second_star_fast(parse_example(day_14))
+    assert counting["fast"]["grains"] == counting["test"]["grains"]
+    assert counting["fast"]["grain_steps"] < counting["test"]["grain_steps"]
+
+
+def test_interval_merges(counting):
+    intervals = InclusiveIntervalSet([InclusiveInterval(0, 2), InclusiveInterval(1, 5)])
+    intervals.add(InclusiveInterval(10, 12))
+    intervals.add(InclusiveInterval(4, 11))
+    assert counting["test"]["interval_merges"] == 3
+
+
+def test_day_15_workers_send_counts_back(counting):
+    space = parse_example(day_15)
+    assert day_15.solve_second_star(space, range_max=20) == 56000011
+    assert counting["test"]["interval_merges"] > 0
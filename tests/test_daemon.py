@@ -0,0 +1,104 @@
+import threading
+
+import pytest
+
+from advent_of_code import day_01
+from advent_of_code.daemon import (
+    SolverDaemon,
+    create_server,
+    main,
+    query,
+    send_request,
+)
+
+
+@pytest.fixture
+def day_01_input(tmp_path):
+    path = tmp_path / "day_01.txt"
+    path.write_text(day_01.example_input_string)
+    return path
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    socket_path = tmp_path / "daemon.sock"
+    server = create_server(socket_path, max_parsed=2)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield socket_path
+    send_request({"command": "stop"}, socket_path)
+    thread.join()
+    server.server_close()
+
+
+def test_solve_reuses_parsed_inputs(day_01_input):
+    daemon = SolverDaemon()
+    response = daemon.solve({"day": "day_01", "input": str(day_01_input)})
+    assert response["answers"] == {
+        "first_star": day_01.example_first_star_output,
+        "second_star": day_01.example_second_star_output,
+    }
+    assert not response["parsed_cached"]
+
+    request = {"day": "day_01", "stars": ["second_star"], "input": str(day_01_input)}
+    response = daemon.solve(request)
+    assert response["parsed_cached"]
+    assert response["answers"] == {"second_star": day_01.example_second_star_output}
+
+    day_01_input.write_text("1\n\n2\n3\n")
+    response = daemon.solve({"day": "day_01", "input": str(day_01_input)})
+    assert not response["parsed_cached"]
+    assert response["answers"] == {"first_star": 5, "second_star": 6}
+
+
+def test_parsed_inputs_are_evicted(tmp_path):
+    daemon = SolverDaemon(max_parsed=2)
+    for number in range(3):
+        path = tmp_path / f"{number}.txt"
+        path.write_text(f"{number}\n")
+        daemon.solve({"day": "day_01", "input": str(path)})
+    assert [key[1] for key in daemon.parsed] == [
+        str(tmp_path / "1.txt"),
+        str(tmp_path / "2.txt"),
+    ]
+
+
+def test_solve_decodes_answers():
+    # Only real inputs draw letters
+    response = SolverDaemon().solve({"day": "day_10", "stars": ["second_star"]})
+    [answer] = response["answers"].values()
+    assert answer.isalpha()
+
+
+def test_handle_reports_errors():
+    assert (
+        "unknown stars"
+        in SolverDaemon().handle({"day": "day_01", "stars": ["x"]})["error"]
+    )
+    assert "ModuleNotFoundError" in SolverDaemon().handle({"day": "day_99"})["error"]
+
+
+def test_query(socket_path, day_01_input):
+    first = query("day_01", input_path=day_01_input, socket_path=socket_path)
+    second = query("day_01", ["first_star"], day_01_input, socket_path=socket_path)
+    assert first["answers"]["first_star"] == day_01.example_first_star_output
+    assert second == {
+        "answers": {"first_star": day_01.example_first_star_output},
+        "seconds": second["seconds"],
+        "parsed_cached": True,
+    }
+
+
+def test_main(socket_path, day_01_input, capsys):
+    argv = ["--socket", str(socket_path), "query", "day_01", "--input"]
+    assert main([*argv, str(day_01_input)]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        f"First star answer: {day_01.example_first_star_output}",
+        f"Second star answer: {day_01.example_second_star_output}",
+    ]
+    assert main([*argv, str(day_01_input.parent / "missing.txt")]) == 1
+
+
+def test_main_without_a_daemon(tmp_path, capsys):
+    assert main(["--socket", str(tmp_path / "none.sock"), "query", "day_01"]) == 1
+    assert "No daemon" in capsys.readouterr().err
@@ -0,0 +1,229 @@
+import dataclasses
+import io
+import tracemalloc
+
+import pytest
+
+from advent_of_code import day_01
+from advent_of_code.budget import STARS
+from advent_of_code.day_01 import (
+    example_first_star_output,
+    example_input_string,
+    engines,
+    example_second_star_output,
+    find_chunk_ranges,
+    first_star,
+    main,
+    parse,
+    parse_in_parallel,
+    second_star,
+    solve,
+    solve_in_parallel,
+    solve_vectorized,
+    stream_of_calorie_totals,
+    top_calorie_counts,
+    top_calorie_totals,
+    top_calorie_totals_in_parallel,
+    top_calorie_counts_vectorized,
+    vectorized_calorie_totals,
+)
+from advent_of_code.generators import generate_input_string, write_input
+from advent_of_code.runner import get_parser, run_day
+
+
+@pytest.fixture
+def test_input():
+    return io.StringIO(example_input_string)
+
+
+def test_first_star(test_input):
+    assert example_first_star_output == first_star(test_input)
+
+
+def test_second_star(test_input):
+    assert example_second_star_output == second_star(test_input)
+
+
+def test_solve(test_input):
+    assert solve(test_input) == (
+        example_first_star_output,
+        example_second_star_output,
+    )
+
+
+def test_top_calorie_totals(test_input):
+    # The example starts with a blank line, so elf 0 carries nothing
+    assert top_calorie_totals(stream_of_calorie_totals(test_input), 3) == [
+        (24000, 4),
+        (11000, 3),
+        (10000, 5),
+    ]
+
+
+def test_top_calorie_totals_for_any_count(test_input):
+    calorie_totals = parse(test_input)
+    ranked = sorted(enumerate(calorie_totals), key=lambda elf: (-elf[1], elf[0]))
+    for count in range(len(calorie_totals) + 2):
+        expected = [(calories, index) for index, calories in ranked[:count]]
+        assert top_calorie_totals(calorie_totals, count) == expected
+        assert top_calorie_counts(calorie_totals, count) == sum(
+            calories for calories, _ in expected
+        )
+
+
+def test_top_calorie_totals_breaks_ties_by_elf():
+    assert top_calorie_totals([5, 7, 5, 7, 1], 3) == [(7, 1), (7, 3), (5, 0)]
+
+
+@pytest.fixture
+def calorie_log(tmp_path):
+    path = tmp_path / "calories.txt"
+    with path.open("w") as output_file:
+        write_input("day_01", 300, output_file)
+    return path
+
+
+def test_find_chunk_ranges(calorie_log):
+    ranges = find_chunk_ranges(calorie_log, 500)
+    assert len(ranges) > 1
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == calorie_log.stat().st_size
+    contents = calorie_log.read_bytes()
+    for (_, stop), (start, _) in zip(ranges, ranges[1:]):
+        assert stop == start
+        assert contents[stop - 2 : stop] == b"\n\n"
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+@pytest.mark.parametrize("chunk_size", [1, 100, 10**6])
+def test_top_calorie_totals_in_parallel(calorie_log, jobs, chunk_size):
+    with calorie_log.open() as input_file:
+        expected = top_calorie_totals(parse(input_file), 10)
+    ranked = top_calorie_totals_in_parallel(calorie_log, 10, jobs, chunk_size)
+    assert ranked == expected
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        example_input_string,
+        example_input_string.replace("\n", "\r\n"),
+        example_input_string.replace("\n\n", "\n  \n") + "\n",
+        "5\n\n\n6\n",
+        "",
+    ],
+)
+def test_solve_in_parallel_matches_solve(tmp_path, contents):
+    path = tmp_path / "calories.txt"
+    path.write_bytes(contents.encode())
+    with path.open() as input_file:
+        calorie_totals = parse(input_file)
+    assert top_calorie_totals_in_parallel(path, 3, 2, 1) == top_calorie_totals(
+        calorie_totals, 3
+    )
+    if contents:
+        assert solve_in_parallel(path, 2, 1) == solve(io.StringIO(contents))
+
+
+def test_main_with_parallel_engine(calorie_log, monkeypatch, capsys):
+    with calorie_log.open() as input_file:
+        expected = solve(input_file)
+    # Ranked in chunks, without ever going through parse()
+    monkeypatch.setattr(day_01, "CHUNK_SIZE", 500)
+    monkeypatch.setattr(day_01, "parse", None)
+
+    argv = ["--input", str(calorie_log), "--engine", "parallel", "--no-cache"]
+    assert main(argv) == 0
+    output = capsys.readouterr().out
+    assert f"First star answer: {expected[0]}" in output
+    assert f"Second star answer: {expected[1]}" in output
+
+
+def test_parallel_engine_streams_other_inputs(test_input):
+    ranked = parse_in_parallel(test_input)
+    assert [star(ranked) for star in engines["parallel"]] == [
+        example_first_star_output,
+        example_second_star_output,
+    ]
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        example_input_string,
+        example_input_string.replace("\n", "\r\n"),
+        example_input_string.replace("\n\n", "\n  \n") + "\n",
+        "5\n\n\n6\n",
+        "1\n2\n\n",
+        "5",
+        "\n",
+        "",
+    ],
+)
+def test_vectorized_calorie_totals(contents):
+    pytest.importorskip("numpy")
+    expected = list(stream_of_calorie_totals(io.StringIO(contents)))
+    for chunk_size in (1, 3, 2**20):
+        totals = vectorized_calorie_totals(contents.encode(), chunk_size)
+        assert totals.tolist() == expected
+
+
+def test_vectorized_calorie_totals_memory_is_bounded():
+    pytest.importorskip("numpy")
+    contents = generate_input_string("day_01", 40000).encode()
+    vectorized_calorie_totals(contents[:100])  # NumPy's own first allocations
+    tracemalloc.start()
+    try:
+        totals = vectorized_calorie_totals(contents, 16 * 1024)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # The chunks' working arrays plus the totals, well under the input's size
+    assert peak_bytes < len(contents)
+    assert totals.tolist() == list(parse(io.BytesIO(contents)))
+
+
+@pytest.mark.parametrize("contents", ["12a\n", "1 2\n", "-5\n"])
+def test_vectorized_calorie_totals_rejects_other_content(contents):
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        vectorized_calorie_totals(contents.encode())
+
+
+def test_top_calorie_counts_vectorized(test_input):
+    pytest.importorskip("numpy")
+    calorie_totals = parse(test_input)
+    for count in range(len(calorie_totals) + 2):
+        assert top_calorie_counts_vectorized(
+            calorie_totals, count
+        ) == top_calorie_counts(calorie_totals, count)
+
+
+def test_solve_vectorized(test_input, calorie_log):
+    pytest.importorskip("numpy")
+    assert solve_vectorized(test_input) == solve(io.StringIO(example_input_string))
+    with calorie_log.open() as input_file:
+        expected = solve(input_file)
+    with calorie_log.open() as input_file:
+        assert solve_vectorized(input_file) == expected
+
+
+def test_numpy_engine(test_input, day_01_options):
+    np = pytest.importorskip("numpy")
+    calorie_totals = get_parser(day_01, "numpy")(test_input)
+    assert isinstance(calorie_totals, np.ndarray)
+    assert [star(calorie_totals) for star in engines["numpy"]] == [
+        example_first_star_output,
+        example_second_star_output,
+    ]
+
+    options = dataclasses.replace(day_01_options, engine="numpy")
+    for use_cache in (False, True, True):
+        result = run_day("day_01", dataclasses.replace(options, use_cache=use_cache))
+        assert result.answers == (example_first_star_output, example_second_star_output)
+
+
+@pytest.mark.budget
+@pytest.mark.parametrize("star", STARS)
+def test_budget(star_budget, star):
+    star_budget("day_01", star)
@@ -0,0 +1,71 @@
+import io
+
+import pytest
+
+from advent_of_code.budget import STARS
+from advent_of_code.day_02 import (
+    FIRST_STAR_SCORES,
+    RoShamBo,
+    SECOND_STAR_SCORES,
+    example_first_star_output,
+    example_input_string,
+    example_second_star_output,
+    first_star,
+    second_star,
+    solve,
+)
+
+
+def test_roshambo():
+    rock = RoShamBo.ROCK
+    paper = RoShamBo.PAPER
+    scissors = RoShamBo.SCISSORS
+
+    assert RoShamBo["A"] == RoShamBo.ROCK
+    assert RoShamBo["B"] == RoShamBo.PAPER
+    assert RoShamBo["C"] == RoShamBo.SCISSORS
+
+    assert RoShamBo["X"] == RoShamBo.ROCK
+    assert RoShamBo["Y"] == RoShamBo.PAPER
+    assert RoShamBo["Z"] == RoShamBo.SCISSORS
+
+    assert rock == rock
+    assert rock > scissors
+    assert rock < paper
+    assert paper < scissors
+    assert scissors < rock
+
+
+def test_round_scores():
+    assert FIRST_STAR_SCORES[b"A Y"] == 8
+    assert FIRST_STAR_SCORES[b"B X"] == 1
+    assert FIRST_STAR_SCORES[b"C Z"] == 6
+    assert SECOND_STAR_SCORES[b"A Y"] == 4
+    assert SECOND_STAR_SCORES[b"B X"] == 1
+    assert SECOND_STAR_SCORES[b"C Z"] == 7
+
+
+@pytest.fixture
+def test_input():
+    return io.StringIO(example_input_string)
+
+
+def test_first_star(test_input):
+    assert example_first_star_output == first_star(test_input)
+
+
+def test_second_star(test_input):
+    assert example_second_star_output == second_star(test_input)
+
+
+def test_solve(test_input):
+    assert solve(test_input) == (
+        example_first_star_output,
+        example_second_star_output,
+    )
+
+
+@pytest.mark.budget
+@pytest.mark.parametrize("star", STARS)
+def test_budget(star_budget, star):
+    star_budget("day_02", star)
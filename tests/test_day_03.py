@@ -0,0 +1,39 @@
+import io
+
+import pytest
+
+from advent_of_code.budget import STARS
+from advent_of_code.day_03 import (
+    example_first_star_output,
+    example_input_string,
+    example_second_star_output,
+    first_star,
+    second_star,
+    solve,
+)
+
+
+@pytest.fixture
+def test_input():
+    return io.StringIO(example_input_string)
+
+
+def test_first_star(test_input):
+    assert first_star(test_input) == example_first_star_output
+
+
+def test_second_star(test_input):
+    assert second_star(test_input) == example_second_star_output
+
+
+def test_solve(test_input):
+    assert solve(test_input) == (
+        example_first_star_output,
+        example_second_star_output,
+    )
+
+
+@pytest.mark.budget
+@pytest.mark.parametrize("star", STARS)
+def test_budget(star_budget, star):
+    star_budget("day_03", star)
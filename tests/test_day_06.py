@@ -0,0 +1,55 @@
+import io
+
+import pytest
+
+from advent_of_code.budget import STARS
+from advent_of_code.day_06 import (
+    CHUNK_SIZE,
+    find_marker,
+    parse,
+    examples,
+    first_star,
+    main,
+    second_star,
+    solve,
+)
+
+
+@pytest.mark.parametrize("test_input, expected", examples)
+def test_first_star(test_input, expected):
+    assert first_star(io.StringIO(test_input)) == expected
+
+
+@pytest.mark.parametrize("test_input, expected", examples)
+def test_second_star(test_input, expected):
+    assert second_star(io.StringIO(test_input)) == expected
+
+
+@pytest.mark.parametrize("test_input, expected", examples)
+def test_solve(test_input, expected):
+    assert solve(io.StringIO(test_input))[0] == expected
+
+
+def test_main():
+    assert main(["--no-cache"]) == 0
+
+
+def test_find_marker_streams():
+    datastream = iter(examples[0][0])
+    assert find_marker(datastream, 4) == examples[0][1]
+    assert next(datastream) == examples[0][0][examples[0][1]]
+
+
+def test_parse_stops_at_the_marker():
+    input_file = io.StringIO(examples[0][0] + "a" * (4 * CHUNK_SIZE))
+    input_file.close = lambda: None
+    datastream = parse(input_file)
+
+    assert datastream == examples[0][0][: find_marker(examples[0][0], 14)]
+    assert input_file.tell() <= CHUNK_SIZE
+
+
+@pytest.mark.budget
+@pytest.mark.parametrize("star", STARS)
+def test_budget(star_budget, star):
+    star_budget("day_06", star)
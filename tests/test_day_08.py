@@ -0,0 +1,66 @@
+import io
+
+import pytest
+
+from advent_of_code.budget import STARS
+from advent_of_code.day_08 import (
+    TreeGrid,
+    engines,
+    example_first_star_output,
+    example_input_string,
+    example_second_star_output,
+    first_star,
+    main,
+    parse,
+    second_star,
+    solve,
+)
+
+
+def test_tree_grid(example_input):
+    grid = TreeGrid.from_input(example_input)
+    assert grid[0] == (3, 0, 3, 7, 3)
+    assert grid.get_column(0) == (3, 2, 6, 3, 3)
+
+
+def test_tree_grid_rejects_ragged_rows():
+    with pytest.raises(ValueError):
+        TreeGrid.from_input(io.StringIO("123\n45\n6789\n"))
+
+
+@pytest.fixture
+def example_input():
+    return io.StringIO(example_input_string)
+
+
+def test_first_star(example_input):
+    assert first_star(example_input) == example_first_star_output
+
+
+def test_second_star(example_input):
+    assert second_star(example_input) == example_second_star_output
+
+
+def test_solve(example_input):
+    assert solve(example_input) == (
+        example_first_star_output,
+        example_second_star_output,
+    )
+
+
+def test_fast_engine(example_input):
+    parsed = parse(example_input)
+    assert tuple(star(parsed) for star in engines["fast"]) == (
+        example_first_star_output,
+        example_second_star_output,
+    )
+
+
+def test_main():
+    assert main(["--no-cache"]) == 0
+
+
+@pytest.mark.budget
+@pytest.mark.parametrize("star", STARS)
+def test_budget(star_budget, star):
+    star_budget("day_08", star)
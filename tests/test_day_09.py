@@ -0,0 +1,43 @@
+import io
+
+import pytest
+
+from advent_of_code.budget import STARS
+from advent_of_code.day_09 import (
+    example_first_star_input_string,
+    example_first_star_output,
+    example_second_star_input_string,
+    example_second_star_output,
+    first_star,
+    main,
+    second_star,
+    solve,
+)
+
+
+def test_first_star():
+    example_input = io.StringIO(example_first_star_input_string)
+    assert first_star(example_input) == example_first_star_output
+
+
+def test_second_star():
+    example_input = io.StringIO(example_second_star_input_string)
+    assert second_star(example_input) == example_second_star_output
+
+
+def test_solve():
+    example_input = io.StringIO(example_first_star_input_string)
+    assert solve(example_input)[0] == example_first_star_output
+
+    example_input = io.StringIO(example_second_star_input_string)
+    assert solve(example_input)[1] == example_second_star_output
+
+
+def test_main():
+    assert main(["--no-cache"]) == 0
+
+
+@pytest.mark.budget
+@pytest.mark.parametrize("star", STARS)
+def test_budget(star_budget, star):
+    star_budget("day_09", star)
@@ -0,0 +1,65 @@
+import io
+
+import pytest
+
+from advent_of_code.budget import STARS
+from advent_of_code.day_10 import (
+    ascii_art_to_string,
+    decode_answers,
+    example_first_star_checkpoints,
+    example_first_star_output,
+    example_input_string,
+    example_second_star_output,
+    first_star,
+    main,
+    second_star,
+    solve,
+    test_ascii_art,
+)
+
+
+def test_ascii_art_to_string():
+    assert ascii_art_to_string(test_ascii_art) == "EHPZPJGL"
+
+
+def test_decode_answers_keeps_undecodable_art():
+    assert decode_answers(1, test_ascii_art) == (1, "EHPZPJGL")
+    assert decode_answers(1, example_second_star_output) == (
+        1,
+        example_second_star_output,
+    )
+    with pytest.raises(ValueError):
+        ascii_art_to_string(example_second_star_output)
+
+
+@pytest.fixture
+def example_input():
+    return io.StringIO(example_input_string)
+
+
+def test_first_star(example_input):
+    assert (
+        first_star(example_input, example_first_star_checkpoints)
+        == example_first_star_output
+    )
+
+
+def test_second_star(example_input):
+    assert second_star(example_input) == example_second_star_output
+
+
+def test_solve(example_input):
+    assert solve(example_input) == (
+        example_first_star_output,
+        example_second_star_output,
+    )
+
+
+def test_main():
+    assert main(["--no-cache"]) == 0
+
+
+@pytest.mark.budget
+@pytest.mark.parametrize("star", STARS)
+def test_budget(star_budget, star):
+    star_budget("day_10", star)
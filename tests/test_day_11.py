@@ -0,0 +1,51 @@
+import io
+import pickle
+
+import pytest
+
+from advent_of_code.budget import STARS
+from advent_of_code.day_11 import (
+    example_first_star_output,
+    example_input_string,
+    example_second_star_output,
+    first_star,
+    main,
+    parse,
+    second_star,
+    solve,
+)
+
+
+@pytest.fixture
+def example_input():
+    return io.StringIO(example_input_string)
+
+
+def test_first_star(example_input):
+    assert first_star(example_input) == example_first_star_output
+
+
+def test_monkeys_are_picklable(example_input):
+    monkeys = parse(example_input)
+    assert pickle.loads(pickle.dumps(monkeys)) == monkeys
+
+
+def test_second_star(example_input):
+    assert second_star(example_input) == example_second_star_output
+
+
+def test_solve(example_input):
+    assert solve(example_input) == (
+        example_first_star_output,
+        example_second_star_output,
+    )
+
+
+def test_main():
+    assert main(["--no-cache"]) == 0
+
+
+@pytest.mark.budget
+@pytest.mark.parametrize("star", STARS)
+def test_budget(star_budget, star):
+    star_budget("day_11", star)
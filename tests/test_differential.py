@@ -0,0 +1,71 @@
+import importlib
+import types
+
+import pytest
+
+from advent_of_code import day_12
+from advent_of_code.differential import (
+    Comparison,
+    compare_engines,
+    format_comparison,
+    get_sources,
+    main,
+    parse_for_engines,
+)
+
+
+@pytest.mark.parametrize("day", ["day_08", "day_12", "day_14"])
+def test_fast_engines_match_the_reference(day):
+    module = importlib.import_module(f"advent_of_code.{day}")
+    engines = ["reference", "fast"]
+    for source, input_file in get_sources(day, generate=5, size=30):
+        parsed = parse_for_engines(module, engines, input_file.read())
+        for comparison in compare_engines(module, parsed, engines):
+            assert comparison.matches, format_comparison(comparison)
+
+
+def test_compare_engines_finds_mismatches():
+    module = types.SimpleNamespace(
+        __name__="fake",
+        solve_first_star=len,
+        solve_second_star=sum,
+        engines={"wrong": (len, lambda parsed: 1 / 0)},
+    )
+    parsed = {"reference": [1, 2], "wrong": [1, 2]}
+    first, second = compare_engines(module, parsed, ["reference", "wrong"], "fake")
+    assert first.matches
+    assert first.answers == {"reference": 2, "wrong": 2}
+    assert not second.matches
+    assert isinstance(second.answers["wrong"], ZeroDivisionError)
+    assert "MISMATCH reference 3, wrong ZeroDivisionError" in format_comparison(second)
+
+
+def test_parse_for_engines():
+    module = types.SimpleNamespace(
+        parse=lambda input_file: input_file.read().split(),
+        engine_parsers={"own": lambda input_file: input_file.read().upper()},
+    )
+    parsed = parse_for_engines(module, ["reference", "fast", "own"], "a b")
+    assert parsed == {"reference": ["a", "b"], "fast": ["a", "b"], "own": "A B"}
+    assert parsed["reference"] is parsed["fast"]
+
+
+def test_format_comparison():
+    comparison = Comparison(
+        "input", "first_star", {"reference": 1, "fast": 1}, {"reference": 2, "fast": 1}
+    )
+    assert format_comparison(comparison) == (
+        "input first_star: ok, fast 2.00x the speed of reference"
+    )
+
+
+def test_main(tmp_path, capsys):
+    (tmp_path / "input.txt").write_text(day_12.example_input_string)
+    argv = ["day_12", "--input", str(tmp_path / "input.txt"), "--generate", "2"]
+    assert main([*argv, "--size", "10"]) == 0
+    output = capsys.readouterr().out.splitlines()
+    assert len(output) == 7
+    assert output[-1] == "0 mismatches"
+
+    with pytest.raises(SystemExit):
+        main(["day_12", "--engines", "reference", "missing"])
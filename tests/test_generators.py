@@ -0,0 +1,59 @@
+import io
+
+import pytest
+
+from advent_of_code import day_03, day_06
+from advent_of_code.runner import import_day
+from advent_of_code.generators import (
+    DAYS,
+    generate_input_string,
+    write_input,
+)
+
+# day_15's second star always scans four million rows, so only its first star
+# is solved here.
+SOLVERS = {"day_15": lambda module, input_file: module.first_star(input_file)}
+# day_11's size is its number of monkeys, each playing 10000 rounds
+TEST_SIZES = {"day_11": 5}
+
+
+@pytest.mark.parametrize("day", DAYS)
+@pytest.mark.parametrize("seed", (0, 1, 2))
+def test_generated_input_is_solvable(day, seed):
+    module = import_day(day)
+    solver = SOLVERS.get(day, lambda module, input_file: module.solve(input_file))
+    size = TEST_SIZES.get(day, 20)
+    solver(module, io.StringIO(generate_input_string(day, size, seed)))
+
+
+@pytest.mark.parametrize("day", DAYS)
+def test_generated_input_is_reproducible(day):
+    assert generate_input_string(day, 10, seed=7) == generate_input_string(
+        day, 10, seed=7
+    )
+
+
+@pytest.mark.parametrize("day", DAYS)
+def test_generated_input_scales(day):
+    assert len(generate_input_string(day, 40)) > len(generate_input_string(day, 4))
+
+
+def test_write_input(tmp_path):
+    output_path = tmp_path / "day_01.txt"
+    with output_path.open("w") as output_file:
+        write_input("day_01", 5, output_file, seed=3)
+    assert output_path.read_text() == generate_input_string("day_01", 5, seed=3)
+
+
+def test_day_03_badges_are_unique():
+    lines = generate_input_string("day_03", 50).splitlines()
+    for group in day_03.three_lines_at_a_time(lines):
+        assert len(set.intersection(*map(set, group))) == 1
+    for line in lines:
+        half = len(line) // 2
+        assert len(set(line[:half]) & set(line[half:])) == 1
+
+
+def test_day_06_planted_marker():
+    datastream = generate_input_string("day_06", 1000)
+    assert day_06.find_marker(datastream, 14) >= (1000 - 14) // 2 + 14
@@ -0,0 +1,76 @@
+import array
+import pickle
+
+import pytest
+
+from advent_of_code.grid import Grid2D
+
+ROWS = [b"abc", b"def"]
+
+
+@pytest.fixture
+def grid():
+    return Grid2D.from_rows(ROWS)
+
+
+def test_from_rows(grid):
+    assert (grid.width, grid.height) == (3, 2)
+    assert grid.cells == bytearray(b"abcdef")
+    assert list(grid.rows()) == [bytearray(row) for row in ROWS]
+    assert grid.column(1) == bytearray(b"be")
+
+    with pytest.raises(ValueError):
+        Grid2D.from_rows([b"ab", b"c"])
+
+
+def test_from_rows_typecode():
+    grid = Grid2D.from_rows([[1, 2], [3, 400]], typecode="i")
+    assert grid.cells == array.array("i", [1, 2, 3, 400])
+    assert grid.get(1, 1) == 400
+
+
+def test_get_and_set(grid):
+    assert grid.get(2, 1) == ord("f")
+    assert grid.get(3, 0) is None
+    assert grid.get(-1, 0, default=0) == 0
+
+    grid.set(0, 1, ord("x"))
+    assert grid.row(1) == bytearray(b"xef")
+    with pytest.raises(IndexError):
+        grid.set(0, 2, 0)
+
+
+def test_index_and_coordinates():
+    grid = Grid2D(4, 3, x_offset=-2, y_offset=5)
+    assert grid.contains(-2, 5) and grid.contains(1, 7)
+    assert not grid.contains(2, 5) and not grid.contains(0, 8)
+    for index in range(len(grid.cells)):
+        assert grid.index(*grid.coordinates(index)) == index
+
+
+def test_neighbor_indexes(grid):
+    assert list(grid.neighbor_indexes(0)) == [1, 3]
+    assert list(grid.neighbor_indexes(1)) == [0, 2, 4]
+    assert list(grid.neighbor_indexes(5)) == [4, 2]
+
+
+def test_grow_to_include(grid):
+    assert not grid.grow_to_include(2, 1)
+    assert grid.grow_to_include(-3, 4)
+
+    assert grid.contains(-3, 4)
+    assert grid.x_offset <= -3 and grid.y_end > 4
+    assert grid.get(0, 0) == ord("a")
+    assert grid.get(2, 1) == ord("f")
+    assert grid.get(-3, 4) == 0
+    assert grid.count(0) == len(grid.cells) - 6
+
+
+def test_growth_is_amortized():
+    grid = Grid2D(1, 1)
+    growths = sum(grid.grow_to_include(x, 0) for x in range(1, 10000))
+    assert growths < 25
+
+
+def test_pickle(grid):
+    assert pickle.loads(pickle.dumps(grid)).cells == grid.cells
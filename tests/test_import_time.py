@@ -0,0 +1,68 @@
+import subprocess
+import sys
+
+import pytest
+
+from advent_of_code.generators import DAYS
+from advent_of_code.import_time import (
+    MODULE_FORMAT,
+    format_row,
+    heaviest_imports,
+    load_baseline,
+    parse_import_times,
+    save_baseline,
+)
+
+IMPORT_TIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       152 |        152 |       urllib
+import time:      1211 |      14191 |   pathlib
+import time:       988 |       2146 |   advent_of_code.puzzle_input
+import time:      1148 |      19516 | advent_of_code.day_01
+"""
+
+
+def test_parse_import_times():
+    assert list(parse_import_times(IMPORT_TIME_OUTPUT)) == [
+        ("urllib", 3, 0.000152),
+        ("pathlib", 1, 0.014191),
+        ("advent_of_code.puzzle_input", 1, 0.002146),
+        ("advent_of_code.day_01", 0, 0.019516),
+    ]
+
+
+def test_heaviest_imports():
+    heaviest = heaviest_imports("advent_of_code.day_04", limit=10)
+    names = [name for name, _ in heaviest]
+    assert "advent_of_code.integers" in names
+    assert "advent_of_code" not in names
+    assert "advent_of_code.day_04" not in names
+
+
+@pytest.mark.parametrize("day", DAYS)
+def test_day_import_stays_lean(day):
+    module = MODULE_FORMAT.format(day=day)
+    loaded = subprocess.run(
+        [sys.executable, "-c", f"import sys, {module}; print(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    assert module in loaded
+    for heavy in ("pytest", "attr", "multiprocessing", "advent_of_code.runner"):
+        assert heavy not in loaded
+
+
+def test_format_row():
+    assert format_row("day_01", 0.02, 0.2, [("pathlib", 0.015)]) == (
+        "day_01:     20.0ms  (before    200.0ms,  10.0x faster)"
+        "  heaviest: pathlib 15.0ms"
+    )
+
+
+def test_save_baseline_merges(tmp_path):
+    path = tmp_path / "baseline.json"
+    save_baseline(path, {"day_01": 0.5, "day_02": 0.25})
+    save_baseline(path, {"day_01": 0.125})
+    assert load_baseline(path) == {"day_01": 0.125, "day_02": 0.25}
+    assert load_baseline(tmp_path / "missing.json") == {}
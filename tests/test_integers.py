@@ -0,0 +1,51 @@
+import array
+import io
+
+import pytest
+
+from advent_of_code.integers import (
+    extract_integers,
+    get_column,
+    iter_rows,
+    read_integer_table,
+)
+
+example_input_string = """\
+Sensor at x=2, y=18: closest beacon is at x=-2, y=15
+Sensor at x=9, y=16: closest beacon is at x=10, y=16
+"""
+
+
+def test_extract_integers():
+    assert extract_integers(b"2-4,6-8", signed=False) == array.array("q", [2, 4, 6, 8])
+    assert extract_integers(b"x=-2, y=15") == array.array("q", [-2, 15])
+    assert extract_integers(b"") == array.array("q")
+
+
+def test_read_integer_table():
+    table = read_integer_table(io.StringIO(example_input_string), 4)
+    assert get_column(table, 4, 2) == array.array("q", [-2, 10])
+    assert list(iter_rows(table, 4)) == [(2, 18, -2, 15), (9, 16, 10, 16)]
+
+
+def test_read_integer_table_from_file(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(example_input_string)
+
+    table = read_integer_table(input_path.open(), 4)
+    assert list(iter_rows(table, 4)) == [(2, 18, -2, 15), (9, 16, 10, 16)]
+
+
+def test_read_integer_table_rejects_ragged_input():
+    with pytest.raises(ValueError):
+        read_integer_table(io.StringIO(example_input_string), 3)
+    # Eight integers split evenly into two rows, but not the two lines given
+    with pytest.raises(ValueError, match=r"line 1 doesn't hold 4 integers"):
+        read_integer_table(io.StringIO("1-2,3\n4-5,6-7,8\n"), 4, signed=False)
+    with pytest.raises(ValueError, match="line 3"):
+        read_integer_table(io.StringIO("1,2\n\n3\n"), 2)
+
+
+def test_read_integer_table_allows_blank_lines():
+    table = read_integer_table(io.StringIO("\n1 2\r\n\n-3 4\n"), 2)
+    assert list(iter_rows(table, 2)) == [(1, 2), (-3, 4)]
@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+from advent_of_code.intervals import InclusiveInterval, InclusiveIntervalSet
+
+
+def as_tuples(interval_set):
+    return [(interval.min, interval.max) for interval in interval_set]
+
+
+def test_interval():
+    interval = InclusiveInterval(2, 4)
+    assert list(interval) == [2, 3, 4]
+    assert 4 in interval and 5 not in interval
+    assert interval.size() == 3
+    assert interval.covers(InclusiveInterval(3, 4))
+    assert not interval.covers(InclusiveInterval(3, 5))
+    assert interval.overlaps(InclusiveInterval(4, 9))
+    assert not interval.overlaps(InclusiveInterval(5, 9))
+
+
+def test_add_merges_overlapping_and_adjacent():
+    interval_set = InclusiveIntervalSet()
+    interval_set.add(InclusiveInterval(10, 12))
+    interval_set.add(InclusiveInterval(0, 2))
+    interval_set.add(InclusiveInterval(5, 6))
+    assert as_tuples(interval_set) == [(0, 2), (5, 6), (10, 12)]
+
+    interval_set.add(InclusiveInterval(3, 4))
+    assert as_tuples(interval_set) == [(0, 6), (10, 12)]
+
+    interval_set.add(InclusiveInterval(-5, 20))
+    assert as_tuples(interval_set) == [(-5, 20)]
+
+
+def test_remove_splits():
+    interval_set = InclusiveIntervalSet([InclusiveInterval(0, 10)])
+    interval_set.remove(InclusiveInterval(4, 5))
+    assert as_tuples(interval_set) == [(0, 3), (6, 10)]
+
+    interval_set.remove(InclusiveInterval(3, 6))
+    assert as_tuples(interval_set) == [(0, 2), (7, 10)]
+
+    interval_set.remove(InclusiveInterval(20, 30))
+    interval_set.remove(InclusiveInterval(-1, 0))
+    assert as_tuples(interval_set) == [(1, 2), (7, 10)]
+    assert interval_set.size() == 6
+
+
+def test_bulk_construction_from_unsorted_intervals():
+    interval_set = InclusiveIntervalSet(
+        InclusiveInterval(start, stop)
+        for start, stop in ((8, 9), (0, 3), (2, 5), (11, 11), (6, 6))
+    )
+    assert as_tuples(interval_set) == [(0, 6), (8, 9), (11, 11)]
+    assert len(interval_set) == 3
+
+
+def test_first_gap():
+    interval_set = InclusiveIntervalSet(
+        [InclusiveInterval(0, 3), InclusiveInterval(6, 9)]
+    )
+    assert interval_set.first_gap(InclusiveInterval(0, 20)) == 4
+    assert interval_set.first_gap(InclusiveInterval(5, 20)) == 5
+    assert interval_set.first_gap(InclusiveInterval(7, 20)) == 10
+    assert interval_set.first_gap(InclusiveInterval(7, 9)) is None
+    assert InclusiveIntervalSet().first_gap(InclusiveInterval(3, 4)) == 3
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_a_set_of_integers(seed):
+    rng = random.Random(seed)
+    interval_set, model = InclusiveIntervalSet(), set()
+    for _ in range(200):
+        start = rng.randrange(100)
+        interval = InclusiveInterval(start, start + rng.randrange(8))
+        if rng.random() < 0.6:
+            interval_set.add(interval)
+            model.update(interval)
+        else:
+            interval_set.remove(interval)
+            model.difference_update(interval)
+
+        assert interval_set.size() == len(model)
+        assert all(
+            (value in interval_set) == (value in model) for value in range(-2, 110)
+        )
+        starts, ends = interval_set.starts, interval_set.ends
+        assert all(ends[i] + 1 < starts[i + 1] for i in range(len(starts) - 1))
+
+    bulk = InclusiveIntervalSet(
+        InclusiveInterval(value, value)
+        for value in rng.sample(sorted(model), len(model))
+    )
+    assert as_tuples(bulk) == as_tuples(interval_set)
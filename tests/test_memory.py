@@ -0,0 +1,81 @@
+import io
+import threading
+import tracemalloc
+
+import pytest
+
+from advent_of_code import day_12
+from advent_of_code import integers
+from advent_of_code.memory import (
+    SAMPLE_INTERVAL,
+    format_bytes,
+    get_peak_rss_bytes,
+    reset_peak_rss,
+    trace_call,
+    trace_day,
+)
+from advent_of_code.profiling import PHASES
+
+
+def test_trace_call():
+    tracemalloc.start()
+    try:
+        result, report = trace_call("build", integers.extract_integers, b"1 " * 100000)
+    finally:
+        tracemalloc.stop()
+
+    assert len(result) == 100000
+    assert report.peak_bytes >= report.retained_bytes > 100000 * 8
+    assert report.retained_blocks >= 1
+    assert report.top_sites[0].location.startswith(integers.__file__)
+
+
+def test_trace_call_finds_freed_peak():
+    def build_and_discard():
+        table = integers.extract_integers(b"1 " * 2000000)
+        threading.Event().wait(SAMPLE_INTERVAL * 4)
+        return len(table)
+
+    tracemalloc.start()
+    try:
+        result, report = trace_call("temporary", build_and_discard)
+    finally:
+        tracemalloc.stop()
+
+    assert result == 2000000
+    assert report.peak_bytes > 2000000 * 8
+    assert report.retained_bytes < 2000000 * 8
+    assert report.top_sites[0].size_bytes > 2000000 * 8
+
+
+def test_trace_day():
+    answers, reports = trace_day(day_12, io.StringIO(day_12.example_input_string))
+
+    assert answers == (
+        day_12.example_first_star_output,
+        day_12.example_second_star_output,
+    )
+    assert [report.phase for report in reports] == list(PHASES)
+    assert reports[0].retained_bytes > 0
+    # day_12 parses into a Grid2D, so either module can top the sites
+    top_location = reports[0].top_sites[0].location
+    assert "day_12.py" in top_location or "grid.py" in top_location
+    assert not tracemalloc.is_tracing()
+
+
+def test_format_bytes():
+    assert format_bytes(512) == "512 B"
+    assert format_bytes(1536) == "1.5 KiB"
+    assert format_bytes(3 * 1024 * 1024) == "3.0 MiB"
+
+
+def test_peak_rss_is_reset():
+    before = reset_peak_rss()
+    if before is None:
+        pytest.skip("the resident set peak can't be reset here")
+    allocation = bytearray(64 * 1024 * 1024)
+    allocation[::4096] = b"x" * len(allocation[::4096])
+    assert get_peak_rss_bytes() >= before + len(allocation) // 2
+    del allocation
+    reset_peak_rss()
+    assert get_peak_rss_bytes() < before + 32 * 1024 * 1024
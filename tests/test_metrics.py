@@ -0,0 +1,68 @@
+import json
+
+from advent_of_code import day_01
+from advent_of_code.metrics import format_records, get_run_context, get_star_records
+from advent_of_code.runner import DayResult, main
+
+
+def test_get_star_records():
+    result = DayResult(
+        "day_01",
+        (1, 2),
+        timings={"parse": 0.5, "first_star": 0.25, "second_star": 0.125},
+        peak_rss_bytes={"first_star": 1024},
+        input_bytes=10,
+        input_digest="digest",
+    )
+    first, second = get_star_records(result, {"host": "test"})
+    assert first == {
+        "host": "test",
+        "day": "day_01",
+        "star": "first_star",
+        "answer": 1,
+        "error": None,
+        "cached": False,
+        "parse_seconds": 0.5,
+        "solve_seconds": 0.25,
+        "peak_bytes": 1024,
+        "peak_bytes_source": "peak_rss",
+        "input_bytes": 10,
+        "input_digest": "digest",
+        "counters": None,
+    }
+    assert second["answer"] == 2
+    assert second["solve_seconds"] == 0.125
+    assert second["peak_bytes"] is second["peak_bytes_source"] is None
+
+
+def test_get_star_records_for_a_failed_day():
+    records = list(get_star_records(DayResult("day_01", error="ValueError()")))
+    assert [record["answer"] for record in records] == [None, None]
+    assert [record["error"] for record in records] == ["ValueError()"] * 2
+
+
+def test_format_records():
+    records = json.loads(format_records([{"answer": 1}, {"answer": "ABC"}]))
+    assert records == [{"answer": 1}, {"answer": "ABC"}]
+    assert set(get_run_context()) == {"timestamp", "host", "python"}
+
+
+def test_main_writes_ndjson(day_01_options, capsys):
+    input_directory = str(day_01_options.input_directory)
+    argv = ["day_01", "--input-directory", input_directory, "--no-cache"]
+    assert main([*argv, "--format", "ndjson"]) == 0
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record["answer"] for record in records] == [
+        day_01.example_first_star_output,
+        day_01.example_second_star_output,
+    ]
+    assert all(record["solve_seconds"] > 0 for record in records)
+    assert records[0]["input_bytes"] == len(day_01.example_input_string)
+    assert records[0]["input_digest"] is not None
+    assert [record["peak_bytes_source"] for record in records] == ["peak_rss"] * 2
+    assert all(record["peak_bytes"] >= 0 for record in records)
+
+    assert main([*argv, "--format", "json", "--memory"]) == 0
+    records = json.loads(capsys.readouterr().out)
+    assert [record["peak_bytes_source"] for record in records] == ["tracemalloc"] * 2
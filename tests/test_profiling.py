@@ -0,0 +1,27 @@
+import io
+import pstats
+
+from advent_of_code import day_01
+from advent_of_code.profiling import (
+    PHASES,
+    profile_day,
+)
+
+
+def test_profile_day(tmp_path):
+    answers, phase_seconds = profile_day(
+        day_01, "day_01", io.StringIO(day_01.example_input_string), tmp_path
+    )
+
+    assert answers == (
+        day_01.example_first_star_output,
+        day_01.example_second_star_output,
+    )
+    assert tuple(phase_seconds) == PHASES
+    for phase in PHASES:
+        stats = pstats.Stats(str(tmp_path / f"day_01.{phase}.pstats"))
+        assert stats.total_calls > 0
+
+    summary = (tmp_path / "day_01.txt").read_text()
+    assert "stream_of_calorie_totals" in summary
+    assert "top_calorie_counts" in summary
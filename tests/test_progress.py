@@ -0,0 +1,35 @@
+import io
+
+import pytest
+
+from advent_of_code import progress
+
+
+@pytest.fixture
+def output(monkeypatch):
+    output = io.StringIO()
+    now = [0.0]
+    monkeypatch.setattr(progress.time, "monotonic", lambda: now[0])
+    progress.enable(1.0, output)
+    yield output, now
+    progress.disable()
+
+
+def test_report_is_rate_limited(output):
+    output, now = output
+    for done in range(10):
+        now[0] = done * 0.3
+        progress.report("rows", done, 10)
+    assert output.getvalue().splitlines() == ["rows: 4/10 (40%)", "rows: 8/10 (80%)"]
+
+
+def test_report_without_total(output):
+    output, now = output
+    progress.report("grains", 1)
+    now[0] = 2.0
+    progress.report("grains", 2)
+    assert output.getvalue() == "grains: 2\n"
+
+
+def test_disabled_by_default():
+    assert not progress.enabled
@@ -0,0 +1,111 @@
+import bz2
+import gzip
+import io
+import lzma
+import mmap
+
+import pytest
+
+from advent_of_code.puzzle_input import (
+    get_mappable_fileno,
+    input_buffer,
+    input_chunks,
+    open_input,
+    stripped_input_byte_lines,
+    stripped_input_lines,
+)
+
+example_input_string = "1000\n 2000\r\n\n3000"
+example_byte_lines = [b"1000", b"2000", b"", b"3000"]
+
+
+def test_stripped_input_lines():
+    lines = stripped_input_lines(io.StringIO(example_input_string))
+    assert list(lines) == ["1000", "2000", "", "3000"]
+
+
+def test_stripped_input_byte_lines_text_fallback():
+    lines = stripped_input_byte_lines(io.StringIO(example_input_string))
+    assert list(lines) == example_byte_lines
+
+
+@pytest.mark.parametrize("trailing_newline", ("", "\n"))
+def test_stripped_input_byte_lines_memory_mapped(tmp_path, trailing_newline):
+    input_path = tmp_path / "input.txt"
+    input_path.write_bytes((example_input_string + trailing_newline).encode())
+
+    input_file = input_path.open()
+    assert get_mappable_fileno(input_file) is not None
+    assert list(stripped_input_byte_lines(input_file)) == example_byte_lines
+    assert input_file.closed
+
+
+def test_stripped_input_byte_lines_partially_read_file(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_bytes(example_input_string.encode())
+
+    input_file = input_path.open()
+    input_file.readline()
+    assert get_mappable_fileno(input_file) is None
+    assert list(stripped_input_byte_lines(input_file)) == example_byte_lines[1:]
+
+
+def test_stripped_input_byte_lines_empty_file(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_bytes(b"")
+
+    assert list(stripped_input_byte_lines(input_path.open())) == []
+
+
+def test_input_buffer(tmp_path):
+    with input_buffer(io.StringIO(example_input_string)) as buffer:
+        assert buffer == example_input_string.encode()
+
+    input_path = tmp_path / "input.txt"
+    input_path.write_bytes(example_input_string.encode())
+    with input_buffer(input_path.open()) as buffer:
+        assert isinstance(buffer, mmap.mmap)
+        assert buffer[:] == example_input_string.encode()
+
+
+def test_input_buffer_after_iteration(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_bytes(example_input_string.encode())
+
+    input_file = input_path.open()
+    next(input_file)
+    with input_buffer(input_file) as buffer:
+        assert buffer == b" 2000\n\n3000"
+
+
+@pytest.mark.parametrize(
+    "suffix, compress",
+    (
+        (".txt", bytes),
+        (".gz", gzip.compress),
+        (".bz2", bz2.compress),
+        (".xz", lzma.compress),
+    ),
+)
+def test_open_input(tmp_path, suffix, compress):
+    input_path = tmp_path / f"input{suffix}"
+    input_path.write_bytes(compress(example_input_string.encode()))
+    lines = stripped_input_lines(open_input(input_path))
+    assert list(lines) == ["1000", "2000", "", "3000"]
+
+
+def test_open_input_stdin(monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO(example_input_string))
+    assert list(stripped_input_lines(open_input("-"))) == ["1000", "2000", "", "3000"]
+
+
+def test_input_chunks_end_on_lines():
+    chunks = list(input_chunks(io.StringIO("12\n34\n56\n78"), size=4))
+    assert chunks == [b"12\n34\n", b"56\n78"]
+
+
+def test_input_chunks_memory_mapped(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_bytes(b"12\n34\n")
+    chunks = [bytes(chunk) for chunk in input_chunks(input_path.open())]
+    assert chunks == [b"12\n34\n"]
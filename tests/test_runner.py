@@ -0,0 +1,188 @@
+import dataclasses
+import gzip
+import io
+import pathlib
+import time
+
+import pytest
+
+from advent_of_code import day_01
+from advent_of_code.runner import (
+    RunOptions,
+    discover_days,
+    format_result,
+    get_input_path,
+    main,
+    run_day,
+    run_days,
+)
+
+
+def test_discover_days():
+    days = discover_days()
+    assert days[0] == "day_01"
+    assert "day_15" in days
+
+
+def test_run_day(day_01_options):
+
+    result = run_day("day_01", day_01_options)
+    assert result.error is None
+    assert not result.cached
+    assert tuple(result.timings) == ("parse", "first_star", "second_star")
+    assert result.input_bytes == len(day_01.example_input_string)
+    assert tuple(result.peak_rss_bytes) == ("first_star", "second_star")
+    assert result.answers == (
+        day_01.example_first_star_output,
+        day_01.example_second_star_output,
+    )
+
+
+def test_run_day_uses_cache(day_01_options):
+    first_result = run_day("day_01", day_01_options)
+    second_result = run_day("day_01", day_01_options)
+    assert second_result.cached
+    assert second_result.answers == first_result.answers
+
+    get_input_path("day_01", day_01_options.input_directory).write_text("1\n")
+    assert run_day("day_01", day_01_options).answers == (1, 1)
+
+
+def test_run_day_reuses_parsed_input(day_01_options, monkeypatch):
+    first_result = run_day("day_01", day_01_options)
+    assert list((day_01_options.cache_directory / "parsed").iterdir())
+
+    for path in (day_01_options.cache_directory / "answers").iterdir():
+        path.unlink()
+    monkeypatch.setattr(day_01, "parse", None)
+
+    second_result = run_day("day_01", day_01_options)
+    assert not second_result.cached
+    assert second_result.answers == first_result.answers
+
+
+def test_run_day_without_cache(day_01_options):
+    options = RunOptions(
+        day_01_options.input_directory,
+        use_cache=False,
+        cache_directory=day_01_options.cache_directory,
+    )
+    run_day("day_01", options)
+    result = run_day("day_01", options)
+    assert not result.cached
+    assert not options.cache_directory.exists()
+    # Nothing needs the digest, so the input isn't hashed
+    assert result.input_digest is None
+    assert result.input_bytes == len(day_01.example_input_string)
+
+    result = run_day("day_01", dataclasses.replace(options, digest_input=True))
+    assert len(result.input_digest) == 64
+
+
+def test_run_day_with_timeout(day_01_options, monkeypatch):
+    options = dataclasses.replace(day_01_options, timeout=10, use_cache=False)
+    assert run_day("day_01", options).answers == (
+        day_01.example_first_star_output,
+        day_01.example_second_star_output,
+    )
+
+    monkeypatch.setattr(day_01, "solve_second_star", lambda parsed: time.sleep(60))
+    for use_cache in (True, False):
+        options = dataclasses.replace(options, timeout=0.2, use_cache=use_cache)
+        result = run_day("day_01", options)
+        assert result.error.startswith("StarTimeout")
+        assert result.seconds < 10
+
+
+def test_run_day_with_engine(tmp_path):
+    from advent_of_code import day_12
+
+    get_input_path("day_12", tmp_path).write_text(day_12.example_input_string)
+    options = RunOptions(tmp_path, cache_directory=tmp_path / "cache")
+    for engine in ("reference", "fast"):
+        result = run_day("day_12", dataclasses.replace(options, engine=engine))
+        assert not result.cached
+        assert result.answers == (31, 29)
+
+    result = run_day("day_12", dataclasses.replace(options, engine="missing"))
+    assert "no 'missing' engine, only reference, fast" in result.error
+
+
+def test_run_day_with_counters(tmp_path):
+    from advent_of_code import day_12
+
+    get_input_path("day_12", tmp_path).write_text(day_12.example_input_string)
+    options = RunOptions(tmp_path, cache_directory=tmp_path / "cache")
+    run_day("day_12", options)
+
+    result = run_day("day_12", dataclasses.replace(options, count_operations=True))
+    assert not result.cached
+    assert set(result.counters) == {"parse", "first_star", "second_star"}
+    assert result.counters["first_star"]["nodes_popped"] > 0
+    assert "first_star counters: neighbors_relaxed" in format_result(result)
+    assert run_day("day_12", options).counters is None
+
+
+def test_run_day_with_profile(day_01_options, tmp_path):
+    options = RunOptions(
+        day_01_options.input_directory, profile_directory=tmp_path / "profile"
+    )
+    result = run_day("day_01", options)
+
+    assert not result.cached
+    assert tuple(result.phase_seconds) == ("parse", "first_star", "second_star")
+    assert (tmp_path / "profile" / "day_01.txt").exists()
+    assert "parse" in format_result(result)
+
+
+def test_run_day_with_memory(day_01_options):
+    options = RunOptions(day_01_options.input_directory, trace_memory=True)
+    result = run_day("day_01", options)
+
+    assert not result.cached
+    assert [report.phase for report in result.memory_reports] == [
+        "parse",
+        "first_star",
+        "second_star",
+    ]
+    assert "peak" in format_result(result)
+
+
+def test_run_day_reports_missing_input(tmp_path):
+    result = run_day("day_01", RunOptions(tmp_path, use_cache=False))
+    assert "FileNotFoundError" in result.error
+
+
+def test_run_days(day_01_options):
+    results = list(run_days(["day_01", "day_02"], day_01_options, jobs=2))
+    assert sorted(result.day for result in results) == ["day_01", "day_02"]
+
+
+def test_run_day_with_compressed_input(day_01_options, tmp_path):
+    input_path = tmp_path / "day_01.txt.gz"
+    input_path.write_bytes(gzip.compress(day_01.example_input_string.encode()))
+    options = dataclasses.replace(day_01_options, input_path=input_path)
+
+    assert run_day("day_01", options).answers == (
+        day_01.example_first_star_output,
+        day_01.example_second_star_output,
+    )
+    assert run_day("day_01", options).cached
+
+
+def test_run_day_with_stdin(day_01_options, monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO(day_01.example_input_string))
+    options = dataclasses.replace(day_01_options, input_path=pathlib.Path("-"))
+    result = run_day("day_01", options)
+
+    assert result.answers == (
+        day_01.example_first_star_output,
+        day_01.example_second_star_output,
+    )
+    assert not result.cached
+    assert not options.cache_directory.exists()
+
+
+def test_main_rejects_input_for_several_days():
+    with pytest.raises(SystemExit):
+        main(["day_01", "day_02", "--input", "-"])
@@ -0,0 +1,48 @@
+import os
+import subprocess
+import time
+
+import pytest
+
+from advent_of_code.timeouts import StarTimeout, call_with_timeout
+
+
+def is_running(pid):
+    try:
+        with open(f"/proc/{pid}/stat") as stat:
+            return stat.read().rpartition(")")[2].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+def test_call_with_timeout():
+    assert call_with_timeout(sum, ([1, 2, 3],), timeout=10) == 6
+
+
+def test_call_with_timeout_raises_errors():
+    with pytest.raises(ZeroDivisionError):
+        call_with_timeout(divmod, (1, 0), timeout=10)
+
+
+def test_call_with_timeout_kills_child_processes(tmp_path):
+    pid_path = tmp_path / "pid"
+
+    def start_worker_and_hang():
+        worker = subprocess.Popen(["sleep", "60"])
+        pid_path.write_text(str(worker.pid))
+        time.sleep(60)
+
+    start = time.perf_counter()
+    with pytest.raises(StarTimeout):
+        call_with_timeout(start_worker_and_hang, (), timeout=0.5)
+    assert time.perf_counter() - start < 10
+
+    deadline = time.monotonic() + 5
+    while is_running(pid := int(pid_path.read_text())):
+        assert time.monotonic() < deadline, f"worker {pid} outlived the timeout"
+        time.sleep(0.05)
+
+
+def test_call_with_timeout_reports_a_dead_child():
+    with pytest.raises(RuntimeError, match="exited with code 3"):
+        call_with_timeout(os._exit, (3,), timeout=10)
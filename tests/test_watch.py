@@ -0,0 +1,64 @@
+import io
+import time
+
+from advent_of_code import day_01, day_04, intervals
+from advent_of_code.runner import RunOptions, get_input_path
+from advent_of_code.watch import Watcher, get_module_path, get_signature, watch
+
+
+def test_get_signature(tmp_path):
+    path = tmp_path / "input.txt"
+    assert get_signature(path) is None
+    path.write_text("1\n")
+    assert get_signature(path)[1] == 2
+
+
+def test_watcher_maps_files_to_days(tmp_path):
+    watcher = Watcher(["day_01", "day_04"], RunOptions(tmp_path))
+    assert watcher.watched[str(get_input_path("day_04", tmp_path))] == {"day_04"}
+    assert watcher.watched[get_module_path(day_04.__name__)] == {"day_04"}
+    assert watcher.watched[get_module_path(intervals.__name__)] == {"day_04"}
+
+
+def test_watcher_is_idle_without_changes(day_01_options):
+    watcher = Watcher(["day_01"], day_01_options)
+    start = time.process_time()
+    for _ in range(100):
+        assert watcher.poll() == ([], [])
+    assert time.process_time() - start < 0.5
+
+
+def test_watcher_reruns_a_day_when_its_input_changes(day_01_options):
+    watcher = Watcher(["day_01"], day_01_options)
+    watcher.run(["day_01"])
+
+    get_input_path("day_01", day_01_options.input_directory).write_text("1\n")
+    days, errors = watcher.poll()
+    assert days == ["day_01"]
+    assert not errors
+    [result] = watcher.run(days)
+    assert result.answers == (1, 1)
+
+
+def test_watcher_reuses_parsed_input_when_code_changes(day_01_options, monkeypatch):
+    watcher = Watcher(["day_01"], day_01_options)
+    [first_result] = watcher.run(["day_01"])
+
+    watcher.signatures[get_module_path(day_01.__name__)] = None
+    days, errors = watcher.poll()
+    assert days == ["day_01"]
+    assert not errors
+
+    for path in (day_01_options.cache_directory / "answers").iterdir():
+        path.unlink()
+    monkeypatch.setattr(day_01, "parse", None)
+    [result] = watcher.run(days)
+    assert result.error is None
+    assert result.answers == first_result.answers
+
+
+def test_watch(day_01_options):
+    output = io.StringIO()
+    assert watch(["day_01"], day_01_options, 0.01, output, max_polls=2) == 0
+    assert f"answer: {day_01.example_first_star_output}" in output.getvalue()
+    assert "Watching" in output.getvalue()